@@ -0,0 +1,749 @@
+from dataclasses import dataclass
+import math
+import numpy as np
+
+import geotech_module.utils as utils
+from geotech_module.solver import NewtonRaphson11
+
+
+DIRECTIONS = ("bottom_to_top", "top_to_bottom")
+ENGINES = ("slices", "ode")
+
+# Coefficients du schéma de Runge-Kutta emboîté de Dormand-Prince 5(4)
+DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+# Ecart entre les solutions d'ordre 5 et d'ordre 4 (estimation de l'erreur locale)
+DP_E = (71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40)
+
+
+@dataclass
+class AxialMesh:
+    """
+    Maillage axial du pieu sous forme de tableaux, une valeur par tranche (ordre haut -> bas).
+    C'est l'unique maillage utilisé par les calculs d'équilibre (bottom-up et top-down).
+        - z_top:        Niveau supérieur de la tranche
+        - delta_h:      Hauteur de la tranche
+        - perimetre:    Périmètre du pieu (frottement)
+        - EA:           Rigidité axiale du pieu
+        - qs_lim:       Frottement axial unitaire limite
+        - kt:           Module kt de la loi de mobilisation du frottement axial
+        - layer:        Indice de la couche de sol associée à la tranche
+    """
+    z_top: np.ndarray
+    delta_h: np.ndarray
+    perimetre: np.ndarray
+    EA: np.ndarray
+    qs_lim: np.ndarray
+    kt: np.ndarray
+    layer: np.ndarray
+
+    @classmethod
+    def from_slices(cls, slices: list) -> "AxialMesh":
+        """
+        Construit le maillage à partir de la liste des tranches de pieu (SlicePile).
+        Une couche du maillage regroupe des tranches consécutives de même sol et de même section.
+        Les paramètres de sol ne sont évalués qu'une fois par couche.
+        """
+        soil_params = {}
+        layer_acc = []
+        z_acc, dh_acc, p_acc, ea_acc, qs_acc, kt_acc = [], [], [], [], [], []
+        layer = -1
+        previous = (None, None)
+        for sl in slices:
+            if sl.soil is not previous[0] or sl.data_pieu is not previous[1]:
+                layer += 1
+                previous = (sl.soil, sl.data_pieu)
+            key = id(sl.soil)
+            if key not in soil_params:
+                soil_params[key] = (sl.qs_lim, sl.module_kt)
+            qs_lim, kt = soil_params[key]
+            z_acc.append(sl.z_top)
+            dh_acc.append(sl.delta_h)
+            p_acc.append(sl.perimetre)
+            ea_acc.append(sl.Eb * sl.section_pointe)
+            qs_acc.append(qs_lim)
+            kt_acc.append(kt)
+            layer_acc.append(layer)
+        return cls(
+            z_top=np.array(z_acc, dtype=float),
+            delta_h=np.array(dh_acc, dtype=float),
+            perimetre=np.array(p_acc, dtype=float),
+            EA=np.array(ea_acc, dtype=float),
+            qs_lim=np.array(qs_acc, dtype=float),
+            kt=np.array(kt_acc, dtype=float),
+            layer=np.array(layer_acc, dtype=int),
+        )
+
+    @property
+    def n_slices(self) -> int:
+        return len(self.delta_h)
+
+    @property
+    def z_bottom(self) -> np.ndarray:
+        return self.z_top - self.delta_h
+
+    @property
+    def z_middle(self) -> np.ndarray:
+        return self.z_top - self.delta_h / 2
+
+    @property
+    def resistance_skin_friction(self) -> float:
+        """
+        Rs, somme des contributions des tranches : perimetre * qs_lim * delta_h
+        """
+        return float(np.sum(self.perimetre * self.qs_lim * self.delta_h))
+
+    def layer_table(self) -> list[tuple[float, float, float, float, float, float]]:
+        """
+        Une ligne par couche (ordre haut -> bas) : (z_top, z_bottom, perimetre, EA, qs_lim, kt)
+        """
+        starts = np.flatnonzero(np.r_[True, self.layer[1:] != self.layer[:-1]])
+        ends = np.r_[starts[1:], self.n_slices] - 1
+        table = []
+        for i, j in zip(starts.tolist(), ends.tolist()):
+            table.append((
+                float(self.z_top[i]), float(self.z_top[j] - self.delta_h[j]),
+                float(self.perimetre[i]), float(self.EA[i]), float(self.qs_lim[i]), float(self.kt[i]),
+            ))
+        return table
+
+    def rows(self, reverse: bool=False) -> list[tuple[float, float, float, float, float]]:
+        """
+        Paramètres de chaque tranche en flottants Python (accès scalaire plus rapide dans les boucles de propagation) :
+        (delta_h, perimetre, EA, qs_lim, kt), ordre haut -> bas ou bas -> haut (reverse).
+        """
+        columns = (self.delta_h, self.perimetre, self.EA, self.qs_lim, self.kt)
+        if reverse:
+            columns = tuple(column[::-1] for column in columns)
+        return list(zip(*(column.tolist() for column in columns)))
+
+
+@dataclass
+class AxialState:
+    """
+    Etat (efforts et déplacements) de chacune des tranches après propagation (ordre haut -> bas).
+    """
+    Q_top: np.ndarray
+    dz_top: np.ndarray
+    Q_bott: np.ndarray
+    dz_bott: np.ndarray
+    dz_middle: np.ndarray
+    qs: np.ndarray
+
+
+@dataclass
+class TipLaw:
+    """
+    Loi de mobilisation de l'effort de pointe : Qp(w) = section * end_bearing_law(w, qb, kq)
+    Contact unilatéral : la pointe ne reprend aucun effort pour un déplacement négatif.
+    """
+    section: float
+    qb: float
+    kq: float
+
+    def reaction(self, w: float) -> float:
+        if w <= 0.0:
+            return 0.0
+        return self.section * utils.end_bearing_law(w, self.qb, self.kq)
+
+
+def solve_mid_displacement(rhs: float, kappa: float, qs: float, kt: float) -> tuple[float, float]:
+    """
+    Résout w - kappa * tau(w) = rhs, où tau est la loi de Frank & Zhao (skin_friction_law).
+    La loi étant linéaire par morceaux, la racine est obtenue branche par branche, sans itération.
+    Retourne (w, tau(w)).
+    """
+    if qs <= 0.0:
+        return rhs, 0.0
+    sign = 1.0 if rhs >= 0.0 else -1.0
+    r = abs(rhs)
+    s1 = qs / (2 * kt)
+    s2 = 3 * qs / kt
+
+    denom_1 = 1 - kappa * kt
+    denom_2 = 1 - kappa * kt / 5
+    if denom_1 <= 0.0 or denom_2 <= 0.0:
+        # Tranche trop épaisse : l'équation n'est plus monotone, on revient au Newton-Raphson
+        def F(w):
+            return rhs + kappa * utils.skin_friction_law(w, qs, kt) - w
+        w = NewtonRaphson11(F, [0.0], [rhs]).final_roots
+        return w, utils.skin_friction_law(w, qs, kt)
+
+    w = r / denom_1
+    if w <= s1:
+        return sign * w, sign * kt * w
+    w = (r + kappa * 0.4 * qs) / denom_2
+    if w <= s2:
+        return sign * w, sign * (0.4 * qs + w * kt / 5)
+    return sign * (r + kappa * qs), sign * qs
+
+
+def slice_kernel(
+        direction: str,
+        Q_in: float, w_in: float,
+        delta_h: float, perimetre: float, EA: float, qs_lim: float, kt: float,
+) -> tuple[float, float, float, float]:
+    """
+    Equilibre d'une tranche de pieu suivant le schéma du point milieu.
+    direction:
+      - "bottom_to_top": entrée (Q_bott, w_bott) -> sortie (Q_top, w_top)
+      - "top_to_bottom": entrée (Q_top, w_top) -> sortie (Q_bott, w_bott)
+    Retourne (Q_out, w_out, w_middle, qs_middle)
+    """
+    if direction == "bottom_to_top":
+        sens = 1.0
+    elif direction == "top_to_bottom":
+        sens = -1.0
+    else:
+        raise ValueError("direction must be 'bottom_to_top' or 'top_to_bottom'")
+
+    half = 0.5 * perimetre * delta_h
+    c = delta_h / (2 * EA)
+    w_mid, tau_mid = solve_mid_displacement(w_in + sens * c * Q_in, c * half, qs_lim, kt)
+    Q_mid = Q_in + sens * half * tau_mid
+    return Q_mid + sens * half * tau_mid, w_in + sens * 2 * c * Q_mid, w_mid, tau_mid
+
+
+def propagate(
+        mesh: AxialMesh,
+        direction: str,
+        Q_in: float, w_in: float,
+        with_state: bool=False,
+):
+    """
+    Propage (Q, w) sur toute la hauteur du pieu.
+    direction:
+      - "bottom_to_top": entrée en pointe -> sortie en tête
+      - "top_to_bottom": entrée en tête -> sortie en pointe
+    Retourne (Q_out, w_out), ou (Q_out, w_out, AxialState) si with_state est vrai.
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError("direction must be 'bottom_to_top' or 'top_to_bottom'")
+    sens = 1.0 if direction == "bottom_to_top" else -1.0
+    rows = mesh.rows(reverse=sens > 0)
+
+    Q, w = Q_in, w_in
+    if not with_state:
+        for dh, P, EA, qs, kt in rows:
+            half = 0.5 * P * dh
+            c = dh / (2 * EA)
+            _, tau = solve_mid_displacement(w + sens * c * Q, c * half, qs, kt)
+            Q_mid = Q + sens * half * tau
+            Q, w = Q_mid + sens * half * tau, w + sens * 2 * c * Q_mid
+        return Q, w
+
+    n = mesh.n_slices
+    Q_io = np.empty(n + 1)
+    w_io = np.empty(n + 1)
+    w_mid = np.empty(n)
+    tau_mid = np.empty(n)
+    Q_io[0], w_io[0] = Q, w
+    for i, (dh, P, EA, qs, kt) in enumerate(rows):
+        half = 0.5 * P * dh
+        c = dh / (2 * EA)
+        w_mid[i], tau = solve_mid_displacement(w + sens * c * Q, c * half, qs, kt)
+        tau_mid[i] = tau
+        Q_mid = Q + sens * half * tau
+        Q, w = Q_mid + sens * half * tau, w + sens * 2 * c * Q_mid
+        Q_io[i + 1], w_io[i + 1] = Q, w
+
+    if sens < 0:
+        state = AxialState(Q_io[:-1], w_io[:-1], Q_io[1:], w_io[1:], w_mid, tau_mid)
+    else:
+        state = AxialState(
+            Q_io[:0:-1].copy(), w_io[:0:-1].copy(), Q_io[-2::-1].copy(), w_io[-2::-1].copy(),
+            w_mid[::-1].copy(), tau_mid[::-1].copy(),
+        )
+    return Q, w, state
+
+
+@dataclass
+class ElasticTransfer:
+    """
+    Condensation du pieu en matrices de transfert 2x2 sur (Q, w), propagation haut -> bas.
+    Valable tant que toutes les tranches restent sur la première branche linéaire de la loi de
+    frottement (|w| <= s1) et que la pointe reste sur la première branche de sa loi de mobilisation.
+        - layer_matrices:   (Q, w) en base de couche = layer_matrices[k] @ (Q, w) en tête de couche
+        - matrix:           (Q_base, w_base) = matrix @ (Q_head, w_head)
+        - prefix:           (Q, w) en tête de la tranche i = prefix[i] @ (Q_head, w_head)
+        - mid_rows:         w_middle de la tranche i = mid_rows[i] @ (Q_head, w_head)
+    """
+    layer_matrices: list[np.ndarray]
+    matrix: np.ndarray
+    prefix: np.ndarray
+    mid_rows: np.ndarray
+    kt: np.ndarray
+    s1: np.ndarray
+    valid: bool=True
+
+    @classmethod
+    def from_mesh(cls, mesh: AxialMesh) -> "ElasticTransfer":
+        """
+        Matrices de transfert des tranches (forme linéaire exacte du schéma du point milieu),
+        composées couche par couche puis sur la hauteur du pieu.
+        """
+        kt = np.where(mesh.qs_lim > 0.0, mesh.kt, 0.0)
+        half = 0.5 * mesh.perimetre * mesh.delta_h
+        c = mesh.delta_h / (2 * mesh.EA)
+        denom = 1 - c * half * kt
+        valid = bool(np.all(denom > 0.0))
+        d = 1 / np.where(denom > 0.0, denom, 1.0)
+
+        # Matrices des tranches : (Q_bott, w_bott) = S @ (Q_top, w_top) ; w_middle = m @ (Q_top, w_top)
+        S = np.empty((mesh.n_slices, 2, 2))
+        S[:, 0, 0] = 1 + 2 * half * kt * d * c
+        S[:, 0, 1] = -2 * half * kt * d
+        S[:, 1, 0] = -2 * c * (1 + half * kt * d * c)
+        S[:, 1, 1] = 1 + 2 * c * half * kt * d
+        m = np.stack([-d * c, d], axis=1)
+
+        prefix = np.empty((mesh.n_slices + 1, 2, 2))
+        prefix[0] = np.eye(2)
+        layer_matrices = []
+        layer_matrix = np.eye(2)
+        for i in range(mesh.n_slices):
+            prefix[i + 1] = S[i] @ prefix[i]
+            layer_matrix = S[i] @ layer_matrix
+            if i == mesh.n_slices - 1 or mesh.layer[i + 1] != mesh.layer[i]:
+                layer_matrices.append(layer_matrix)
+                layer_matrix = np.eye(2)
+
+        matrix = np.eye(2)
+        for layer_matrix in layer_matrices:
+            matrix = layer_matrix @ matrix
+
+        mid_rows = np.einsum("ij,ijk->ik", m, prefix[:-1])
+        with np.errstate(divide="ignore"):
+            s1 = np.where(kt > 0.0, mesh.qs_lim / (2 * np.where(kt > 0.0, kt, 1.0)), np.inf)
+        return cls(layer_matrices, matrix, prefix, mid_rows, kt, s1, valid)
+
+    def solve(self, tip: TipLaw, Q_head: float) -> tuple[float, float, float, AxialState] | None:
+        """
+        Equilibre en régime élastique pour la charge en tête Q_head.
+        Renvoie None dès qu'une tranche ou la pointe sort de la première branche de sa loi.
+        """
+        if not self.valid:
+            return None
+        T = self.matrix
+        if Q_head < 0.0:
+            # Traction : pointe inactive, Q_base = 0
+            denom = T[0, 1]
+            w_head = -T[0, 0] / denom * Q_head if denom != 0.0 else None
+        else:
+            Kp = tip.section * tip.kq
+            denom = T[0, 1] - Kp * T[1, 1]
+            w_head = -(T[0, 0] - Kp * T[1, 0]) / denom * Q_head if denom != 0.0 else None
+        if w_head is None:
+            return None
+
+        x = np.array([Q_head, w_head])
+        Q_base, w_base = T @ x
+        if Q_head > 0.0 and not (0.0 < w_base <= tip.qb / (2 * tip.kq)):
+            return None
+        w_mid = self.mid_rows @ x
+        if np.any(np.abs(w_mid) > self.s1):
+            return None
+
+        top = self.prefix[:-1] @ x
+        bott = self.prefix[1:] @ x
+        state = AxialState(top[:, 0], top[:, 1], bott[:, 0], bott[:, 1], w_mid, self.kt * w_mid)
+        return w_head, float(Q_base), float(w_base), state
+
+
+@dataclass
+class AdaptiveMeshReport:
+    """
+    Bilan du maillage adaptatif :
+        - n_slices:     Nombre final de tranches
+        - w_head:       Déplacement en tête obtenu sur le maillage final
+        - converged:    Vrai si la tolérance sur le déplacement en tête est respectée
+        - history:      [(n_slices, w_head)] à chaque itération de raffinement
+    """
+    n_slices: int
+    w_head: float
+    converged: bool
+    history: list[tuple[int, float]]
+
+    def __str__(self) -> str:
+        result = f"Maillage adaptatif : {self.n_slices} tranches après {len(self.history)} itérations"
+        result += f" (w_tete = {1000 * self.w_head:.3f} mm"
+        result += ", convergé)" if self.converged else ", non convergé)"
+        return result
+
+
+def richardson_extrapolation(h: list[float], f: list[float], order: float=2.0) -> tuple[float, float]:
+    """
+    Extrapolation de Richardson à maille nulle à partir des trois mailles les plus fines
+    (h décroissant). L'ordre observé est utilisé lorsque le rapport des mailles est constant et la
+    convergence monotone, sinon l'ordre théorique du schéma (order).
+    Retourne (valeur extrapolée, ordre retenu).
+    """
+    if len(h) < 2:
+        return f[-1], order
+    if len(h) >= 3:
+        h1, h2, h3 = h[-3:]
+        f1, f2, f3 = f[-3:]
+        r = h1 / h2
+        d12, d23 = f1 - f2, f2 - f3
+        if math.isclose(r, h2 / h3, rel_tol=1e-6) and d12 * d23 > 0.0 and abs(d12) > abs(d23):
+            order = math.log(d12 / d23) / math.log(r)
+    r = h[-2] / h[-1]
+    return f[-1] + (f[-1] - f[-2]) / (r ** order - 1), order
+
+
+@dataclass
+class ConvergenceStudy:
+    """
+    Etude de convergence du maillage axial :
+        - thicknesses:          Epaisseurs de maille étudiées (décroissantes)
+        - n_slices:             Nombre de tranches correspondant
+        - w_head / Q_tip:       Tassement en tête et effort de pointe pour chaque maille
+        - w_head_extrapolated:  Tassement en tête extrapolé à maille nulle
+        - Q_tip_extrapolated:   Effort de pointe extrapolé à maille nulle
+        - order:                Ordre de convergence retenu pour l'extrapolation
+        - recommended:          Epaisseur la plus grossière respectant la tolérance (None sinon)
+    """
+    thicknesses: list[float]
+    n_slices: list[int]
+    w_head: list[float]
+    Q_tip: list[float]
+    w_head_extrapolated: float
+    Q_tip_extrapolated: float
+    order: float
+    tol: float
+    recommended: float|None
+
+    @classmethod
+    def from_results(
+            cls, thicknesses: list[float], n_slices: list[int], w_head: list[float], Q_tip: list[float],
+            tol: float, Q_ref: float=1.0,
+    ) -> "ConvergenceStudy":
+        w_0, order = richardson_extrapolation(thicknesses, w_head)
+        Q_0, _ = richardson_extrapolation(thicknesses, Q_tip, order)
+        recommended = None
+        for thickness, w, Q in zip(thicknesses, w_head, Q_tip):
+            if abs(w - w_0) <= tol * abs(w_0) and abs(Q - Q_0) <= tol * max(abs(Q_0), 1e-3 * Q_ref):
+                recommended = thickness
+                break
+        return cls(thicknesses, n_slices, w_head, Q_tip, w_0, Q_0, order, tol, recommended)
+
+    @property
+    def w_head_errors(self) -> list[float]:
+        """
+        Ecarts relatifs du tassement en tête par rapport à la valeur extrapolée.
+        """
+        if self.w_head_extrapolated == 0.0:
+            return [0.0 for _ in self.w_head]
+        return [abs(w - self.w_head_extrapolated) / abs(self.w_head_extrapolated) for w in self.w_head]
+
+    def to_records(self) -> list[dict]:
+        """
+        Tableau de convergence (une ligne par maille), en mm et kN.
+        """
+        records = []
+        for thickness, n, w, Q, err in zip(self.thicknesses, self.n_slices, self.w_head, self.Q_tip, self.w_head_errors):
+            records.append({
+                "maille [mm]": 1000 * thickness,
+                "tranches": n,
+                "dz_tete [mm]": 1000 * w,
+                "Q_pointe [kN]": 1000 * Q,
+                "écart [%]": 100 * err,
+            })
+        return records
+
+
+def local_errors(mesh: AxialMesh, state: AxialState, length: float) -> np.ndarray:
+    """
+    Estimation de l'erreur de discrétisation de chaque tranche, par comparaison de la propagation
+    sur une tranche avec la propagation sur deux demi-tranches (entrée : état en tête de tranche).
+    Le schéma étant d'ordre 2, l'erreur locale de la tranche vaut environ 4/3 de cet écart.
+    L'erreur sur l'effort est convertie en déplacement par la souplesse du pieu (length / EA).
+    """
+    errors = np.empty(mesh.n_slices)
+    for i, (dh, P, EA, qs, kt) in enumerate(mesh.rows()):
+        Q, w = state.Q_top[i], state.dz_top[i]
+        Q_half, w_half, _, _ = slice_kernel("top_to_bottom", Q, w, dh / 2, P, EA, qs, kt)
+        Q_two, w_two, _, _ = slice_kernel("top_to_bottom", Q_half, w_half, dh / 2, P, EA, qs, kt)
+        errors[i] = abs(w_two - state.dz_bott[i]) + abs(Q_two - state.Q_bott[i]) * length / EA
+    return 4 / 3 * errors
+
+
+def _tau(w: float, qs: float, kt: float, s1: float, s2: float) -> float:
+    """
+    Loi de frottement de Frank & Zhao (identique à utils.skin_friction_law), seuils s1 et s2 précalculés.
+    """
+    a = abs(w)
+    if a <= s1:
+        t = kt * a
+    elif a <= s2:
+        t = 0.4 * qs + a * kt / 5
+    else:
+        t = qs
+    return t if w >= 0.0 else -t
+
+
+def _branch(w: float, s1: float, s2: float) -> int:
+    a = abs(w)
+    return 0 if a <= s1 else (1 if a <= s2 else 2)
+
+
+def integrate_layer(
+        Q: float, w: float, length: float,
+        perimetre: float, EA: float, qs_lim: float, kt: float,
+        rtol: float=1e-6,
+        atol: tuple[float, float]=(1e-9, 1e-9),
+        h: float|None=None,
+        stations: list[float]=(),
+) -> tuple[float, float, int, float, list[tuple[float, float, float]]]:
+    """
+    Intégration de haut en bas, sur une couche homogène de hauteur length, du système
+        dQ/ds = -perimetre * tau(w)     dw/ds = -Q / EA
+    par un schéma de Runge-Kutta emboîté à pas adaptatif (Dormand-Prince 5(4)).
+    Le pas est ajusté pour atteindre exactement les points de rupture de pente de la loi t-z
+    (|w| = s1, |w| = s2) ainsi que les stations demandées (profondeurs relatives à la couche).
+    Retourne (Q, w, nombre d'évaluations, dernier pas, [(s, Q, w)] aux stations).
+    """
+    if qs_lim > 0.0:
+        s1, s2 = qs_lim / (2 * kt), 3 * qs_lim / kt
+    else:
+        kt, s1, s2 = 0.0, math.inf, math.inf
+    atol_Q, atol_w = atol
+
+    def f(Q, w):
+        return -perimetre * _tau(w, qs_lim, kt, s1, s2), -Q / EA
+
+    stops = sorted(x for x in stations if 0.0 < x < length) + [length]
+    h_min = 1e-10 * length
+    if h is None:
+        h = length
+    outputs = []
+    s = 0.0
+    kQ1, kw1 = f(Q, w)
+    n_eval = 1
+    limited = False
+
+    for stop in stops:
+        while stop - s > h_min:
+            h = min(h, stop - s)
+            kQ, kw = [kQ1], [kw1]
+            for row in DP_A[1:]:
+                Q_i = Q + h * sum(a * k for a, k in zip(row, kQ))
+                w_i = w + h * sum(a * k for a, k in zip(row, kw))
+                fQ, fw = f(Q_i, w_i)
+                kQ.append(fQ)
+                kw.append(fw)
+            n_eval += 6
+            err_Q = h * sum(e * k for e, k in zip(DP_E, kQ))
+            err_w = h * sum(e * k for e, k in zip(DP_E, kw))
+            err = max(
+                abs(err_Q) / (atol_Q + rtol * max(abs(Q), abs(Q_i))),
+                abs(err_w) / (atol_w + rtol * max(abs(w), abs(w_i))),
+            )
+
+            if err > 1.0:
+                h *= max(0.2, 0.9 * err ** -0.2)
+                continue
+
+            b0, b1 = _branch(w, s1, s2), _branch(w_i, s1, s2)
+            if b0 != b1 and not limited and h > h_min:
+                # Le pas franchit une rupture de pente de la loi t-z : on le raccourcit pour l'atteindre
+                bound = (s1, s2)[b0] if b1 > b0 else (s1, s2)[b0 - 1]
+                frac = (bound - abs(w)) / (abs(w_i) - abs(w)) if abs(w_i) != abs(w) else 1.0
+                if 0.0 < frac < 1.0:
+                    h *= frac * (1 + 1e-8)
+                    limited = True
+                    continue
+
+            s += h
+            Q, w = Q_i, w_i
+            kQ1, kw1 = kQ[-1], kw[-1]
+            limited = False
+            h *= 5.0 if err == 0.0 else min(5.0, max(0.2, 0.9 * err ** -0.2))
+        outputs.append((stop, Q, w))
+
+    return Q, w, n_eval, h, outputs
+
+
+def integrate_top_down(
+        mesh: AxialMesh,
+        Q_head: float, w_head: float,
+        rtol: float=1e-6,
+        stations: list[float]=(),
+) -> tuple[float, float, int, list[tuple[float, float, float]]]:
+    """
+    Propagation de (Q, w) de la tête vers la pointe par intégration adaptative, couche par couche
+    (le pas est toujours arrêté aux interfaces de couches).
+    Les stations sont des profondeurs comptées depuis la tête du pieu.
+    Retourne (Q_base, w_base, nombre d'évaluations, [(profondeur, Q, w)] aux stations et interfaces).
+    """
+    atol = (rtol * max(abs(Q_head), 1e-3), rtol * 1e-3)
+    z_head = float(mesh.z_top[0])
+    Q, w = Q_head, w_head
+    n_eval = 0
+    h = None
+    outputs = [(0.0, Q, w)]
+    for z_top, z_bottom, P, EA, qs, kt in mesh.layer_table():
+        depth = z_head - z_top
+        length = z_top - z_bottom
+        local = [x - depth for x in stations if depth < x < depth + length]
+        Q, w, n, h, layer_outputs = integrate_layer(Q, w, length, P, EA, qs, kt, rtol, atol, h, local)
+        n_eval += n
+        outputs += [(depth + x, Q_x, w_x) for x, Q_x, w_x in layer_outputs]
+    return Q, w, n_eval, outputs
+
+
+def _ode_state(mesh: AxialMesh, Q_head: float, w_head: float, rtol: float) -> tuple[float, float, AxialState]:
+    """
+    Etat des tranches du maillage obtenu par intégration adaptative (stations en tête, milieu et base).
+    """
+    z_head = float(mesh.z_top[0])
+    d_top = z_head - mesh.z_top
+    d_mid = z_head - mesh.z_middle
+    d_bott = z_head - mesh.z_bottom
+    stations = np.unique(np.r_[d_top, d_mid, d_bott]).tolist()
+    Q_base, w_base, _, outputs = integrate_top_down(mesh, Q_head, w_head, rtol, stations)
+    depth, Q, w = (np.array(x) for x in zip(*outputs))
+
+    w_mid = np.interp(d_mid, depth, w)
+    a = np.abs(w_mid)
+    kt = np.where(mesh.qs_lim > 0.0, mesh.kt, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s1 = mesh.qs_lim / (2 * kt)
+        s2 = 3 * mesh.qs_lim / kt
+    tau = np.where(a <= s1, kt * a, np.where(a <= s2, 0.4 * mesh.qs_lim + a * kt / 5, mesh.qs_lim))
+    tau = np.where(mesh.qs_lim > 0.0, np.sign(w_mid) * tau, 0.0)
+    state = AxialState(
+        np.interp(d_top, depth, Q), np.interp(d_top, depth, w),
+        np.interp(d_bott, depth, Q), np.interp(d_bott, depth, w),
+        w_mid, tau,
+    )
+    return Q_base, w_base, state
+
+
+def equilibre_bottom_up(mesh: AxialMesh, tip: TipLaw, dz_pointe: float) -> tuple[float, float, AxialState]:
+    """
+    Equilibre du pieu pour un déplacement vertical donné de la pointe.
+    Retourne (Q_tete, dz_tete, AxialState)
+    """
+    Q_pointe = tip.reaction(dz_pointe)
+    return propagate(mesh, "bottom_to_top", Q_pointe, dz_pointe, with_state=True)
+
+
+def equilibre_top_down(
+        mesh: AxialMesh,
+        tip: TipLaw,
+        Q_head: float,
+        *,
+        w_head_guess: float = 0.0,
+        w_head_max: float = 0.20,
+        n_bracket: int = 40,
+        n_bisect: int = 70,
+        tol_Q: float | None = None,
+        transfer: ElasticTransfer | None = None,
+        engine: str = "slices",
+        rtol: float = 1e-6,
+) -> tuple[float, float, float, AxialState]:
+    """
+    Équilibre top-down piloté par la charge en tête Q_head (compression positive).
+    Le déplacement en tête est recherché par balayage puis bissection, de sorte que l'effort
+    en pointe issu de la propagation soit égal à la réaction de la pointe.
+    En traction, la pointe est inactive : tout l'effort est repris par le fût.
+    Si des matrices de transfert sont fournies, la solution élastique est tentée en premier ;
+    la propagation non linéaire n'est lancée que si une tranche (ou la pointe) plastifie.
+    engine:
+      - "slices": propagation tranche par tranche (schéma du point milieu)
+      - "ode": intégration adaptative de Runge-Kutta, précision pilotée par rtol ; l'état des
+        tranches du maillage n'est évalué qu'une fois, pour la solution finale
+
+    Retour : (w_head, Q_base, w_base, AxialState)
+    """
+    if transfer is not None:
+        elastic = transfer.solve(tip, Q_head)
+        if elastic is not None:
+            return elastic
+
+    if engine not in ENGINES:
+        raise ValueError("engine must be 'slices' or 'ode'")
+
+    if tol_Q is None:
+        tol_Q = 1e-5 * max(1.0, abs(Q_head))
+
+    traction = (Q_head < 0.0)
+
+    def shoot(w_head: float) -> tuple[float, float]:
+        if engine == "ode":
+            return integrate_top_down(mesh, Q_head, w_head, rtol)[:2]
+        return propagate(mesh, "top_to_bottom", Q_head, w_head)
+
+    def residu(w_head: float) -> float:
+        Qb, wb = shoot(w_head)
+        if traction or wb <= 0.0:
+            return Qb
+        return Qb - tip.reaction(wb)
+
+    def solution(w_head: float):
+        if engine == "ode":
+            Qb, wb, state = _ode_state(mesh, Q_head, w_head, rtol)
+        else:
+            Qb, wb, state = propagate(mesh, "top_to_bottom", Q_head, w_head, with_state=True)
+        return w_head, Qb, wb, state
+
+    # --- INTERVALLE SELON LE SIGNE DE Q_head ---
+    if traction:
+        w_lo, w_hi = -abs(w_head_max), 0.0
+    else:
+        w_lo, w_hi = 0.0, abs(w_head_max)
+
+    a = min(max(w_head_guess, w_lo), w_hi)
+    ra = residu(a)
+    if abs(ra) <= tol_Q:
+        return solution(a)
+
+    # --- BRACKETING : balayage de w_lo -> w_hi ---
+    best_w, best_r = a, abs(ra)
+    b = None
+    rb = None
+    prev_w, prev_r = a, ra
+
+    for i in range(1, n_bracket + 1):
+        wi = w_lo + (w_hi - w_lo) * i / n_bracket
+        ri = residu(wi)
+
+        if abs(ri) < best_r:
+            best_w, best_r = wi, abs(ri)
+
+        if prev_r * ri < 0.0:
+            a, ra = prev_w, prev_r
+            b, rb = wi, ri
+            break
+
+        prev_w, prev_r = wi, ri
+
+    if b is None:
+        # Pas de bracket : on renvoie le meilleur point (résidu minimal)
+        return solution(best_w)
+
+    # --- BISECTION ---
+    lo, hi = a, b
+    rlo = ra
+
+    for _ in range(n_bisect):
+        mid = 0.5 * (lo + hi)
+        rm = residu(mid)
+
+        if abs(rm) <= tol_Q:
+            return solution(mid)
+
+        if rlo * rm < 0.0:
+            hi = mid
+        else:
+            lo, rlo = mid, rm
+
+    return solution(0.5 * (lo + hi))
@@ -0,0 +1,332 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import numpy as np
+
+import geotech_module.axial as axial
+import geotech_module.loads as loads
+import geotech_module.storage as storage
+import geotech_module.utils as utils
+from geotech_module.pieu import PileResistances, Torseur, hauteur_encastrement_effective, pression_limite_equivalente
+from geotech_module.soil import Soil
+
+
+@dataclass
+class PileSpec:
+    """
+    Ligne du carnet de pieux d'un site :
+        - id:           Repère du pieu
+        - borehole:     Sondage de référence (clé de la lithologie)
+        - level_top:    Niveau supérieur du pieu
+        - level_bott:   Niveau inférieur du pieu
+        - Dp:           Diamètre équivalent du pieu pour l'effort de pointe (surface)
+        - Ds:           Diamètre équivalent du pieu pour le frottement (périmètre)
+        - category:     Catégorie du pieu au sens du tableau A1 de la NF P94-262
+        - loads:        Torseurs appliqués en tête du pieu
+        - Eb:           Module de Young du pieu
+        - thickness:    Epaisseur des mailles pour le calcul du tassement
+    """
+    id: str
+    borehole: str
+    level_top: float
+    level_bott: float
+    Dp: float
+    Ds: float
+    category: int
+    loads: list[Torseur] = field(default_factory=list)
+    Eb: float=10_000
+    thickness: float=0.20
+
+
+@dataclass
+class PileCapacity(PileResistances):
+    """
+    Résistances d'un pieu du carnet, calculées par PileResistances comme pour Pile (articles F.4 et F.5
+    de la NF P94-262) : l'objet peut être passé à loads.check_capacities à la place d'un Pile.
+    """
+    category: int
+    Dp: float
+    Ds: float
+    soil_pointe: Soil
+    ple_etoile: float
+    hauteur_encastrement_effective: float
+    resistance_skin_friction: float
+
+
+class BoreholeCache:
+    """
+    Données d'un sondage partagées par tous les pieux qui s'y rattachent, calculées une seule fois :
+        - niveaux et paramètres des couches (tableaux)
+        - primitive de la courbe des pressions limites (utils.PrefixIntegral) pour ple* et De
+        - paramètres des lois t-z par catégorie de pieu (qs_lim) et coefficients de kt et kq (à diviser par Ds, Dp)
+    """
+
+    def __init__(self, lithology: list[Soil]):
+        self.lithology = lithology
+        self.level_sup = np.array([soil.level_sup for soil in lithology])
+        self.level_inf = np.array([soil.level_inf for soil in lithology])
+        z = np.column_stack([self.level_sup, self.level_inf]).ravel()
+        pl = np.repeat([soil.pl for soil in lithology], 2)
+        self.pl = utils.PrefixIntegral(z, pl)
+        self.kt_coeff = np.array([soil.module_kt(1.) for soil in lithology])
+        self.kq_coeff = np.array([soil.module_kq(1.) for soil in lithology])
+        self._qs_lim = {}
+        self._meshes = {}
+
+    def qs_lim(self, category: int) -> np.ndarray:
+        """
+        Frottement axial unitaire limite de chaque couche pour la catégorie de pieu (article F.5.2).
+        """
+        if category not in self._qs_lim:
+            self._qs_lim[category] = np.array([
+                min(soil.alpha_pieu_sol(category) * soil.fonction_fsol, soil.frottement_maxi(category))
+                for soil in self.lithology
+            ])
+        return self._qs_lim[category]
+
+    def layer_at(self, level: float) -> int:
+        """
+        Indice de la couche contenant le niveau (la couche supérieure en limite de couches, cf. Pile.get_soil_from_level).
+        """
+        inside = np.flatnonzero((self.level_inf <= level) & (level <= self.level_sup))
+        if not len(inside):
+            raise ValueError(f"Niveau {level} hors de la lithologie du sondage")
+        return int(inside[0])
+
+    def overlaps(self, level_top: float, level_bott: float) -> np.ndarray:
+        """
+        Hauteur de chaque couche traversée par le pieu.
+        """
+        return np.clip(np.minimum(level_top, self.level_sup) - np.maximum(level_bott, self.level_inf), 0., None)
+
+    def capacity(self, spec: PileSpec) -> PileCapacity:
+        """
+        Résistances du pieu du carnet (mêmes fonctions que Pile, sans maillage du pieu).
+        Lorsque le sol n'est pas défini jusqu'à D + 3a, ple* est nul et la résistance de pointe est ignorée.
+        """
+        ple = pression_limite_equivalente(
+            self.pl, spec.level_bott, spec.level_top - spec.level_bott, spec.Dp, self.level_inf[-1]
+        )
+        Rs = math.pi * spec.Ds * float(self.qs_lim(spec.category) @ self.overlaps(spec.level_top, spec.level_bott))
+        return PileCapacity(
+            spec.category, spec.Dp, spec.Ds, self.lithology[self.layer_at(spec.level_bott)],
+            ple, hauteur_encastrement_effective(self.pl, spec.level_bott, spec.Ds, ple), Rs,
+        )
+
+    def mesh(self, spec: PileSpec) -> axial.AxialMesh:
+        """
+        Maillage axial du pieu (tranches d'épaisseur spec.thickness au plus dans chaque couche, comme Pile.maillage_pieu),
+        construit directement à partir des paramètres des couches.
+        """
+        overlap = self.overlaps(spec.level_top, spec.level_bott)
+        layers = np.flatnonzero(overlap > 0.)
+        n = np.ceil(overlap[layers] / spec.thickness).astype(int)
+        layer = np.repeat(layers, n)
+        delta_h = np.repeat(overlap[layers] / n, n)
+        z_top = np.minimum(spec.level_top, self.level_sup[layer]) - (
+            np.arange(len(layer)) - np.repeat(np.cumsum(n) - n, n)
+        ) * delta_h
+        return axial.AxialMesh(
+            z_top=z_top,
+            delta_h=delta_h,
+            perimetre=np.full(len(layer), math.pi * spec.Ds),
+            EA=np.full(len(layer), spec.Eb * math.pi * spec.Dp**2 / 4),
+            qs_lim=self.qs_lim(spec.category)[layer],
+            kt=self.kt_coeff[layer] / spec.Ds,
+            layer=np.repeat(np.arange(len(layers)), n),
+        )
+
+    def settlement(
+            self, spec: PileSpec, capacity: PileCapacity, Q_head: float
+    ) -> tuple[float, axial.AxialMesh, axial.AxialState]:
+        """
+        Tassement en tête du pieu sous la charge Q_head (axial.equilibre_top_down, solution élastique directe
+        tant que le pieu reste élastique) : (tassement, maillage, état des tranches).
+        Maillage et matrices de transfert sont conservés pour les pieux de même géométrie.
+        """
+        key = (spec.level_top, spec.level_bott, spec.Dp, spec.Ds, spec.category, spec.Eb, spec.thickness)
+        if key not in self._meshes:
+            mesh = self.mesh(spec)
+            self._meshes[key] = (mesh, axial.ElasticTransfer.from_mesh(mesh))
+        mesh, transfer = self._meshes[key]
+        tip = axial.TipLaw(
+            section=capacity.section_pointe,
+            qb=capacity.kp_util * capacity.ple_etoile,
+            kq=self.kq_coeff[self.layer_at(spec.level_bott)] / spec.Dp,
+        )
+        w_head, _, _, state = axial.equilibre_top_down(mesh, tip, Q_head, transfer=transfer)
+        return w_head, mesh, state
+
+
+# Colonnes de la table de résultats de run_site
+COLUMNS = [
+    'id', 'borehole', 'ple_etoile', 'De', 'kp', 'Rb', 'Rs',
+    'portance_ELS_QP', 'portance_ELS_Car', 'portance_ELU_Str', 'portance_ELU_Acc',
+    'traction_ELS_QP', 'traction_ELS_Car', 'traction_ELU_Str', 'traction_ELU_Acc',
+    'utilisation', 'comb', 'Q_els', 'w_els',
+]
+
+
+# Colonnes des profils par tranche (run_site avec profiles)
+PROFILE_COLUMNS = ['z_top', 'delta_h', 'Q_top', 'dz_top', 'qs']
+
+
+def run_borehole(
+        lithology: list[Soil], specs: list[PileSpec], settlement: bool=True, profiles: bool=False
+) -> tuple[list[tuple], list[dict|None]]:
+    """
+    Calcul de tous les pieux rattachés à un même sondage (un seul cache de sondage) : une ligne par pieu,
+    dans l'ordre de COLUMNS. Le taux de travail et la combinaison dimensionnante sont ceux de
+    loads.check_capacities ; le tassement est calculé sous la plus forte compression ELS du pieu.
+    Avec profiles, l'état des tranches sous cette charge (PROFILE_COLUMNS) est également retourné.
+    """
+    cache = BoreholeCache(lithology)
+    capacities = {spec.id: cache.capacity(spec) for spec in specs}
+    tables = [loads.TorseurTable.from_torseurs(spec.loads, spec.id) for spec in specs if spec.loads]
+    governing = loads.check_capacities(loads.TorseurTable.concatenate(tables), capacities).governing() if tables else {}
+    rows = []
+    states = []
+    for spec in specs:
+        capacity = capacities[spec.id]
+        _, ratio, comb = governing.get(str(spec.id), (None, np.nan, ''))
+        els = [t.nz for t in spec.loads if t.check_comb() and t.comb.upper() in ('ELS_QP', 'ELS_CAR')]
+        Q_els = max(els) if els else np.nan
+        w_els = np.nan
+        profile = None
+        if settlement and Q_els > 0. and Q_els < capacity.resistance_totale:
+            w_els, mesh, state = cache.settlement(spec, capacity, Q_els)
+            if profiles:
+                profile = {
+                    'z_top': mesh.z_top, 'delta_h': mesh.delta_h,
+                    'Q_top': state.Q_top, 'dz_top': state.dz_top, 'qs': state.qs,
+                }
+        rows.append((
+            spec.id, spec.borehole, capacity.ple_etoile, capacity.hauteur_encastrement_effective, capacity.kp_util,
+            capacity.resistance_pointe, capacity.resistance_skin_friction,
+            capacity.portance_ELS_QP, capacity.portance_ELS_Car, capacity.portance_ELU_Str, capacity.portance_ELU_Acc,
+            capacity.traction_ELS_QP, capacity.traction_ELS_Car, capacity.traction_ELU_Str, capacity.traction_ELU_Acc,
+            ratio, comb, Q_els, w_els,
+        ))
+        states.append(profile)
+    return rows, states
+
+
+def run_site(
+        schedule: list[PileSpec],
+        boreholes: dict[str, list[Soil]],
+        max_workers: int|None=None,
+        settlement: bool=True,
+        profiles: bool=False,
+) -> dict[str, np.ndarray]|tuple[dict[str, np.ndarray], storage.Profiles]:
+    """
+    Calcul d'un carnet de pieux : les pieux sont regroupés par sondage (cache calculé une fois par sondage),
+    les groupes étant répartis sur un ensemble de processus (max_workers, 1 pour un calcul dans le processus courant).
+    Retourne la table des résultats par colonnes (COLUMNS), dans l'ordre du carnet, et avec profiles
+    les profils par tranche de chaque pieu (storage.Profiles, profil vide sans calcul de tassement).
+    """
+    missing = sorted({spec.borehole for spec in schedule} - set(boreholes))
+    if missing:
+        raise KeyError(f"Sondages non définis : {missing}")
+    groups = {}
+    for i, spec in enumerate(schedule):
+        groups.setdefault(spec.borehole, []).append(i)
+    lithologies = [boreholes[name] for name in groups]
+    specs = [[schedule[i] for i in index] for index in groups.values()]
+    options = ([settlement] * len(groups), [profiles] * len(groups))
+    if max_workers == 1 or len(groups) == 1:
+        results = map(run_borehole, lithologies, specs, *options)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_borehole, lithologies, specs, *options))
+    rows = [None] * len(schedule)
+    states = [None] * len(schedule)
+    for index, (group_rows, group_states) in zip(groups.values(), results):
+        for i, row, state in zip(index, group_rows, group_states):
+            rows[i] = row
+            states[i] = state
+    columns = list(zip(*rows)) if rows else [[]] * len(COLUMNS)
+    table = {name: np.array(column) for name, column in zip(COLUMNS, columns)}
+    if profiles:
+        return table, storage.Profiles.from_arrays(states, PROFILE_COLUMNS)
+    return table
+
+
+# Colonnes du carnet de pieux et des torseurs associés (schedule_to_columns)
+SCHEDULE_COLUMNS = ['id', 'borehole', 'level_top', 'level_bott', 'Dp', 'Ds', 'category', 'Eb', 'thickness']
+
+
+def schedule_to_columns(schedule: list[PileSpec]) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """
+    Carnet de pieux sous forme de colonnes : (une ligne par pieu, une ligne par torseur repérée par le pieu).
+    Les situations et combinaisons des torseurs sont codées comme dans loads.TorseurTable.
+    """
+    piles = {name: np.array([getattr(spec, name) for spec in schedule]) for name in SCHEDULE_COLUMNS}
+    tables = [loads.TorseurTable.from_torseurs(spec.loads, str(spec.id)) for spec in schedule]
+    table = loads.TorseurTable.concatenate(tables) if tables else loads.TorseurTable.from_torseurs([])
+    return piles, {name: getattr(table, name) for name in loads.FIELDS}
+
+
+def schedule_from_columns(piles: dict[str, np.ndarray], torseurs: dict[str, np.ndarray]) -> list[PileSpec]:
+    """
+    Carnet de pieux reconstruit à partir des colonnes de schedule_to_columns.
+    """
+    label = lambda labels, code: labels[code] if code >= 0 else ''
+    by_pile = {}
+    for pile, hx, hy, nz, mx, my, situation, comb in zip(*(np.asarray(torseurs[name]) for name in loads.FIELDS)):
+        by_pile.setdefault(str(pile), []).append(Torseur(
+            float(hx), float(hy), float(nz), float(mx), float(my),
+            label(loads.SITUATIONS, situation), label(loads.COMBS, comb),
+        ))
+    return [
+        PileSpec(
+            str(pile_id), str(borehole), float(level_top), float(level_bott), float(Dp), float(Ds), int(category),
+            by_pile.get(str(pile_id), []), float(Eb), float(thickness),
+        )
+        for pile_id, borehole, level_top, level_bott, Dp, Ds, category, Eb, thickness
+        in zip(*(np.asarray(piles[name]) for name in SCHEDULE_COLUMNS))
+    ]
+
+
+def save_site(
+        path, schedule: list[PileSpec], table: dict[str, np.ndarray]|None=None, profiles: storage.Profiles|None=None
+) -> Path:
+    """
+    Enregistre une étude de site dans le répertoire path (storage.save_columns) : carnet de pieux ('piles'),
+    torseurs ('loads'), résultats de run_site ('results') et profils par tranche ('profiles').
+    """
+    path = Path(path)
+    piles, torseurs = schedule_to_columns(schedule)
+    storage.save_columns(path / 'piles', piles)
+    storage.save_columns(path / 'loads', torseurs)
+    if table is not None:
+        storage.save_columns(path / 'results', table)
+    if profiles is not None:
+        profiles.save(path / 'profiles')
+    return path
+
+
+@dataclass
+class SiteStudy:
+    """
+    Etude de site relue par load_site :
+        - schedule:     Carnet de pieux
+        - results:      Table des résultats (colonnes en mémoire projetée), None si absente
+        - profiles:     Profils par tranche (colonnes en mémoire projetée), None si absents
+    """
+    schedule: list[PileSpec]
+    results: dict[str, np.ndarray]|None
+    profiles: storage.Profiles|None
+
+
+def load_site(path, mmap: bool=True) -> SiteStudy:
+    """
+    Relit une étude enregistrée par save_site ; les résultats et profils sont projetés en mémoire (mmap).
+    """
+    path = Path(path)
+    schedule = schedule_from_columns(
+        storage.load_columns(path / 'piles', mmap=False), storage.load_columns(path / 'loads', mmap=False)
+    )
+    results = storage.load_columns(path / 'results', mmap) if (path / 'results').exists() else None
+    profiles = storage.Profiles.load(path / 'profiles', mmap) if (path / 'profiles').exists() else None
+    return SiteStudy(schedule, results, profiles)
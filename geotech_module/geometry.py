@@ -0,0 +1,106 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass
+class Section:
+    """
+    Section d'un tronçon de pieu, commune aux modèles axial et transversal :
+        - Eb:           Module de Young du pieu (raccourcissement)
+        - Dp:           Diamètre équivalent du pieu pour l'effort de pointe (surface)
+        - Ds:           Diamètre équivalent du pieu pour le frottement (périmètre)
+        - B:            Largeur perpendiculaire au sens de déplacement (par défaut : Ds)
+        - Iz:           Moment d'inertie de flexion (par défaut : section circulaire de diamètre Dp)
+        - Eb_flexion:   Module de Young du pieu en flexion (par défaut : Eb)
+    """
+    Eb: float
+    Dp: float
+    Ds: float
+    B: float|None=None
+    Iz: float|None=None
+    Eb_flexion: float|None=None
+
+    def __post_init__(self):
+        if self.B is None:
+            self.B = self.Ds
+        if self.Iz is None:
+            self.Iz = math.pi * self.Dp**4 / 64
+        if self.Eb_flexion is None:
+            self.Eb_flexion = self.Eb
+
+    @property
+    def area(self) -> float:
+        return math.pi * self.Dp**2 / 4
+
+    @property
+    def perimetre(self) -> float:
+        return math.pi * self.Ds
+
+    @property
+    def EA(self) -> float:
+        return self.Eb * self.area
+
+    @property
+    def EI(self) -> float:
+        return self.Eb_flexion * self.Iz
+
+    def data_pieu(self, category: int) -> dict:
+        """
+        Dictionnaire des données du pieu transmis aux tranches de pieu (SlicePile.data_pieu).
+        """
+        return {
+            'Categorie': category,
+            'Eb': self.Eb,
+            'Dp': self.Dp,
+            'Ds': self.Ds,
+            'B': self.B,
+            'Iz': self.Iz,
+            'Eb_flexion': self.Eb_flexion,
+        }
+
+
+@dataclass
+class PileGeometry:
+    """
+    Géométrie du pieu : tronçons de section constante, du haut vers le bas.
+        - levels:       Niveaux des limites des tronçons (len(sections) + 1 valeurs décroissantes)
+        - sections:     Section de chaque tronçon
+    Le maillage du pieu est découpé aux limites des tronçons : chaque tranche a une seule section,
+    utilisée par le moteur axial (EA, périmètre) et par le modèle transversal (EI, B).
+    """
+    levels: list[float]
+    sections: list[Section]
+
+    def __post_init__(self):
+        if len(self.levels) != len(self.sections) + 1:
+            raise ValueError("levels doit contenir len(sections) + 1 niveaux")
+        if any(z_1 <= z_2 for z_1, z_2 in zip(self.levels[:-1], self.levels[1:])):
+            raise ValueError("Les niveaux des tronçons doivent être strictement décroissants")
+
+    @classmethod
+    def uniform(cls, level_top: float, level_bott: float, section: Section) -> "PileGeometry":
+        return cls([level_top, level_bott], [section])
+
+    @property
+    def level_top(self) -> float:
+        return self.levels[0]
+
+    @property
+    def level_bott(self) -> float:
+        return self.levels[-1]
+
+    @property
+    def is_uniform(self) -> bool:
+        return all(section == self.sections[0] for section in self.sections)
+
+    def split(self, level_max: float, level_min: float) -> list[tuple[float, float, Section]]:
+        """
+        Découpe l'intervalle [level_min, level_max] aux limites des tronçons : [(level_max, level_min, section)].
+        """
+        parts = []
+        for section, z_top, z_bott in zip(self.sections, self.levels[:-1], self.levels[1:]):
+            top = min(level_max, z_top)
+            bott = max(level_min, z_bott)
+            if top > bott:
+                parts.append((top, bott, section))
+        return parts
@@ -0,0 +1,381 @@
+from dataclasses import dataclass
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
+
+
+# Degrés de liberté du chevêtre : (ux, uy, uz, rx, ry, rz), axe z vers le bas (tassement positif)
+N_DOF = 6
+# Degrés de liberté en tête de pieu : (ux, uy, uz, rx, ry)
+N_HEAD = 5
+
+
+@dataclass
+class PileStiffness:
+    """
+    Raideurs en tête d'un pieu du groupe :
+        - settlement:   Tassements en tête de la courbe de chargement (croissants, 0 pour une charge nulle)
+        - load:         Charges en tête correspondantes (compression positive)
+        - lateral:      Matrice de rigidité transversale en tête (2 x 2, ddl v et dv/dz), identique dans les deux plans
+    """
+    settlement: np.ndarray
+    load: np.ndarray
+    lateral: np.ndarray
+
+    @classmethod
+    def from_pile(cls, pile, situation: str='court terme', head: str='encastree', nb_pas: int=20) -> "PileStiffness":
+        """
+        Raideurs issues des modèles du pieu : courbe de chargement axiale (Pile.settlement_curve) et rigidité
+        en tête du modèle transversal de la situation.
+            - head:     Liaison tête-chevêtre, 'encastree' (rotation de la tête égale à celle du chevêtre)
+                        ou 'articulee' (moment nul en tête)
+        """
+        settlement, load = pile.settlement_curve(nb_pas=nb_pas)
+        settlement, load = np.r_[settlement, 0.], np.r_[load, 0.]
+        order = np.argsort(settlement)
+        K = pile.get_transverse_model(situation).head_stiffness()
+        if head == 'articulee':
+            K = np.array([[K[0, 0] - K[0, 1]**2 / K[1, 1], 0.], [0., 0.]])
+        elif head != 'encastree':
+            raise ValueError("head doit valoir 'encastree' ou 'articulee'")
+        return cls(settlement[order], load[order], K)
+
+    @property
+    def axial(self) -> float:
+        """
+        Raideur axiale initiale : sécante du premier point en compression de la courbe de chargement,
+        dans le domaine élastique du pieu.
+        """
+        first = np.flatnonzero(self.settlement > 0.)[0]
+        return float(self.load[first] / self.settlement[first])
+
+    def axial_load(self, settlement: np.ndarray) -> np.ndarray:
+        """
+        Charge en tête pour un tassement donné, interpolée sur la courbe de chargement
+        (bornée aux charges extrêmes de la courbe).
+        """
+        return np.interp(settlement, self.settlement, self.load)
+
+    def axial_settlement(self, load: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Tassement en tête pour une charge donnée, interpolé sur la courbe de chargement, et pente dw/dQ
+        du segment correspondant : (tassement, souplesse tangente).
+        """
+        load = np.asarray(load, dtype=float)
+        segment = np.clip(np.searchsorted(self.load, load) - 1, 0, len(self.load) - 2)
+        slope = np.diff(self.settlement)[segment] / np.diff(self.load)[segment]
+        return np.interp(load, self.load, self.settlement), slope
+
+    def head_matrix(self, axial: np.ndarray) -> np.ndarray:
+        """
+        Matrices de rigidité en tête (…, 5, 5) pour les raideurs axiales données, dans le repère du chevêtre :
+        plan xz (ux, ry) et plan yz (uy, -rx), suivant les conventions de Torseur.transverse_load.
+        """
+        axial = np.asarray(axial, dtype=float)
+        k = np.zeros(axial.shape + (N_HEAD, N_HEAD))
+        K = self.lateral
+        k[..., 0, 0] = k[..., 1, 1] = K[0, 0]
+        k[..., 4, 4] = k[..., 3, 3] = K[1, 1]
+        k[..., 0, 4] = k[..., 4, 0] = K[0, 1]
+        k[..., 1, 3] = k[..., 3, 1] = -K[0, 1]
+        k[..., 2, 2] = axial
+        return k
+
+
+@dataclass
+class GroupResult:
+    """
+    Résultats d'un groupe de pieux sous chevêtre rigide, pour n cas de charge :
+        - displacement: Déplacements du chevêtre (n, 6) : ux, uy, uz (tassement), rx, ry, rz
+        - forces:       Efforts en tête de chaque pieu (n, n_pieux, 5) : hx, hy, nz (compression), mx, my
+        - iterations:   Nombre d'itérations de chaque cas (0 en élasticité)
+        - converged:    Convergence de chaque cas
+    """
+    displacement: np.ndarray
+    forces: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+    @property
+    def nz(self) -> np.ndarray:
+        return self.forces[..., 2]
+
+
+@dataclass
+class PileGroup:
+    """
+    Groupe de pieux verticaux liés par un chevêtre rigide :
+        - x, y:         Positions des têtes de pieux par rapport au point d'application des torseurs
+        - piles:        Raideurs de chaque pieu (PileStiffness)
+    La rigidité en torsion propre des pieux est négligée : la rotation rz du chevêtre est reprise
+    par les efforts horizontaux des pieux.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    piles: list[PileStiffness]
+
+    def __post_init__(self):
+        self.x = np.asarray(self.x, dtype=float)
+        self.y = np.asarray(self.y, dtype=float)
+        if not len(self.x) == len(self.y) == len(self.piles):
+            raise ValueError("x, y et piles doivent avoir la même longueur")
+        T = self.transformation
+        self._lateral_stiffness = np.einsum('pai,pab,pbj->ij', T, self.head_matrices(np.zeros(len(self))), T)
+        self._axial_outer = np.einsum('pi,pj->pij', T[:, 2], T[:, 2])
+
+    @classmethod
+    def from_piles(cls, piles: list, x: np.ndarray, y: np.ndarray, **kwargs) -> "PileGroup":
+        """
+        Groupe construit à partir des pieux (Pile), les raideurs étant calculées une seule fois par pieu distinct ;
+        kwargs est transmis à PileStiffness.from_pile.
+        """
+        stiffness = {}
+        for pile in piles:
+            if id(pile) not in stiffness:
+                stiffness[id(pile)] = PileStiffness.from_pile(pile, **kwargs)
+        return cls(x, y, [stiffness[id(pile)] for pile in piles])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def transformation(self) -> np.ndarray:
+        """
+        Matrices (n_pieux, 5, 6) donnant les déplacements en tête de chaque pieu à partir de ceux du chevêtre.
+        """
+        T = np.zeros((len(self), N_HEAD, N_DOF))
+        T[:, 0, 0] = T[:, 1, 1] = T[:, 2, 2] = T[:, 3, 3] = T[:, 4, 4] = 1.
+        T[:, 0, 5] = -self.y
+        T[:, 1, 5] = self.x
+        T[:, 2, 3] = self.y
+        T[:, 2, 4] = -self.x
+        return T
+
+    def head_matrices(self, axial: np.ndarray) -> np.ndarray:
+        """
+        Matrices de rigidité en tête (…, n_pieux, 5, 5) pour les raideurs axiales axial (…, n_pieux).
+        """
+        axial = np.broadcast_to(np.asarray(axial, dtype=float), np.shape(axial)[:-1] + (len(self),))
+        return np.stack([pile.head_matrix(axial[..., i]) for i, pile in enumerate(self.piles)], axis=-3)
+
+    def stiffness(self, axial: np.ndarray) -> np.ndarray:
+        """
+        Matrice de rigidité du chevêtre (…, 6, 6) : somme des T_i' k_i T_i. La part transversale, indépendante
+        des raideurs axiales, est assemblée une seule fois ; la part axiale est la somme des k_ax,i t_i t_i'
+        (t_i : ligne de T_i donnant le tassement en tête du pieu i).
+        """
+        return self._lateral_stiffness + np.tensordot(axial, self._axial_outer, axes=1)
+
+    def load_matrix(self, torseurs: list) -> np.ndarray:
+        """
+        Efforts appliqués au chevêtre (n, 6) à partir de torseurs (hx, hy, nz, mx, my), sans moment de torsion.
+        """
+        F = np.zeros((len(torseurs), N_DOF))
+        F[:, :5] = [(t.hx, t.hy, t.nz, t.mx, t.my) for t in torseurs]
+        return F
+
+    def solve(
+            self,
+            loads: np.ndarray,
+            nonlinear: bool=False,
+            tol: float=1e-6,
+            max_iter: int=50,
+    ) -> GroupResult:
+        """
+        Équilibre du chevêtre rigide pour n cas de charge (tableau (n, 6) ou liste de Torseur).
+        En élasticité, tous les cas sont résolus sur une seule factorisation (raideurs axiales initiales).
+        Avec nonlinear, les raideurs axiales sécantes de chaque pieu sont mises à jour à partir des courbes
+        de chargement jusqu'à ce que les efforts normaux soient stables à tol près (relativement) ;
+        tous les cas sont itérés ensemble (matrices 6 x 6 résolues par lot).
+        """
+        F = np.atleast_2d(self.load_matrix(loads) if isinstance(loads, list) else np.asarray(loads, dtype=float))
+        n_cases = len(F)
+        T = self.transformation
+        axial = np.broadcast_to([pile.axial for pile in self.piles], (n_cases, len(self))).copy()
+        iterations = np.zeros(n_cases, dtype=int)
+        converged = np.ones(n_cases, dtype=bool)
+
+        try:
+            factor = cho_factor(self.stiffness(axial[0]))
+        except LinAlgError:
+            raise ValueError("Le groupe de pieux est instable : matrice de rigidité du chevêtre non définie positive")
+        U = cho_solve(factor, F.T).T
+        if nonlinear:
+            active = np.ones(n_cases, dtype=bool)
+            for _ in range(max_iter):
+                w = np.einsum('pj,nj->np', T[:, 2], U[active])
+                N = np.column_stack([pile.axial_load(w[:, i]) for i, pile in enumerate(self.piles)])
+                N_lin = axial[active] * w
+                scale = np.maximum(np.abs(N).max(axis=1), np.abs(F[active, 2]))
+                done = np.abs(N - N_lin).max(axis=1) <= tol * np.maximum(scale, 1e-12)
+                index = np.flatnonzero(active)
+                active[index[done]] = False
+                if not active.any():
+                    break
+                index = index[~done]
+                w, N = w[~done], N[~done]
+                axial[index] = np.where(np.abs(w) > 0., N / np.where(w == 0., 1., w), axial[index])
+                U[index] = np.linalg.solve(self.stiffness(axial[index]), F[index][..., None])[..., 0]
+                iterations[index] += 1
+            converged = ~active
+
+        d = np.einsum('paj,nj->npa', T, U)
+        forces = np.einsum('npab,npb->npa', self.head_matrices(axial), d)
+        return GroupResult(U, forces, iterations, converged)
+
+
+def pile_radii(pile, nu: float=0.3) -> tuple[float, float]:
+    """
+    Rayon du pieu r0 = Ds / 2 et rayon d'influence de Randolph et Wroth rm = 2.5 ρ (1 - ν) L,
+    ρ étant le rapport du module pressiométrique moyen le long du fût à celui de la couche de la pointe.
+    """
+    index = pile.index_lithologie()
+    Em_mean = sum(soil.Em * (level_max - level_min) for level_max, level_min, soil in index) / pile.height_pile
+    rho = Em_mean / index[-1][2].Em
+    return pile.data_pile['Ds'] / 2, 2.5 * rho * (1 - nu) * pile.height_pile
+
+
+def interaction_factors(spacing: np.ndarray, r0: np.ndarray, rm: np.ndarray) -> np.ndarray:
+    """
+    Facteurs d'interaction de Randolph et Wroth α = ln(rm / s) / ln(rm / r0), nuls au-delà de rm
+    (arguments diffusés les uns sur les autres).
+    """
+    spacing, r0, rm = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (spacing, r0, rm)))
+    alpha = np.log(rm / np.maximum(spacing, r0)) / np.log(rm / r0)
+    return np.where(spacing < rm, alpha, 0.)
+
+
+@dataclass
+class GroupSettlementResult:
+    """
+    Tassements d'un groupe de pieux pour n cas de charge :
+        - settlement:   Tassement en tête de chaque pieu (n, n_pieux)
+        - load:         Charge en tête de chaque pieu (n, n_pieux)
+        - iterations:   Nombre d'itérations de chaque cas
+        - converged:    Convergence de chaque cas
+    """
+    settlement: np.ndarray
+    load: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+@dataclass
+class GroupSettlement:
+    """
+    Tassement d'un groupe de pieux par facteurs d'interaction :
+        - x, y:         Positions des pieux
+        - piles:        Raideurs de chaque pieu (courbes de chargement, PileStiffness)
+        - r0, rm:       Rayon et rayon d'influence de chaque pieu (pile_radii)
+    Le tassement du pieu i est w_i = w(P_i) + Σ_j≠i α_ij P_j / k_j : tassement non linéaire du pieu isolé
+    (courbe de chargement) augmenté des tassements élastiques induits par ses voisins (raideur initiale k_j).
+    La matrice des facteurs α est symétrique : seuls les entraxes distincts du triangle supérieur sont évalués.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    piles: list[PileStiffness]
+    r0: np.ndarray
+    rm: np.ndarray
+
+    def __post_init__(self):
+        self.x, self.y, self.r0, self.rm = np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (self.x, self.y, self.r0, self.rm))
+        )
+        if len(self.piles) != len(self.x):
+            raise ValueError("x, y et piles doivent avoir la même longueur")
+        self.axial = np.array([pile.axial for pile in self.piles])
+        self.alpha = self.interaction_matrix()
+
+    @classmethod
+    def from_piles(cls, piles: list, x: np.ndarray, y: np.ndarray, nu: float=0.3, nb_pas: int=20) -> "GroupSettlement":
+        """
+        Groupe construit à partir des pieux (Pile), courbes de chargement et rayons étant calculés une seule fois
+        par pieu distinct.
+        """
+        data = {}
+        for pile in piles:
+            if id(pile) not in data:
+                data[id(pile)] = (PileStiffness.from_pile(pile, nb_pas=nb_pas), *pile_radii(pile, nu))
+        stiffness, r0, rm = zip(*(data[id(pile)] for pile in piles))
+        return cls(x, y, list(stiffness), np.array(r0), np.array(rm))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def interaction_matrix(self) -> np.ndarray:
+        """
+        Matrice symétrique des facteurs d'interaction (n_pieux, n_pieux), de diagonale unité.
+        Les facteurs sont évalués une seule fois par triplet (entraxe au mm près, r0, rm) distinct.
+        """
+        i, j = np.triu_indices(len(self), k=1)
+        spacing = np.hypot(self.x[i] - self.x[j], self.y[i] - self.y[j])
+        keys = np.column_stack([
+            np.round(spacing, 3),
+            (self.r0[i] + self.r0[j]) / 2,
+            (self.rm[i] + self.rm[j]) / 2,
+        ])
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        alpha = np.eye(len(self))
+        alpha[i, j] = alpha[j, i] = interaction_factors(*unique.T)[inverse.ravel()]
+        return alpha
+
+    def _single(self, load: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Tassements et souplesses tangentes des pieux isolés sous les charges load (…, n_pieux).
+        """
+        w, f = np.empty_like(load), np.empty_like(load)
+        for i, pile in enumerate(self.piles):
+            w[..., i], f[..., i] = pile.axial_settlement(load[..., i])
+        return w, f
+
+    def settlements(self, loads: np.ndarray) -> GroupSettlementResult:
+        """
+        Tassements sous des charges en tête imposées (chevêtre souple) : tableau (n, n_pieux) des charges.
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        w, _ = self._single(loads)
+        w += (loads / self.axial) @ (self.alpha - np.eye(len(self)))
+        n_cases = len(loads)
+        return GroupSettlementResult(w, loads, np.zeros(n_cases, dtype=int), np.ones(n_cases, dtype=bool))
+
+    def rigid_cap(self, total_loads: np.ndarray, tol: float=1e-8, max_iter: int=50) -> GroupSettlementResult:
+        """
+        Tassement d'un chevêtre rigide chargé de façon centrée (tassement identique de tous les pieux)
+        sous les charges totales total_loads (n).
+        La solution élastique est obtenue sur une seule factorisation de Cholesky de α (symétrique) :
+        α q = 1, P = k q w. Les équations w(P_i) + Σ_j≠i α_ij P_j / k_j = w, Σ P_i = Q sont ensuite résolues
+        par la méthode de Newton, tous les cas étant itérés ensemble.
+        ValueError si α n'est pas définie positive (pieux confondus ou trop rapprochés devant r0).
+        """
+        Q = np.atleast_1d(np.asarray(total_loads, dtype=float))
+        n = len(self)
+        try:
+            factor = cho_factor(self.alpha)
+        except LinAlgError:
+            raise ValueError(
+                "Matrice d'interaction du groupe non définie positive : pieux confondus ou entraxes trop faibles"
+            )
+        q = cho_solve(factor, np.ones(n))
+        w = Q / np.sum(self.axial * q)
+        P = w[:, None] * self.axial * q
+        interaction = (self.alpha - np.eye(n)) / self.axial[:, None]
+        iterations = np.zeros(len(Q), dtype=int)
+        J = np.zeros((len(Q), n + 1, n + 1))
+        J[:, :n, :n] = interaction.T
+        J[:, :n, n] = -1.
+        J[:, n, :n] = 1.
+        diagonal = np.arange(n)
+        for _ in range(max_iter):
+            w_single, f = self._single(P)
+            residual = np.concatenate([w_single + P @ interaction - w[:, None], (P.sum(axis=1) - Q)[:, None]], axis=1)
+            active = np.abs(residual[:, :n]).max(axis=1) > tol * np.maximum(np.abs(w), 1e-12)
+            active |= np.abs(residual[:, n]) > tol * np.maximum(np.abs(Q), 1e-12)
+            if not active.any():
+                break
+            index = np.flatnonzero(active)
+            Jk = J[index]
+            Jk[:, diagonal, diagonal] += f[index]
+            step = np.linalg.solve(Jk, -residual[index][..., None])[..., 0]
+            P[index] += step[:, :n]
+            w[index] += step[:, n]
+            iterations[index] += 1
+        return GroupSettlementResult(np.repeat(w[:, None], n, axis=1), P, iterations, ~active)
@@ -0,0 +1,349 @@
+import csv
+import io
+import itertools
+from dataclasses import dataclass
+import numpy as np
+
+
+# Situations et combinaisons de Torseur (Torseur.check_situation / Torseur.check_comb)
+SITUATIONS = ['Durable', 'Transitoire', 'Accidentelle', 'Sismiques']
+COMBS = ['ELS_QP', 'ELS_CAR', 'ELU', 'ELA']
+# Champs d'une table de torseurs
+FIELDS = ('pile', 'hx', 'hy', 'nz', 'mx', 'my', 'situation', 'comb')
+# Combinaisons admises pour chaque situation
+VALID_COMBS = np.array([
+    [True, True, True, False],      # Durable
+    [True, True, True, False],      # Transitoire
+    [False, False, False, True],    # Accidentelle
+    [False, False, False, True],    # Sismiques
+])
+
+
+def resistances(pile) -> np.ndarray:
+    """
+    Résistances du pieu pour chaque combinaison (ordre de COMBS) : tableau (2, 4),
+    ligne 0 en compression (portance_*), ligne 1 en traction (traction_*).
+    """
+    return np.array([
+        [pile.portance_ELS_QP, pile.portance_ELS_Car, pile.portance_ELU_Str, pile.portance_ELU_Acc],
+        [pile.traction_ELS_QP, pile.traction_ELS_Car, pile.traction_ELU_Str, pile.traction_ELU_Acc],
+    ])
+
+
+def _codes(values, labels: list[str], normalize) -> np.ndarray:
+    """
+    Codes entiers (indices dans labels) d'une colonne de libellés ; -1 pour un libellé inconnu.
+    """
+    uniques, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    lookup = {label: i for i, label in enumerate(labels)}
+    codes = np.array([lookup.get(normalize(u), -1) for u in uniques], dtype=int)
+    return codes[inverse] if len(codes) else np.zeros(0, dtype=int)
+
+
+def _piles(piles, names) -> list:
+    """
+    Pieux correspondant aux repères names, piles étant un dictionnaire {repère: Pile} ou un Pile commun.
+    """
+    if not isinstance(piles, dict):
+        return [piles] * len(names)
+    missing = [str(name) for name in names if name not in piles and str(name) not in piles]
+    if missing:
+        raise KeyError(f"Pieux non définis : {missing}")
+    return [piles[name] if name in piles else piles[str(name)] for name in names]
+
+
+@dataclass
+class TorseurTable:
+    """
+    Table de torseurs stockée par colonnes (une ligne par combinaison) :
+        - pile:         Repère du pieu
+        - hx, hy, nz, mx, my:   Composantes du torseur (nz positif en compression)
+        - situation:    Code de la situation (indice dans SITUATIONS, -1 si inconnue)
+        - comb:         Code de la combinaison (indice dans COMBS, -1 si inconnue)
+    """
+    pile: np.ndarray
+    hx: np.ndarray
+    hy: np.ndarray
+    nz: np.ndarray
+    mx: np.ndarray
+    my: np.ndarray
+    situation: np.ndarray
+    comb: np.ndarray
+
+    @classmethod
+    def from_columns(
+            cls, pile, hx, hy, nz, mx, my, situation: list[str], comb: list[str]
+    ) -> "TorseurTable":
+        """
+        Table construite à partir de colonnes de valeurs, situations et combinaisons étant données en texte.
+        """
+        return cls(
+            np.asarray(pile),
+            *(np.asarray(c, dtype=float) for c in (hx, hy, nz, mx, my)),
+            _codes(situation, SITUATIONS, str.title),
+            _codes(comb, COMBS, str.upper),
+        )
+
+    @classmethod
+    def from_torseurs(cls, torseurs: list, pile: str|list[str]='P1') -> "TorseurTable":
+        """
+        Table construite à partir d'une liste de Torseur, tous appliqués au pieu pile (ou un repère par torseur).
+        """
+        columns = list(zip(*[(t.hx, t.hy, t.nz, t.mx, t.my, t.situation, t.comb) for t in torseurs])) or [[]] * 7
+        piles = np.broadcast_to(np.asarray(pile), (len(torseurs),))
+        return cls.from_columns(piles, *columns)
+
+    @classmethod
+    def concatenate(cls, tables: list["TorseurTable"]) -> "TorseurTable":
+        return cls(*(np.concatenate([getattr(t, f) for t in tables]) for f in FIELDS))
+
+    def __len__(self) -> int:
+        return len(self.nz)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """
+        Validité de chaque ligne (situation et combinaison connues et compatibles), cf. Torseur.check_comb.
+        """
+        known = (self.situation >= 0) & (self.comb >= 0)
+        valid = np.zeros(len(self), dtype=bool)
+        valid[known] = VALID_COMBS[self.situation[known], self.comb[known]]
+        return valid
+
+    def select(self, mask: np.ndarray) -> "TorseurTable":
+        return TorseurTable(*(getattr(self, f)[mask] for f in FIELDS))
+
+
+@dataclass
+class CapacityCheck:
+    """
+    Vérification de la portance (compression) et de la résistance à la traction de chaque combinaison :
+        - table:        Table des torseurs vérifiés
+        - resistance:   Résistance opposée à chaque combinaison (portance_* ou traction_*)
+        - utilisation:  Taux de travail |nz| / |résistance| (nan pour une combinaison invalide)
+    """
+    table: TorseurTable
+    resistance: np.ndarray
+    utilisation: np.ndarray
+
+    def governing(self) -> dict[str, tuple[int, float, str]]:
+        """
+        Combinaison dimensionnante de chaque pieu : {pieu: (indice de la ligne, taux de travail, combinaison)}.
+        """
+        piles, index = np.unique(self.table.pile, return_inverse=True)
+        ratio = np.where(np.isnan(self.utilisation), -np.inf, self.utilisation)
+        order = np.lexsort((-ratio, index))
+        first = order[np.r_[True, index[order][1:] != index[order][:-1]]]
+        return {
+            str(piles[index[i]]): (int(i), float(self.utilisation[i]), COMBS[self.table.comb[i]] if self.table.comb[i] >= 0 else '')
+            for i in first
+        }
+
+
+def check_capacities(table: TorseurTable, piles) -> CapacityCheck:
+    """
+    Taux de travail axiaux de toutes les combinaisons de la table, les pieux étant donnés par repère ({repère: Pile})
+    ou par un seul Pile commun à tous les repères.
+    Compression (nz > 0) : résistance portance_* ; traction (nz < 0) : résistance traction_*, suivant la combinaison.
+    Les résistances en traction étant négatives, le taux de travail est rapporté à leur valeur absolue.
+    """
+    names, index = np.unique(table.pile, return_inverse=True)
+    R = np.array([resistances(pile) for pile in _piles(piles, names)])
+    valid = table.valid
+    comb = np.where(valid, table.comb, 0)
+    tension = (table.nz < 0).astype(int)
+    resistance = np.where(valid, R[index, tension, comb] if len(table) else np.zeros(0), np.nan)
+    utilisation = np.abs(table.nz) / np.abs(resistance)
+    return CapacityCheck(table, resistance, utilisation)
+
+
+def read_torseur_csv(
+        source,
+        columns: dict[str, str]|None=None,
+        cases: dict[str, tuple[str, str]]|None=None,
+        situation: str='Durable',
+        comb: str='ELU',
+        pile: str='P1',
+        scale: float=1.0,
+        delimiter: str|None=None,
+        decimal: str='.',
+        chunk_size: int=50_000,
+):
+    """
+    Lecture par blocs d'un export CSV de descentes de charges : générateur de TorseurTable de chunk_size lignes
+    au plus, la mémoire utilisée ne dépendant pas de la taille du fichier.
+        - source:       Chemin du fichier ou flux texte
+        - columns:      Correspondance {champ: en-tête du fichier} pour les champs de FIELDS et 'case'
+                        (par défaut : en-têtes identiques aux champs)
+        - cases:        Correspondance {cas de charge: (situation, combinaison)} appliquée à la colonne 'case'
+        - situation, comb, pile:   Valeurs utilisées lorsque la colonne correspondante est absente
+        - scale:        Facteur appliqué aux efforts (ex : 1e-3 pour des kN)
+        - delimiter:    Séparateur (par défaut : détecté sur la première ligne, ValueError s'il n'est pas reconnu)
+        - decimal:      Séparateur décimal
+    Les valeurs vides sont lues comme nulles.
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        with open(source, newline='', encoding='utf-8-sig') as file:
+            yield from read_torseur_csv(
+                file, columns, cases, situation, comb, pile, scale, delimiter, decimal, chunk_size
+            )
+        return
+
+    header = source.readline()
+    if delimiter is None:
+        try:
+            delimiter = csv.Sniffer().sniff(header, delimiters=';,\t').delimiter
+        except csv.Error as e:
+            raise ValueError(f"Séparateur non reconnu dans l'en-tête du fichier : {header.strip()!r}") from e
+    names = [name.strip() for name in next(csv.reader(io.StringIO(header), delimiter=delimiter))]
+    columns = {field: field for field in FIELDS + ('case',)} | (columns or {})
+    position = {field: names.index(name) for field, name in columns.items() if name in names}
+    if 'nz' not in position:
+        raise ValueError(f"Colonne de l'effort normal '{columns['nz']}' absente du fichier")
+    if 'case' in position and cases is None:
+        raise ValueError("La colonne des cas de charge nécessite la correspondance cases")
+
+    reader = csv.reader(source, delimiter=delimiter)
+    while True:
+        rows = list(itertools.islice(reader, chunk_size))
+        if not rows:
+            return
+        data = list(itertools.zip_longest(*rows, fillvalue=''))
+
+        def column(field, default):
+            if field not in position or position[field] >= len(data):
+                return np.full(len(rows), default)
+            return np.char.strip(np.array(data[position[field]], dtype=str))
+
+        def values(field):
+            if field not in position or position[field] >= len(data):
+                return np.zeros(len(rows))
+            text = data[position[field]]
+            try:
+                return scale * np.array(text, dtype=float)
+            except ValueError:
+                text = np.char.replace(np.char.strip(np.array(text, dtype=str)), decimal, '.')
+                return scale * np.where(text == '', '0', text).astype(float)
+
+        situations, combs = column('situation', situation), column('comb', comb)
+        if 'case' in position:
+            labels, inverse = np.unique(column('case', ''), return_inverse=True)
+            mapped = np.array([cases.get(label, ('', '')) for label in labels], dtype=str).reshape(-1, 2)
+            situations, combs = mapped[inverse, 0], mapped[inverse, 1]
+        yield TorseurTable.from_columns(
+            column('pile', pile), *(values(f) for f in ('hx', 'hy', 'nz', 'mx', 'my')), situations, combs
+        )
+
+
+def governing_from_csv(source, piles, **kwargs) -> dict[str, tuple[int, float, str]]:
+    """
+    Combinaisons dimensionnantes de chaque pieu d'un export CSV, vérifié bloc par bloc (cf. read_torseur_csv) :
+    {pieu: (indice de la ligne dans le fichier, taux de travail, combinaison)}.
+    """
+    governing = {}
+    offset = 0
+    for table in read_torseur_csv(source, **kwargs):
+        for name, (row, ratio, comb) in check_capacities(table, piles).governing().items():
+            if name not in governing or ratio > governing[name][1] or np.isnan(governing[name][1]):
+                governing[name] = (offset + row, ratio, comb)
+        offset += len(table)
+    return governing
+
+
+@dataclass
+class LoadEnvelope:
+    """
+    Enveloppe d'une table de torseurs pour les calculs de tassement :
+        - table:        Table des torseurs
+        - kept:         Indices des lignes conservées (compression et traction extrêmes par pieu et combinaison)
+        - reasons:      Motif d'élimination de chaque ligne ('' pour une ligne conservée)
+    Le tassement en tête étant une fonction croissante de la charge en tête, les lignes éliminées
+    sont encadrées par les lignes conservées du même pieu et de la même combinaison.
+    """
+    table: TorseurTable
+    kept: np.ndarray
+    reasons: np.ndarray
+
+    @property
+    def pruned(self) -> dict[int, str]:
+        """
+        Lignes éliminées et motif : {indice de la ligne: motif}.
+        """
+        return {int(i): str(self.reasons[i]) for i in np.flatnonzero(self.reasons != '')}
+
+
+def load_envelope(table: TorseurTable, piles, combs: list[str]|None=None) -> LoadEnvelope:
+    """
+    Réduction de la table aux charges extrêmes (compression maximale, traction maximale) de chaque pieu
+    et de chaque combinaison de combs (par défaut : toutes).
+    Les lignes invalides, hors combs, ou dont l'effort normal dépasse la résistance limite du pieu
+    (resistance_totale en compression, resistance_skin_friction en traction) sont éliminées sans calcul.
+    """
+    names, index = np.unique(table.pile, return_inverse=True)
+    limits = np.array([
+        [pile.resistance_totale, pile.resistance_skin_friction] for pile in _piles(piles, names)
+    ]).reshape(-1, 2)
+    tension = table.nz < 0
+
+    reasons = np.full(len(table), '', dtype=object)
+    selected = np.ones(len(table), dtype=bool) if combs is None else np.isin(
+        table.comb, [COMBS.index(c.upper()) for c in combs]
+    )
+    reasons[~selected] = 'Combinaison non étudiée'
+    reasons[~table.valid] = 'Combinaison invalide'
+    rupture = selected & table.valid & (np.abs(table.nz) >= limits[index, tension.astype(int)])
+    reasons[rupture] = 'Rupture : effort supérieur à la résistance limite du pieu'
+
+    candidates = np.flatnonzero(reasons == '')
+    # Groupes (pieu, combinaison, sens), triés par |nz| décroissant : la première ligne de chaque groupe domine
+    group = (index[candidates] * len(COMBS) + table.comb[candidates]) * 2 + tension[candidates]
+    order = np.lexsort((-np.abs(table.nz[candidates]), group))
+    first = np.r_[True, group[order][1:] != group[order][:-1]]
+    leader = candidates[order][np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))]
+    dominated = candidates[order][~first]
+    sens = np.where(tension[dominated], 'traction', 'compression')
+    reasons[dominated] = [
+        f"Dominée en {s} par la ligne {i}" for s, i in zip(sens, leader[~first])
+    ]
+    return LoadEnvelope(table, np.sort(candidates[order][first]), reasons)
+
+
+@dataclass
+class EnvelopeSettlements:
+    """
+    Tassements en tête des lignes conservées d'une enveloppe :
+        - envelope:     Enveloppe des torseurs
+        - w_head:       Tassement en tête de chaque ligne de la table (nan pour une ligne éliminée ou sans équilibre)
+    """
+    envelope: LoadEnvelope
+    w_head: np.ndarray
+
+    def governing(self) -> dict[str, tuple[float, float]]:
+        """
+        Tassements extrêmes de chaque pieu : {pieu: (soulèvement maximal, tassement maximal)}.
+        """
+        table = self.envelope.table
+        return {
+            str(name): (
+                float(np.nanmin(np.r_[0.0, self.w_head[table.pile == name]])),
+                float(np.nanmax(np.r_[0.0, self.w_head[table.pile == name]])),
+            )
+            for name in np.unique(table.pile)
+        }
+
+
+def envelope_settlements(
+        table: TorseurTable, piles, combs: list[str]|None=None, **kwargs
+) -> EnvelopeSettlements:
+    """
+    Tassements en tête (Pile.equilibre_top_down_Qtete) calculés pour les seules lignes de l'enveloppe
+    (cf. load_envelope) des combinaisons combs (par défaut : ELS_QP et ELS_CAR) ;
+    kwargs est transmis à equilibre_top_down_Qtete.
+    """
+    if combs is None:
+        combs = ['ELS_QP', 'ELS_CAR']
+    envelope = load_envelope(table, piles, combs)
+    w_head = np.full(len(table), np.nan)
+    for i, pile in zip(envelope.kept, _piles(piles, table.pile[envelope.kept])):
+        w_head[i] = pile.equilibre_top_down_Qtete(float(table.nz[i]), **kwargs)[0]
+    return EnvelopeSettlements(envelope, w_head)
@@ -1,12 +1,19 @@
 import math
 from dataclasses import dataclass
+import numpy as np
 import matplotlib.pyplot as plt
 
 
 import geotech_module.utils as utils
+import geotech_module.axial as axial
+import geotech_module.transverse as transverse
 from geotech_module.solver import NewtonRaphson11
 from geotech_module.soil import Soil
-from geotech_module.slice_tb import SliceTB
+from geotech_module.geometry import PileGeometry, Section
+
+
+# Situations de calcul des ressorts de sol transversaux (SlicePile.linear_spring)
+SITUATIONS = ['court terme', 'long terme', 'elu', 'sismique']
 
 
 TAB_A1 = {
@@ -89,6 +96,7 @@ class SlicePile:
     Elément (ou tranche) de pieu de hauteur delta_h, chargée en tête par une force Q_top, 
     associée à un déplacement imposé y_top.
     Les informations qs et Kt sont fournies en vue d'obtenir les lois de mobilisation du frottement latéral.
+    L'état (efforts, déplacements, frottement mobilisé qs) est celui calculé par le noyau axial (axial.slice_kernel).
     """
 
     z_top: float
@@ -96,12 +104,12 @@ class SlicePile:
     soil: Soil
     data_pieu: dict
 
-    Q_bott = 0.
-    dz_bott = 0.
-    Q_middle = 0.
-    dz_middle = 0.
-    Q_top = 0.
-    dz_top = 0.
+    Q_bott: float=0.
+    dz_bott: float=0.
+    dz_middle: float=0.
+    Q_top: float=0.
+    dz_top: float=0.
+    qs: float=0.
 
     def set_Q_bott(self, Q_bott: float) -> float:
         """
@@ -163,6 +171,20 @@ class SlicePile:
         """
         return self.data_pieu['Ds']
 
+    @property
+    def B(self) -> float:
+        """
+        Largeur perpendiculaire au sens de déplacement (ressorts de sol transversaux)
+        """
+        return self.data_pieu['B']
+
+    @property
+    def EI(self) -> float:
+        """
+        Rigidité en flexion de la tranche de pieu
+        """
+        return self.data_pieu['Eb_flexion'] * self.data_pieu['Iz']
+
     @property
     def qs_max(self) -> float:
         """
@@ -211,20 +233,6 @@ class SlicePile:
         """
         return  math.pi * self.Ds
 
-    @property
-    def ksi_a(self) -> float:
-        """
-        Paramètres de calculs : ksi_a = Q_bott * delta_h / (pi * Dp^2 * Eb)
-        """
-        return 2 * self.Q_bott * self.delta_h / (math.pi * self.Dp**2 * self.Eb)
-
-    @property
-    def ksi_b(self) -> float:
-        """
-        Paramètres de calculs : ksi_b = Ds * delta_h^2 / (2 * Dp^2 * Eb)
-        """
-        return self.Ds * self.delta_h**2 / (2 * self.Dp**2 * self.Eb)
-
     def tau_z(self, z: float) -> float:
         """
         Frottement latéral autour du pieu calculé pour un déplacement donné z.
@@ -242,49 +250,26 @@ class SlicePile:
         """
         Effort normal dans le pieu à mi-hauteur de l'élément.
         """
-        return self.Q_bott + math.pi * self.Ds * self.delta_h / 2 * self.tau_z(self.dz_middle)
-
-    @property
-    def Q_top(self) -> float:
-        """
-        Effort normal dans le pieu en partie supérieure de l'élément.
-        """
-        return 2 * self.Q_middle - self.Q_bott
-
-    @property
-    def dz_top(self) -> float:
-        """
-        Déplacement vertical en partie supérieure de l'élément.
-        """
-        return self.dz_bott + 4 * self.Q_middle * self.delta_h / (math.pi * self.Dp**2 * self.Eb)
-
-    @property
-    def qs(self) -> float:
-        return self.tau_z(self.dz_middle)
-
-    def fonction_F(self, z: float) -> float:
-        """
-        Calcul de la fonction F à partir de y.
-        F = dz_bott + ksi_a + ksi_b * tau_z(z) - z
-        Utilisé pour itérer sur z en vue d'obtenir F = 0
-        """
-        return self.dz_bott + self.ksi_a + self.ksi_b * self.tau_z(z) - z
+        return (self.Q_top + self.Q_bott) / 2
 
     def equilibre(self, dz_bott: float) -> tuple[float, float]:
         """
-        Calcul l'équilibre d'un tronçon pour un tassement donné
+        Calcul l'équilibre d'un tronçon pour un tassement donné (noyau axial.slice_kernel).
         """
-        dz_middle = NewtonRaphson11(self.fonction_F, [0.], [dz_bott]).final_roots
-        self.set_dz_middle(dz_middle)
-
+        self.set_dz_bott(dz_bott)
+        self.Q_top, self.dz_top, self.dz_middle, self.qs = axial.slice_kernel(
+            "bottom_to_top", self.Q_bott, dz_bott,
+            self.delta_h, self.perimetre, self.Eb * self.section_pointe, self.qs_lim, self.module_kt,
+        )
         return self.Q_top, self.dz_top
 
-    def horizontal_soil_pressure_spring(self, dy: float, B: float, situation: str='court terme') -> float:
+    def lateral_law(self, B: float, situation: str='court terme') -> tuple[float, float, float|None, float|None]:
         """
-        Loi de mobilisation de la pression latérale sur le sol.
-        La loi renvoyée tient compte de la hauteur de l'élément de pieu.
+        Paramètres (q1, k1, q2, k2) de la loi de mobilisation de la pression latérale (annexe I de la NF P94-262),
+        intégrés sur la hauteur de l'élément de pieu. q2 et k2 valent None pour une loi bi-linéaire.
         """
         situations = ['court terme', 'long terme', 'elu', 'sismique']
+        q2 = k2 = None
         if situation.lower() == situations[0]:
             q1 = self.delta_h * B * self.soil.pf
             k1 = self.delta_h * self.soil.module_kf(B)
@@ -293,19 +278,23 @@ class SlicePile:
             k1 = self.delta_h * self.soil.module_kf(B) / 2
         elif situation.lower() == situations[2]:
             q1 = self.delta_h * B * self.soil.pf
-            k1 = self.soil.module_kf(B)
+            k1 = self.delta_h * self.soil.module_kf(B)
             q2 = self.delta_h * B * self.soil.pl
             k2 = self.delta_h * self.soil.module_kf(B) / 2
         elif situation.lower() == situations[3]:
             q1 = self.delta_h * B * self.soil.pl
             k1 = self.delta_h * self.soil.module_kf(B) * 3
         else:
-            return print("Erreur dans la définition de la situation : ['court terme', 'long terme', 'ELU', 'sismique']")
+            raise ValueError("Erreur dans la définition de la situation : ['court terme', 'long terme', 'ELU', 'sismique']")
+        return q1, k1, q2, k2
 
-        if q2 == None or k2 == None:
-            return utils.tri_linear_law(dy, q1, k1)
-        else:
-            return utils.tri_linear_law(dy, q1, k1, q2, k2)
+    def horizontal_soil_pressure_spring(self, dy: float, B: float, situation: str='court terme') -> float:
+        """
+        Loi de mobilisation de la pression latérale sur le sol.
+        La loi renvoyée tient compte de la hauteur de l'élément de pieu et est symétrique en dy.
+        """
+        q1, k1, q2, k2 = self.lateral_law(B, situation)
+        return math.copysign(utils.tri_linear_law(abs(dy), q1, k1, q2, k2), dy)
 
     def linear_spring(self, B: float, situation: str='court terme') -> float:
         """
@@ -321,74 +310,53 @@ class SlicePile:
         elif situation.lower() == situations[3]:
             return self.delta_h * self.soil.module_kf(B) * 3
         else:
-            return print("Erreur dans la définition de la situation : ['court terme', 'long terme', 'ELU', 'sismique']")
+            raise ValueError("Erreur dans la définition de la situation : ['court terme', 'long terme', 'ELU', 'sismique']")
 
 
-@dataclass
-class Pile:
+def longueurs_ple(Dp: float, height: float) -> tuple[float, float]:
     """
-    Classe de pieu (fondation profonde). Le pieu est défini par les paramètres suivants:
-        - category:     Catégorie du pieu au sens du tableau A1 de la NF P94-262 - Annexe A
-        - level_top:    Niveau supérieur du pieu
-        - level_bott:   Niveau inférieur du pieu
-        - Eb:           Module de Young du pieu
-        - Dp:           Diamètre équivalent du pieu pour l'effort de pointe (surface)
-        - Ds:           Diamètre équivalent du pieu pour le frottement (périmètre)
-        - lithology:    Couches de sol sur la hauteur du pieu   list[Soil]
-        - thickness:    Epaisseur des mailles pour la discretisation du pieu        
+    Longueurs a et b pour le calcul de la pression limite nette équivalente ple* - article F.4.2 (3) de la NF P94-262.
     """
-    category: int
-    level_top: float
-    level_bott: float
-    Eb: float
-    Dp: float
-    Ds: float
-    lithology: list[Soil]
-    thickness: float=0.20
+    a = max(Dp / 2, 0.5)
+    return a, min(a, height)
 
-    def __post_init__(self):
-        self.slices = self.maillage_pieu()
-        self.slices_tb = self.make_slices_tb()
 
-    @property
-    def data_pile(self):
-        """
-        Dictionnaire pour stocker les données du pieu à passer aux tranches de pieu lors de la discrétisation.
-        """
-        data_acc = {}
-        data_acc.update({'Categorie': self.category})
-        data_acc.update({'Eb': self.Eb})
-        data_acc.update({'Dp': self.Dp})
-        data_acc.update({'Ds': self.Ds})
-        return data_acc
+def pression_limite_equivalente(
+        pl: utils.PrefixIntegral, level_bott: float, height: float, Dp: float, level_min: float
+) -> float:
+    """
+    Pression limite nette équivalente ple* - article F.4.2 (3) de la NF P94-262 : moyenne de la courbe des pressions
+    limites pl (primitive, fonction du niveau) entre level_bott + b et level_bott - 3a.
+    Lorsque le sol n'est pas défini jusqu'à D + 3a (level_min), ple* est nul.
+    """
+    a, b = longueurs_ple(Dp, height)
+    if level_bott - 3 * a < level_min:
+        return 0.
+    return float(pl.mean(level_bott + b, level_bott - 3 * a))
 
-    @property
-    def pile_classe(self) -> int:
-        """
-        Renvoie la classe de la fondation (fonction de la catégorie) suivant le tableau A1 de la norme.
-        """
-        return TAB_A1[str(int(self.category))]['Classe']
 
-    @property
-    def abreviation_pieu(self) -> int:
-        """
-        Abréviation utilisée dans le tableau A1 de la norme.
-        """
-        return TAB_A1[str(self.category)]['Abreviation']
+def hauteur_encastrement_effective(pl: utils.PrefixIntegral, level_bott: float, Ds: float, ple_etoile: float) -> float:
+    """
+    Hauteur d'encastrement effective suivant l'équation (F.4.2.6) (nulle lorsque ple* est nul).
+    """
+    if ple_etoile <= 0.:
+        return 0.
+    return float(pl.integral(level_bott, level_bott + 10 * Ds)) / ple_etoile
 
-    @property
-    def description(self) -> int:
-        """
-        Description de la fondation profonde utilisée dans le tableau A1 de la norme.
-        """
-        return TAB_A1[str(self.category)]['Descriptif']
+
+class PileResistances:
+    """
+    Résistances et portances d'un pieu (articles F.4 et F.5 de la NF P94-262), communes à Pile et batch.PileCapacity.
+    La classe utilisatrice fournit : category, Dp, Ds, soil_pointe (sol au niveau de la pointe), ple_etoile,
+    hauteur_encastrement_effective et resistance_skin_friction.
+    """
 
     @property
-    def height_pile(self):
+    def pile_classe(self) -> int:
         """
-        Hauteur totale du pieu (N_tete - N_pointe)
+        Renvoie la classe de la fondation (fonction de la catégorie) suivant le tableau A1 de la norme.
         """
-        return self.level_top - self.level_bott
+        return TAB_A1[str(int(self.category))]['Classe']
 
     @property
     def section_pointe(self) -> float:
@@ -409,8 +377,7 @@ class Pile:
         """
         Returns the partial coefficient gamma_rd1_comp.
         """
-        soil_at_pile_end = self.get_soil_from_level(self.level_bott)
-        courbe = soil_at_pile_end.courbe_frottement
+        courbe = self.soil_pointe.courbe_frottement
         return TAB_GAMMA_RD1_COMP[str(self.category)][courbe]
 
     @property
@@ -418,8 +385,7 @@ class Pile:
         """
         Returns the partial coefficient gamma_rd1_trac.
         """
-        soil_at_pile_end = self.get_soil_from_level(self.level_bott)
-        courbe = soil_at_pile_end.courbe_frottement
+        courbe = self.soil_pointe.courbe_frottement
         return TAB_GAMMA_RD1_TRAC[str(self.category)][courbe]
 
     @property
@@ -429,6 +395,58 @@ class Pile:
         """
         return GAMMA_RD2
 
+    @property
+    def kp_max(self) -> float:
+        """
+        kp_max, facteur de portance pressiométrique du pieu, suivant l'article F.4.2 de la NF P94-262.
+        """
+        return self.soil_pointe.kp_max(self.pile_classe)
+
+    @property
+    def kp_util(self) -> float:
+        """
+        kp_util, facteur de portance pressiométrique retenu, fonction de la hauteur d'encastrement effective.
+        """
+        if self.hauteur_encastrement_effective / self.Ds >= 5:
+            return self.kp_max
+        else:
+            return (1 + (self.kp_max - 1) * self.hauteur_encastrement_effective / (5 * self.Ds))
+
+    @property
+    def resistance_pointe(self) -> float:
+        """
+        Rb, valeur de résistance de pointe de la fondation profonde, suivant l'article F.4 de la NF P94-262.
+        """
+        return self.section_pointe * self.kp_util * self.ple_etoile
+
+    @property
+    def resistance_totale(self) -> float:
+        """
+        Rs + Rb, valeur de résistance totale de la fondation profonde, suivant l'article F.5 de la NF P94-262.
+        """
+        return self.resistance_pointe + self.resistance_skin_friction
+
+    @property
+    def Rbk(self) -> float:
+        """
+        Rb;k, valeur caractéristique de résistance de pointe de la fondation profonde, suivant l'article F.4 de la NF P94-262.
+        """
+        return self.resistance_pointe / (self.gamma_rd1_comp * self.gamma_rd2)
+
+    @property
+    def Rsk_comp(self) -> float:
+        """
+        Rs;k, valeur caractéristique de résistance de frottement axial de la fondation profonde, suivant l'article F.5 de la NF P94-262.
+        """
+        return self.resistance_skin_friction / (self.gamma_rd1_comp * self.gamma_rd2)
+
+    @property
+    def Rsk_trac(self) -> float:
+        """
+        Rs;k, valeur caractéristique de résistance de frottement axial de la fondation profonde, suivant l'article F.5 de la NF P94-262.
+        """
+        return - self.resistance_skin_friction / (self.gamma_rd1_trac * self.gamma_rd2)
+
     @property
     def portance_fluage_car(self, coeff_Rb: float=0.5, coeff_Rs: float=0.7) -> float:
         """
@@ -472,89 +490,127 @@ class Pile:
     def traction_ELU_Acc(self, gamma_s: float=1.05) -> float:
         return self.Rsk_trac / gamma_s
 
-    @property
-    def resistance_totale(self) -> float:
-        """
-        Rs + Rb, valeur de résistance totale de la fondation profonde, suivant l'article F.5 de la NF P94-262.
-        """
-        return self.resistance_pointe + self.resistance_skin_friction
+
+@dataclass
+class Pile(PileResistances):
+    """
+    Classe de pieu (fondation profonde). Le pieu est défini par les paramètres suivants:
+        - category:     Catégorie du pieu au sens du tableau A1 de la NF P94-262 - Annexe A
+        - level_top:    Niveau supérieur du pieu
+        - level_bott:   Niveau inférieur du pieu
+        - Eb:           Module de Young du pieu
+        - Dp:           Diamètre équivalent du pieu pour l'effort de pointe (surface)
+        - Ds:           Diamètre équivalent du pieu pour le frottement (périmètre)
+        - lithology:    Couches de sol sur la hauteur du pieu   list[Soil]
+        - thickness:    Epaisseur des mailles pour la discretisation du pieu        
+        - geometry:     Tronçons et sections du pieu, communs aux modèles axial et transversal
+                        (par défaut : section circulaire uniforme définie par Eb, Dp et Ds).
+                        Eb, Dp et Ds (portance, loi de pointe) doivent être ceux de la section de pointe.
+    """
+    category: int
+    level_top: float
+    level_bott: float
+    Eb: float
+    Dp: float
+    Ds: float
+    lithology: list[Soil]
+    thickness: float=0.20
+    geometry: PileGeometry|None=None
+
+    def __post_init__(self):
+        if self.geometry is None:
+            self.geometry = PileGeometry.uniform(self.level_top, self.level_bott, Section(self.Eb, self.Dp, self.Ds))
+        elif (self.geometry.level_top, self.geometry.level_bott) != (self.level_top, self.level_bott):
+            raise ValueError("La géométrie du pieu doit s'étendre de level_top à level_bott")
+        else:
+            tip = self.geometry.sections[-1]
+            if not all(math.isclose(a, b) for a, b in ((tip.Eb, self.Eb), (tip.Dp, self.Dp), (tip.Ds, self.Ds))):
+                raise ValueError("Eb, Dp et Ds doivent être ceux de la section de pointe de la géométrie du pieu")
+        self.lithology_index = self.index_lithologie()
+        self.set_mesh(self.maillage_pieu())
+
+    def set_mesh(self, slices: list[SlicePile]):
+        """
+        Remplace le maillage du pieu par celui des tranches fournies : tableaux du moteur axial (self.mesh),
+        pour chaque couche du maillage le sol et les données de section (self.mesh_layers), et tranches de pieu
+        (self.slices, ordre haut -> bas) reconstruites une fois à partir des tableaux du maillage.
+        """
+        self.mesh = axial.AxialMesh.from_slices(slices)
+        starts = np.flatnonzero(np.r_[True, self.mesh.layer[1:] != self.mesh.layer[:-1]])
+        self.mesh_layers = [(slices[i].soil, slices[i].data_pieu) for i in starts.tolist()]
+        self.slices = [
+            SlicePile(z_top, delta_h, *self.mesh_layers[layer])
+            for z_top, delta_h, layer in zip(self.mesh.z_top.tolist(), self.mesh.delta_h.tolist(), self.mesh.layer.tolist())
+        ]
+        self._elastic_transfer = None
+        self._transverse_models = {}
 
     @property
-    def resistance_skin_friction(self) -> float:
+    def elastic_transfer(self) -> axial.ElasticTransfer:
         """
-        Rs, valeur de résistance de frottement axial de la fondation profonde, suivant l'article F.5 de la NF P94-262.
+        Matrices de transfert du pieu en régime élastique, calculées une seule fois par maillage.
         """
-        Rs_acc = 0
-        for slice in self.slices:
-            Rs_acc += slice.perimetre * slice.qs_lim * slice.delta_h
-        return Rs_acc
+        if self._elastic_transfer is None:
+            self._elastic_transfer = axial.ElasticTransfer.from_mesh(self.mesh)
+        return self._elastic_transfer
 
     @property
-    def Rsk_comp(self) -> float:
+    def data_pile(self):
         """
-        Rs;k, valeur caractéristique de résistance de frottement axial de la fondation profonde, suivant l'article F.5 de la NF P94-262.
+        Dictionnaire pour stocker les données du pieu à passer aux tranches de pieu lors de la discrétisation
+        (section du tronçon supérieur).
         """
-        return self.resistance_skin_friction / (self.gamma_rd1_comp * self.gamma_rd2)
+        return self.geometry.sections[0].data_pieu(self.category)
 
     @property
-    def Rsk_trac(self) -> float:
+    def abreviation_pieu(self) -> int:
         """
-        Rs;k, valeur caractéristique de résistance de frottement axial de la fondation profonde, suivant l'article F.5 de la NF P94-262.
+        Abréviation utilisée dans le tableau A1 de la norme.
         """
-        return - self.resistance_skin_friction / (self.gamma_rd1_trac * self.gamma_rd2)
+        return TAB_A1[str(self.category)]['Abreviation']
 
     @property
-    def resistance_pointe(self) -> float:
+    def description(self) -> int:
         """
-        Rb, valeur de résistance de pointe de la fondation profonde, suivant l'article F.4 de la NF P94-262.
+        Description de la fondation profonde utilisée dans le tableau A1 de la norme.
         """
-        return self.section_pointe * self.kp_util * self.ple_etoile
+        return TAB_A1[str(self.category)]['Descriptif']
 
     @property
-    def Rbk(self) -> float:
+    def height_pile(self):
         """
-        Rb;k, valeur caractéristique de résistance de pointe de la fondation profonde, suivant l'article F.4 de la NF P94-262.
+        Hauteur totale du pieu (N_tete - N_pointe)
         """
-        return self.resistance_pointe / (self.gamma_rd1_comp * self.gamma_rd2)
+        return self.level_top - self.level_bott
 
     @property
-    def kp_util(self) -> float:
+    def resistance_skin_friction(self) -> float:
         """
-        kp_util, facteur de portance pressiométrique retenu, fonction de la hauteur d'encastrement effective.
+        Rs, valeur de résistance de frottement axial de la fondation profonde, suivant l'article F.5 de la NF P94-262.
         """
-        if self.hauteur_encastrement_effective / self.Ds >= 5:
-            return self.kp_max
-        else:
-            return (1 + (self.kp_max - 1) * self.hauteur_encastrement_effective / (5 * self.Ds))
+        return self.mesh.resistance_skin_friction
 
     @property
-    def kp_max(self) -> float:
+    def soil_pointe(self) -> Soil:
         """
-        kp_max, facteur de portance pressiométrique du pieu, suivant l'article F.4.2 de la NF P94-262.
+        Sol au niveau de la pointe du pieu.
         """
-        return self.get_soil_from_level(self.level_bott).kp_max(self.pile_classe)
+        return self.get_soil_from_level(self.level_bott)
 
     @property
     def ple_etoile(self) -> float:
         """
         Calcul de la pression limite nette équivalente ple* - article F.4.2 (3) de la NF P94-262.
         """
-        niveau_haut = self.level_bott + self.b_length
-        niveau_bas = self.level_bott - 3 * self.a_longueur
-        if niveau_bas < self.courbe_pl[0][-1]:
-            return 0.
-        return utils.mean_value(self.courbe_pl[0], self.courbe_pl[1],niveau_haut, niveau_bas)
+        z, pl = self.courbe_pl
+        return pression_limite_equivalente(utils.PrefixIntegral(z, pl), self.level_bott, self.height_pile, self.Dp, z[-1])
 
     @property
     def hauteur_encastrement_effective(self) -> float:
         """
         Renvoie la hauteur d'encastrement effective suivant l'équation (F.4.2.6)
         """
-        liste_z = self.courbe_pl[0]
-        liste_pl = self.courbe_pl[1]
-        niveau_haut = self.level_bott + 10 * self.Ds
-        niveau_bas = self.level_bott
-        return utils.trapezoidal_integration(liste_z, liste_pl, niveau_haut, niveau_bas) / self.ple_etoile
+        return hauteur_encastrement_effective(utils.PrefixIntegral(*self.courbe_pl), self.level_bott, self.Ds, self.ple_etoile)
 
     @property
     def courbe_pl(self) -> list[list[float]]:
@@ -578,14 +634,14 @@ class Pile:
         """
         Longueur a pour le calcul de la pression limite nette équivalente ple* - article F.4.2 (3) de la NF P94-262. 
         """
-        return max(self.Dp / 2, 0.5)
+        return longueurs_ple(self.Dp, self.height_pile)[0]
 
     @property
     def b_length(self) -> float:
         """
         Longueur b pour le calcul de la pression limite nette équivalente ple* - article F.4.2 (3) de la NF P94-262. 
         """
-        return min(self.a_longueur, self.height_pile)
+        return longueurs_ple(self.Dp, self.height_pile)[1]
 
     def check_stratigraphy(self) -> bool:
         """
@@ -628,13 +684,32 @@ class Pile:
         """
         return self.get_soil_from_level(level).Em
 
-    def create_slices(self, thickness: float, level_max, level_min) -> list[SlicePile]:
+    def index_lithologie(self) -> list[tuple[float, float, Soil]]:
+        """
+        Index de la lithologie sur la hauteur du pieu : [(level_max, level_min, soil)] pour chaque couche traversée.
+        Calculé une seule fois, il est réutilisé par tous les maillages du pieu.
+        """
+        index_acc = []
+        for soil in self.lithology:
+            level_max = min(self.level_top, soil.level_sup)
+            level_min = max(self.level_bott, soil.level_inf)
+            if (level_max - level_min) <= 0.:
+                continue
+            index_acc.append((level_max, level_min, soil))
+        return index_acc
+
+    def create_slices(
+            self, thickness: float, level_max, level_min, soil: Soil|None=None, section: Section|None=None
+        ) -> list[SlicePile]:
         """
         Discrétisation du pieu en n "tranches de pieu" d'épaisseur delta_h entre les niveaux level_max et level_min.
+        Si le sol n'est pas fourni, il est recherché dans la lithologie au milieu de chaque tranche.
+        Si la section n'est pas fournie, celle du tronçon supérieur est utilisée.
         Retourne une liste de "tranches de pieu".
         """
         n_slices = math.ceil((level_max - level_min) / thickness)
         delta_h = (level_max - level_min) / n_slices
+        data_pieu = self.data_pile if section is None else section.data_pieu(self.category)
 
         level_top = level_max
         level_bott = level_top - delta_h
@@ -644,15 +719,11 @@ class Pile:
         i = 0
 
         while i < n_slices:
-            soil = self.get_soil_from_level(level_middle)
-            pf = self.get_pf_from_level(level_middle)
-            pl = self.get_pl_from_level(level_middle)
-            Em = self.get_Em_from_level(level_middle)
             slice = SlicePile(
                 z_top = level_top,
                 delta_h = delta_h,
-                soil = soil,
-                data_pieu=self.data_pile
+                soil = soil if soil is not None else self.get_soil_from_level(level_middle),
+                data_pieu=data_pieu
             )
             slices_acc.append(slice)
             level_top -= delta_h
@@ -662,58 +733,133 @@ class Pile:
 
         return slices_acc
 
-    def maillage_pieu(self) -> list[SlicePile]:
+    def maillage_pieu(self, thickness: float|None=None) -> list[SlicePile]:
         """
-        Création des éléments "tranche" sur la hauteur du pieu, en fonction de la stratigraphie du sol.
+        Création des éléments "tranche" sur la hauteur du pieu, en fonction de la stratigraphie du sol
+        et des tronçons de la géométrie du pieu.
+        Par défaut, l'épaisseur des mailles est celle du pieu (thickness).
         """
+        if thickness is None:
+            thickness = self.thickness
         slices_acc = []
-        for soil in self.lithology:
-            level_max = min(self.level_top, soil.level_sup)
-            level_min = max(self.level_bott, soil.level_inf)
-            if (level_max - level_min) <= 0.:
-                continue
-            else:
-                slice = self.create_slices(self.thickness, level_max, level_min)
-                slices_acc = slices_acc + slice
+        for level_max, level_min, soil in self.lithology_index:
+            for level_1, level_2, section in self.geometry.split(level_max, level_min):
+                slices_acc += self.create_slices(thickness, level_1, level_2, soil, section)
         return slices_acc
 
-    def make_slices_tb(self) -> list[SliceTB]:
-        """Construit une liste de SliceTB à partir des SlicePile déjà maillées."""
-        slices_tb = []
-        for sl in self.slices:
-            slices_tb.append(
-                SliceTB(
-                    z_top=sl.z_top,
-                    delta_h=sl.delta_h,
-                    soil=sl.soil,
-                    data_pieu=self.data_pile,   # ou sl.data_pieu
-                )
+    def convergence_study(
+            self,
+            Q_head: float,
+            thicknesses: list[float]|None=None,
+            tol: float=0.01,
+    ) -> axial.ConvergenceStudy:
+        """
+        Etude de convergence du maillage pour la charge en tête Q_head.
+        Le même pieu est résolu pour plusieurs épaisseurs de maille (index de lithologie réutilisé),
+        le tassement en tête et l'effort de pointe sont extrapolés à maille nulle (Richardson),
+        puis l'épaisseur la plus grossière respectant la tolérance relative tol est recommandée.
+        Le maillage du pieu n'est pas modifié.
+        """
+        if thicknesses is None:
+            thicknesses = [0.80, 0.40, 0.20, 0.10, 0.05]
+        thicknesses = sorted(thicknesses, reverse=True)
+        tip = self.tip_law
+        n_acc, w_acc, Qb_acc = [], [], []
+        for thickness in thicknesses:
+            mesh = axial.AxialMesh.from_slices(self.maillage_pieu(thickness))
+            w_head, Q_base, _, _ = axial.equilibre_top_down(
+                mesh, tip, Q_head,
+                tol_Q=1e-9 * max(1.0, abs(Q_head)),
+                transfer=axial.ElasticTransfer.from_mesh(mesh),
+            )
+            n_acc.append(mesh.n_slices)
+            w_acc.append(w_head)
+            Qb_acc.append(Q_base)
+        return axial.ConvergenceStudy.from_results(thicknesses, n_acc, w_acc, Qb_acc, tol, abs(Q_head))
+
+    def maillage_adaptatif(
+            self,
+            Q_head: float,
+            tol_w: float=1e-5,
+            thickness_max: float=1.0,
+            thickness_min: float=0.005,
+            max_iter: int=20,
+    ) -> axial.AdaptiveMeshReport:
+        """
+        Maillage adaptatif du pieu pour la charge en tête Q_head.
+        Le pieu est d'abord maillé grossièrement (thickness_max), puis les tranches dont l'erreur
+        de discrétisation estimée (une tranche comparée à deux demi-tranches) dépasse leur part de
+        la tolérance tol_w sur le déplacement en tête sont coupées en deux, jusqu'à convergence.
+        Le maillage obtenu remplace le maillage uniforme du pieu.
+        """
+        if max_iter < 1:
+            raise ValueError("max_iter doit être supérieur ou égal à 1")
+        slices = self.maillage_pieu(thickness_max)
+        history = []
+        converged = False
+        for _ in range(max_iter):
+            self.set_mesh(slices)
+            w_head, _, _, state = axial.equilibre_top_down(
+                self.mesh, self.tip_law, Q_head, transfer=self.elastic_transfer, tol_Q=1e-9 * max(1.0, abs(Q_head)),
             )
-        return slices_tb
+            history.append((self.mesh.n_slices, w_head))
+
+            errors = axial.local_errors(self.mesh, state, self.height_pile)
+            allowed = tol_w * self.mesh.delta_h / self.height_pile
+            refine = (errors > allowed) & (self.mesh.delta_h / 2 >= thickness_min)
+            if not refine.any():
+                converged = bool(np.all(errors <= allowed))
+                break
+
+            slices_acc = []
+            for sl, split in zip(slices, refine.tolist()):
+                if split:
+                    half = sl.delta_h / 2
+                    slices_acc.append(SlicePile(z_top=sl.z_top, delta_h=half, soil=sl.soil, data_pieu=sl.data_pieu))
+                    slices_acc.append(SlicePile(z_top=sl.z_top - half, delta_h=half, soil=sl.soil, data_pieu=sl.data_pieu))
+                else:
+                    slices_acc.append(sl)
+            slices = slices_acc
+
+        return axial.AdaptiveMeshReport(self.mesh.n_slices, w_head, converged, history)
+
+    @property
+    def tip_law(self) -> axial.TipLaw:
+        """
+        Loi de mobilisation de l'effort de pointe (kq au droit de la pointe, diamètre de pointe).
+        """
+        soil_tip = self.get_soil_from_level(self.level_bott)
+        return axial.TipLaw(
+            section=self.section_pointe,
+            qb=self.kp_util * self.ple_etoile,
+            kq=soil_tip.module_kq(self.Dp),
+        )
+
+    def slices_from_state(self, state: axial.AxialState) -> list[SlicePile]:
+        """
+        Reporte l'état issu du moteur axial sur les tranches de pieu (self.slices) et les retourne.
+        """
+        for sl, Q_bott, dz_bott, dz_middle, Q_top, dz_top, qs in zip(
+                self.slices, state.Q_bott.tolist(), state.dz_bott.tolist(), state.dz_middle.tolist(),
+                state.Q_top.tolist(), state.dz_top.tolist(), state.qs.tolist(),
+        ):
+            sl.Q_bott, sl.dz_bott, sl.dz_middle = Q_bott, dz_bott, dz_middle
+            sl.Q_top, sl.dz_top, sl.qs = Q_top, dz_top, qs
+        return self.slices
 
     def equilibre_dz_pointe(self, dz_pointe: float) -> tuple[float, float, float, list[SlicePile]]:
         """
         Détermine l'équilibre d'un pieu pour un déplacement vertical donné de la pointe.
         """
-        qb = self.kp_util * self.ple_etoile
-        q1 = self.slices[-1].section_pointe * self.slices[-1].q_z(qb, dz_pointe)
-        dz1 = dz_pointe
-        slices = self.slices[::-1]
-        for slice in slices:
-            slice.set_Q_bott(q1)
-            slice.set_dz_bott(dz1)
-            equilibre = slice.equilibre(dz1)
-            q1 = equilibre[0]
-            dz1 = equilibre[1]
-        eq_slices = slices[::-1]
-        return q1, dz_pointe, dz1, eq_slices
+        q_top, dz_top, state = axial.equilibre_bottom_up(self.mesh, self.tip_law, dz_pointe)
+        return q_top, dz_pointe, dz_top, self.slices_from_state(state)
 
     def fonction_effort_en_tete(self, dz_pointe: float) -> float:
         """
         Renvoie l'effort en tête de pieu pour un déplacement donné de la pointe du pieu.
         """
-        f_qtop = self.equilibre_dz_pointe(dz_pointe)
-        return f_qtop[0]
+        tip = self.tip_law
+        return axial.propagate(self.mesh, "bottom_to_top", tip.reaction(dz_pointe), dz_pointe)[0]
     
     def equilibre_Q_top(self, q_top: float) -> float:
         """
@@ -733,174 +879,41 @@ class Pile:
             n_bracket: int = 40,
             n_bisect: int = 70,
             tol_Q: float | None = None,
+            elastic_fast_path: bool = True,
+            engine: str = "slices",
+            rtol: float = 1e-6,
     ) -> tuple[float, float, list]:
         """
         Équilibre top-down piloté par la charge en tête Q_head.
 
         Hypothèses / conventions :
         - Compression positive.
-        - Les slices utilisées sont des SliceTB (avec .propagate("top_to_bottom", Q_in, w_in)).
+        - La propagation utilise le noyau axial unique (axial.propagate("top_to_bottom", ...)).
         - La pointe est modélisée par une loi q-z : Qp(w_base) = Ab * end_bearing_law(w_base, qb, kq)
         avec contact unilatéral : si w_base <= 0 => Qp = 0 (pointe inactive).
+        - Tant que le pieu reste élastique (elastic_fast_path), la solution est obtenue directement
+        par les matrices de transfert des couches (Pile.elastic_transfer).
+        - engine = "ode" remplace la propagation tranche par tranche par une intégration de
+        Runge-Kutta à pas adaptatif, de précision rtol (le maillage ne sert plus qu'à restituer l'état).
 
         Retour:
-        (w_head, (Q_base, w_base), slices_tb)
+        (w_head, (Q_base, w_base), slices)
         - w_head : déplacement en tête (m)
         - (Q_base, w_base) : effort et déplacement à la base (sortie propagation)
-        - slices_tb : la liste des slices avec états mis à jour
-        """
-
-        # Tolérance sur l'équilibre en force
-        if tol_Q is None:
-            tol_Q = 1e-5 * max(1.0, abs(Q_head))
-
-        qb = self.kp_util * self.ple_etoile
-        Ab = self.section_pointe
-        # kq au droit de la pointe (diamètre de pointe)
-        soil_tip = self.get_soil_from_level(self.level_bott)
-        kq_tip = soil_tip.module_kq(self.Dp)
-
-        traction = (Q_head < 0.0)
-
-        def Qpointe(w_base: float) -> float:
-            """Réaction de pointe (MN) avec contact unilatéral."""
-            # Pointe inactive en traction (choix volontaire et robuste)
-            if traction:
-                return 0.0
-            # Compression : contact unilatéral
-            if w_base <= 0.0:
-                return 0.0
-            return Ab * utils.end_bearing_law(w_base, qb, kq_tip)
-
-        # --- PROPAGATION ---
-        def propagate_top_down(w_head: float) -> tuple[float, float]:
-            """Propager (Q,w) de la tête vers la base à déplacement tête imposé."""
-            Q, w = Q_head, w_head
-            for sl in self.slices_tb:           # ordre haut -> bas
-                Q, w = sl.propagate("top_to_bottom", Q, w)
-            return Q, w  # (Q_base, w_base)
-
-        def residu(w_head: float) -> float:
-            """
-            Résidu d'équilibre en pointe.
-            - si la base ne s'enfonce pas (w_base <= 0), on est en pointe inactive => on veut Q_base ~ 0
-            - sinon on veut Q_base = Qp(w_base)
-            """
-            Qb, wb = propagate_top_down(w_head)
-            if traction:
-                # tout doit être repris par le fût -> Q_base ~ 0
-                return Qb
-            # compression
-            if wb <= 0.0:
-                return Qb
-            return Qb - Qpointe(wb)
-
-        # --- INTERVALLE SELON LE SIGNE DE Q_head ---
-        if traction:
-            w_lo, w_hi = -abs(w_head_max), 0.0
-        else:
-            w_lo, w_hi = 0.0, abs(w_head_max)
-
-        # borne initiale a
-        a = min(max(w_head_guess, w_lo), w_hi)
-        ra = residu(a)
-        if abs(ra) <= tol_Q:
-            Qb, wb = propagate_top_down(a)
-            return a, (Qb, wb), self.slices_tb
-
-        # --- BRACKETING : balayage de w_lo -> w_hi ---
-        best_w, best_r = a, abs(ra)
-        b = None
-        rb = None
-        prev_w, prev_r = a, ra
-
-        for i in range(1, n_bracket + 1):
-            wi = w_lo + (w_hi - w_lo) * i / n_bracket
-            ri = residu(wi)
-
-            if abs(ri) < best_r:
-                best_w, best_r = wi, abs(ri)
-
-            if prev_r * ri < 0.0:
-                a, ra = prev_w, prev_r
-                b, rb = wi, ri
-                break
-
-            prev_w, prev_r = wi, ri
-
-        if b is None:
-            # Pas de bracket : on renvoie le meilleur point (résidu minimal)
-            Qb, wb = propagate_top_down(best_w)
-            return best_w, (Qb, wb), self.slices_tb
-
-        # --- BISECTION ---
-        lo, hi = a, b
-        rlo, rhi = ra, rb
-
-        for _ in range(n_bisect):
-            mid = 0.5 * (lo + hi)
-            rm = residu(mid)
-
-            if abs(rm) <= tol_Q:
-                Qbm, wbm = propagate_top_down(mid)
-                return mid, (Qbm, wbm), self.slices_tb
-
-            if rlo * rm < 0.0:
-                hi, rhi = mid, rm
-            else:
-                lo, rlo = mid, rm
-
-        mid = 0.5 * (lo + hi)
-        Qbm, wbm = propagate_top_down(mid)
-        return mid, (Qbm, wbm), self.slices_tb
-
-        # # --- 1) Bracketing ---
-        # # On cherche un intervalle [a,b] tel que residu(a) et residu(b) soient de signes opposés.
-        # # Pour rester robuste, on balaie w_head de 0 à w_head_max.
-        # a = max(0.0, w_head_guess)
-        # ra = residu(a)
-        # if abs(ra) <= tol_Q:
-        #     Qb, wb = propagate_top_down(a)
-        #     return a, (Qb, wb), self.slices_tb
-
-        # # Balayage progressif
-        # b = None
-        # rb = None
-        # for i in range(1, n_bracket + 1):
-        #     wi = (w_head_max * i) / n_bracket
-        #     ri = residu(wi)
-        #     if ra * ri < 0.0:
-        #         b, rb = wi, ri
-        #         break
-
-        # if b is None:
-        #     # Pas de changement de signe jusqu'à w_head_max.
-        #     # Interprétation la plus fréquente : pointe inactive (ou cible hors domaine avec les paramètres choisis).
-        #     # On renvoie la meilleure solution "au bord" : w_head = 0 (pointe inactive)
-        #     Qb0, wb0 = propagate_top_down(0.0)
-        #     return 0.0, (Qb0, wb0), self.slices_tb
-
-        # # --- 2) Bisection (robuste) ---
-        # lo, hi = a, b
-        # rlo, rhi = ra, rb
-        # for _ in range(n_bisect):
-        #     mid = 0.5 * (lo + hi)
-        #     rm = residu(mid)
-
-        #     if abs(rm) <= tol_Q:
-        #         Qbm, wbm = propagate_top_down(mid)
-        #         return mid, (Qbm, wbm), self.slices_tb
-
-        #     if rlo * rm < 0.0:
-        #         hi, rhi = mid, rm
-        #     else:
-        #         lo, rlo = mid, rm
-
-        # # Retour après itérations max
-        # mid = 0.5 * (lo + hi)
-        # Qbm, wbm = propagate_top_down(mid)
-
-        # return mid, (Qbm, wbm), self.slices_tb
+        - slices : la liste des tranches de pieu avec états mis à jour
+        """
+        w_head, Qb, wb, state = axial.equilibre_top_down(
+            self.mesh, self.tip_law, Q_head,
+            w_head_guess=w_head_guess,
+            w_head_max=w_head_max,
+            n_bracket=n_bracket,
+            n_bisect=n_bisect,
+            tol_Q=tol_Q,
+            transfer=self.elastic_transfer if elastic_fast_path and engine == "slices" else None,
+            engine=engine,
+            rtol=rtol,
+        )
+        return w_head, (Qb, wb), self.slices_from_state(state)
 
     def settlement_curve(
             self,
@@ -944,15 +957,17 @@ class Pile:
     @property
     def data_for_fe_model(self):
         """
-        Returns a dictionary with the pile data required to create de FEModel3D.
+        Returns a dictionary with the pile data required to create de FEModel3D (section of the upper segment,
+        the PyNite model having a single member).
         """
+        section = self.geometry.sections[0]
         dico = {
-            'E': self.Eb,
-            'B': 0.80,
-            'Iz': 0.02,
-            'Iy': 1.,
-            'A': 1.,
-            'J': 1.,
+            'E': section.Eb_flexion,
+            'B': section.B,
+            'Iz': section.Iz,
+            'Iy': section.Iz,
+            'A': section.area,
+            'J': 2 * section.Iz,
             'nu': 0.2,
             'rho': 0.,    
         }
@@ -967,9 +982,194 @@ class Pile:
         """
         Returns the PyNite FEModel3D of the pile.
         """
+        if not self.geometry.is_uniform:
+            raise ValueError("Le modèle PyNite ne traite que les pieux de section uniforme.")
         model = utils.build_pile(self.data_for_fe_model, self.slices, horizontal_force, bending_moment, situation)
         return model
 
+    def get_transverse_model(
+            self, situation: str='court terme', axial_load: float|None=None
+        ) -> transverse.TransverseModel:
+        """
+        Returns the beam-on-springs model of the pile (banded solver), built on the same nodes as the PyNite model.
+        The model (and its factorization) is kept for each situation until the pile is meshed again.
+        Situations with identical springs (court terme and ELU) share the same model, hence the same
+        factorization; the others share the assembly of the beam.
+        With an axial load on top (axial_load), the model includes the geometric stiffness of the axial
+        force profile of the pile (second order, P-Delta).
+        """
+        if axial_load is not None:
+            return self.get_transverse_model(situation).with_axial_forces(self.axial_forces(axial_load))
+        key = situation.lower()
+        if key not in self._transverse_models:
+            springs = transverse.TransverseModel.springs_from_slices(self.slices, situation)
+            models = list(self._transverse_models.values())
+            same = [model for model in models if np.array_equal(model.springs, springs)]
+            if same:
+                self._transverse_models[key] = same[0]
+            elif models:
+                self._transverse_models[key] = models[0].with_springs(springs)
+            else:
+                self._transverse_models[key] = transverse.TransverseModel.from_slices(self.slices, situation)
+        return self._transverse_models[key]
+
+    def axial_forces(self, Q_head: float) -> np.ndarray:
+        """
+        Effort normal dans chaque élément du modèle transversal (compression positive), issu de l'équilibre
+        axial du pieu sous la charge Q_head (equilibre_top_down_Qtete) : moyenne des efforts aux noeuds.
+        """
+        _, _, slices = self.equilibre_top_down_Qtete(Q_head)
+        Q_nodes = np.array([slices[0].Q_top] + [sl.Q_middle for sl in slices] + [slices[-1].Q_bott])
+        return (Q_nodes[:-1] + Q_nodes[1:]) / 2
+
+    def flambement(self, Q_head: float, situation: str='court terme') -> transverse.BucklingResult:
+        """
+        Flambement du pieu sous la distribution d'efforts normaux due à la charge en tête Q_head.
+        La charge critique en tête vaut load_factor * Q_head (distribution N(z) supposée homothétique).
+        """
+        return self.get_transverse_model(situation).buckling(self.axial_forces(Q_head))
+
+    def transverse_analysis(
+            self,
+            horizontal_force: float=0.,
+            bending_moment: float=0.,
+            situation: str='court terme',
+            backend: str='banded',
+            axial_load: float|None=None,
+        ) -> transverse.TransverseResult:
+        """
+        Linear transverse analysis of the pile, loaded on top.
+            - backend = 'banded': native beam-on-springs solver (banded Cholesky factorization)
+            - backend = 'pynite': PyNite FEModel3D, kept as a cross-check
+        With axial_load, the analysis is a second order one (P-Delta, banded solver only).
+        """
+        if backend == 'banded':
+            return self.get_transverse_model(situation, axial_load).solve(horizontal_force, bending_moment)
+        elif axial_load is not None:
+            raise ValueError("The second order analysis is only available with the banded solver")
+        elif backend == 'pynite':
+            model = self.get_fe_model(horizontal_force, bending_moment, situation)
+            model.analyze_linear()
+            return utils.get_model_results(model)
+        else:
+            raise ValueError("backend must be 'banded' or 'pynite'")
+
+    def transverse_analysis_cases(
+            self,
+            horizontal_forces: list[float],
+            bending_moments: list[float],
+            situation: str='court terme',
+            axial_load: float|None=None,
+        ) -> transverse.TransverseResults:
+        """
+        Linear transverse analysis for several load cases (H_i, M_i) applied on top, solved together
+        on a single factorization of the stiffness matrix of the situation (P-Delta with axial_load).
+        """
+        model = self.get_transverse_model(situation, axial_load)
+        return model.solve_cases(horizontal_forces, bending_moments)
+
+    def transverse_analysis_situations(
+            self,
+            horizontal_forces: list[float],
+            bending_moments: list[float],
+            situations: list[str]|None=None,
+        ) -> dict[str, transverse.TransverseResults]:
+        """
+        Linear transverse analysis of the load cases for every situation (default: SITUATIONS), results keyed by situation.
+        """
+        if situations is None:
+            situations = SITUATIONS
+        return {
+            situation: self.transverse_analysis_cases(horizontal_forces, bending_moments, situation)
+            for situation in situations
+        }
+
+    def transverse_analysis_torseurs(
+            self,
+            torseurs: list["Torseur"],
+            situation: str='court terme',
+            plane: str='xz',
+        ) -> transverse.TransverseResults:
+        """
+        Linear transverse analysis for a list of Torseur, in the plane 'xz' (hx, my) or 'yz' (hy, -mx).
+        """
+        loads = np.array([torseur.transverse_load(plane) for torseur in torseurs]).reshape(-1, 2)
+        return self.transverse_analysis_cases(loads[:, 0], loads[:, 1], situation)
+
+    def transverse_analysis_biaxial(
+            self,
+            torseurs: list["Torseur"],
+            situation: str='court terme',
+        ) -> transverse.BiaxialResults:
+        """
+        Biaxial transverse analysis for a list of Torseur: both bending planes are solved from one shared
+        factorization. The same section and soil springs are used in both planes (circular piles).
+        """
+        loads = np.array([[t.hx, t.my, t.hy, t.mx] for t in torseurs]).reshape(-1, 4)
+        return self.get_transverse_model(situation).solve_biaxial(*loads.T)
+
+    def transverse_analysis_nonlinear(
+            self,
+            horizontal_force: float=0.,
+            bending_moment: float=0.,
+            situation: str='court terme',
+            method: str='tangent',
+            n_steps: int|None=None,
+            tol: float=1e-8,
+            axial_load: float|None=None,
+        ) -> tuple[transverse.TransverseResult, transverse.NonlinearReport]:
+        """
+        Transverse analysis of the pile with the p-y laws of SlicePile.lateral_law.
+        By default, the load is applied in 5 steps for the ELU situation, in a single step otherwise.
+        With axial_load, the geometric stiffness of the axial force profile is included in the iterations.
+        """
+        if n_steps is None:
+            n_steps = 5 if situation.lower() == 'elu' else 1
+        laws = transverse.LateralLaws.from_slices(self.slices, situation)
+        model = self.get_transverse_model(situation, axial_load)
+        return model.solve_nonlinear(horizontal_force, bending_moment, laws, method, n_steps, tol)
+
+    def longueur_critique(
+            self,
+            horizontal_force: float,
+            bending_moment: float=0.,
+            situations: list[str]|None=None,
+            tol: float=0.01,
+        ) -> dict[str, transverse.CriticalLength]:
+        """
+        Critical (effective) length of the pile under a lateral load on top, for each situation: shortest length
+        beyond which the head deflection stays within tol of the one of the full pile. The head response for every
+        embedded length is obtained in one condensation sweep of the transverse model.
+        """
+        if situations is None:
+            situations = SITUATIONS
+        return {
+            situation: self.get_transverse_model(situation).critical_length(horizontal_force, bending_moment, tol)
+            for situation in situations
+        }
+
+    def pushover(
+            self,
+            head_deflection_max: float,
+            n_steps: int=100,
+            situation: str='elu',
+            moment_ratio: float=0.,
+            axial_load: float|None=None,
+        ) -> transverse.PushoverCurve:
+        """
+        Lateral pushover curve of the pile (p-y laws of SlicePile.lateral_law), under displacement control
+        of the head up to head_deflection_max in n_steps equal steps. The head moment is moment_ratio * H.
+        The depth over which the soil reaction reaches pl is tracked along the curve
+        (see PushoverCurve.load_at_plastic_depth).
+        """
+        slices = self.slices
+        laws = transverse.LateralLaws.from_slices(slices, situation)
+        limit = np.array([0.] + [sl.delta_h * sl.B * sl.soil.pl for sl in slices] + [0.])
+        heights = np.array([0.] + [sl.delta_h for sl in slices] + [0.])
+        targets = np.linspace(0., head_deflection_max, n_steps + 1)[1:]
+        model = self.get_transverse_model(situation, axial_load)
+        return model.pushover(laws, targets, moment_ratio, limit, heights)
+
     def pile_description(self):
         """
         Imprime les principales caractéristiques de la fondation profonde dans le terminal
@@ -1025,6 +1225,20 @@ class Torseur:
     situation: str
     comb: str
 
+    def transverse_load(self, plane: str='xz') -> tuple[float, float]:
+        """
+        Effort horizontal et moment fléchissant en tête dans le plan de flexion considéré, avec les conventions
+        du modèle transversal (moment positif autour de l'axe z x h, z étant l'axe du pieu) :
+            - plan 'xz': (hx, my)
+            - plan 'yz': (hy, -mx)
+        """
+        if plane == 'xz':
+            return self.hx, self.my
+        elif plane == 'yz':
+            return self.hy, -self.mx
+        else:
+            raise ValueError("plane must be 'xz' or 'yz'")
+
     def check_situation(self) -> bool:
         """
         Vérification de la validité du paramètre "Situation".
@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+import numpy as np
+from scipy.spatial import cKDTree
+
+import geotech_module.utils as utils
+from geotech_module.soil import LogPressio, Soil
+
+
+# Paramètres pressiométriques interpolés entre sondages
+FIELDS = ('pf', 'pl', 'Em')
+
+
+@dataclass
+class Borehole:
+    """
+    Sondage pressiométrique positionné sur le site :
+        - name:         Nom du sondage
+        - x, y:         Coordonnées du sondage
+        - log:          Enregistrements de l'essai pressiométrique
+    """
+    name: str
+    x: float
+    y: float
+    log: LogPressio
+
+
+@dataclass
+class Layer:
+    """
+    Couche de la coupe de sol du site, dont les paramètres pressiométriques sont moyennés sur
+    le profil interpolé (SiteModel.soils_at) :
+        - name, level_sup, level_inf, courbe_frottement, alpha, friction_type, end_type:   cf. Soil
+    """
+    name: str
+    level_sup: float
+    level_inf: float
+    courbe_frottement: str
+    alpha: float
+    friction_type: str='granulaire'
+    end_type: str='granulaire'
+
+
+@dataclass
+class SiteModel:
+    """
+    Modèle de site à plusieurs sondages : les profils pf, pl et Em sont interpolés en plan par pondération
+    inverse à la distance (IDW) des n_neighbours sondages les plus proches, recherchés dans un arbre k-d.
+        - boreholes:    Sondages du site
+        - power:        Exposant de la pondération (poids 1 / d^power)
+        - n_neighbours: Nombre de sondages pris en compte pour chaque point
+    Les logs sont rééchantillonnés une seule fois sur les niveaux NGF de l'ensemble des sondages
+    (valeurs extrêmes prolongées au-delà de chaque log, comme LogPressio).
+    """
+    boreholes: list[Borehole]
+    power: float=2.0
+    n_neighbours: int=4
+
+    def __post_init__(self):
+        if not self.boreholes:
+            raise ValueError("Le site doit comporter au moins un sondage")
+        self.tree = cKDTree(np.array([(b.x, b.y) for b in self.boreholes], dtype=float))
+        self.levels = np.unique(np.concatenate([b.log.levels_ngf for b in self.boreholes]))[::-1]
+        self.values = {}
+        for name in FIELDS:
+            curves = []
+            for borehole in self.boreholes:
+                log = borehole.log
+                levels = np.asarray(log.levels_ngf, dtype=float)
+                order = np.argsort(levels)
+                curves.append(np.interp(self.levels, levels[order], np.asarray(getattr(log, f"cb_{name}"))[order]))
+            self.values[name] = np.array(curves)
+
+    def weights(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sondages retenus et poids normés pour chaque point : (indices, poids), tableaux (n_points, k).
+        Un point confondu avec un sondage reçoit les valeurs de ce sondage.
+        """
+        points = np.column_stack(np.broadcast_arrays(np.atleast_1d(x), np.atleast_1d(y))).astype(float)
+        k = min(self.n_neighbours, len(self.boreholes))
+        distance, index = self.tree.query(points, k=k)
+        distance, index = distance.reshape(len(points), k), index.reshape(len(points), k)
+        exact = distance[:, :1] == 0.
+        weight = np.where(exact, (distance == 0.).astype(float), 1. / np.where(distance == 0., 1., distance)**self.power)
+        return index, weight / weight.sum(axis=1, keepdims=True)
+
+    def profiles(self, x: np.ndarray, y: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Profils interpolés pf, pl et Em aux points (x, y) : {paramètre: tableau (n_points, n_niveaux)},
+        les niveaux étant self.levels.
+        """
+        index, weight = self.weights(x, y)
+        return {name: np.einsum('pk,pkl->pl', weight, values[index]) for name, values in self.values.items()}
+
+    def logs_at(self, x: np.ndarray, y: np.ndarray) -> list[LogPressio]:
+        """
+        Logs pressiométriques interpolés aux points (x, y).
+        """
+        profiles = self.profiles(x, y)
+        levels = self.levels.tolist()
+        return [
+            LogPressio(levels, pf.tolist(), pl.tolist(), Em.tolist())
+            for pf, pl, Em in zip(profiles['pf'], profiles['pl'], profiles['Em'])
+        ]
+
+    def log_at(self, x: float, y: float) -> LogPressio:
+        return self.logs_at(x, y)[0]
+
+    def soils_at(self, x: np.ndarray, y: np.ndarray, layers: list[Layer]) -> list[list[Soil]]:
+        """
+        Lithologie de chaque point (x, y) : une couche Soil par couche de la coupe, de paramètres pf, pl et Em
+        égaux aux valeurs moyennes des profils interpolés sur la hauteur de la couche.
+        La moyenne étant linéaire, elle est calculée une fois par sondage puis pondérée comme les profils.
+        """
+        index, weight = self.weights(x, y)
+        level_sup = np.array([layer.level_sup for layer in layers])
+        level_inf = np.array([layer.level_inf for layer in layers])
+        # Moyenne linéaire des profils : moyennes par sondage (une fois par sondage) pondérées ensuite
+        means = {}
+        for name, values in self.values.items():
+            borehole_means = np.array([
+                utils.PrefixIntegral(self.levels, curve).mean(level_sup, level_inf) for curve in values
+            ])
+            means[name] = np.einsum('pk,pkl->pl', weight, borehole_means[index])
+        return [
+            [
+                Soil(
+                    layer.name, layer.level_sup, layer.level_inf, layer.courbe_frottement,
+                    float(means['pf'][i, j]), float(means['pl'][i, j]), float(means['Em'][i, j]), layer.alpha,
+                    layer.friction_type, layer.end_type,
+                )
+                for j, layer in enumerate(layers)
+            ]
+            for i in range(len(index))
+        ]
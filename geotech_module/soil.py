@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import math
 import numpy as np
 
-from geotech_module.utils import trapezoidal_integration, mean_value
+from geotech_module.utils import PrefixIntegral
 
 
 TAB_F421 = {
@@ -190,22 +190,32 @@ class Soil:
             return 12 * self.Em / (4/3 * 2.65 ** self.alpha + self.alpha)
 
 
-@dataclass
+@dataclass(frozen=True)
 class LogPressio:
     """
     Classe definissant les enregistrements d'un essai pressiométrique Ménard
+    Les valeurs moyennes (pression de fluage, pression limite, module) entre deux profondeurs ou niveaux
+    acceptent aussi des tableaux de bornes (une moyenne par intervalle).
+    Les enregistrements sont figés (convertis en tuples) : les primitives des courbes, calculées à la création,
+    restent ainsi valables.
     """
-    levels_ngf: list[float]
-    cb_pf: list[float]
-    cb_pl: list[float]
-    cb_Em: list[float]
+    levels_ngf: tuple[float, ...]
+    cb_pf: tuple[float, ...]
+    cb_pl: tuple[float, ...]
+    cb_Em: tuple[float, ...]
 
     @property
     def top_level(self):
         return max(self.levels_ngf)
 
     def __post_init__(self):
-        self.depths = self.get_depths()
+        for name in ('levels_ngf', 'cb_pf', 'cb_pl', 'cb_Em'):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+        object.__setattr__(self, 'depths', self.get_depths())
+        # Primitives des courbes en profondeur, calculées une fois : moyennes en O(log n), vectorisées
+        object.__setattr__(self, 'integral_pf', PrefixIntegral(self.depths, self.cb_pf))
+        object.__setattr__(self, 'integral_pl', PrefixIntegral(self.depths, self.cb_pl))
+        object.__setattr__(self, 'integral_Em', PrefixIntegral(self.depths, self.cb_Em))
 
     def get_depths(self) -> list[float]:
         depth_acc = []
@@ -260,7 +270,7 @@ class LogPressio:
         """
         Retourne la pression de fluage moyenne entre deux niveaux.
         """
-        return mean_value(self.depths, self.cb_pf, z1, z2)
+        return self.integral_pf.mean(z1, z2)
 
     def pression_fluage_moyenne_ngf(self, level_1: float, level_2: float) -> float:
         """
@@ -268,13 +278,13 @@ class LogPressio:
         """
         z1 = self.level_to_depth(level_1, self.top_level)
         z2 = self.level_to_depth(level_2, self.top_level)
-        return mean_value(self.depths, self.cb_pf, z1, z2)
+        return self.integral_pf.mean(z1, z2)
 
     def pression_limite_moyenne_z(self, z1: float, z2: float) -> float:
         """
         Retourne la pression limite moyenne entre deux niveaux.
         """
-        return mean_value(self.depths, self.cb_pl, z1, z2)
+        return self.integral_pl.mean(z1, z2)
 
     def pression_limite_moyenne_ngf(self, level_1: float, level_2: float) -> float:
         """
@@ -282,13 +292,13 @@ class LogPressio:
         """
         z1 = self.level_to_depth(level_1, self.top_level)
         z2 = self.level_to_depth(level_2, self.top_level)
-        return mean_value(self.depths, self.cb_pl, z1, z2)
+        return self.integral_pl.mean(z1, z2)
 
     def module_pressio_moyen_z(self, z1: float, z2: float) -> float:
         """
         Retourne le module pressiométrique moyen entre deux niveaux.
         """
-        return mean_value(self.depths, self.cb_Em, z1, z2)
+        return self.integral_Em.mean(z1, z2)
 
     def module_pressio_moyen_ngf(self, level_1: float, level_2: float) -> float:
         """
@@ -296,7 +306,7 @@ class LogPressio:
         """
         z1 = self.level_to_depth(level_1, self.top_level)
         z2 = self.level_to_depth(level_2, self.top_level)
-        return mean_value(self.depths, self.cb_Em, z1, z2)
+        return self.integral_Em.mean(z1, z2)
 
 
 levels_ngf = [97, 95.5, 94, 92.5, 91., 89.5, 88., 86.5, 85., 83.5, 82., 80.5]
@@ -334,3 +344,89 @@ class SoilPressio:
     @property
     def Em_mean(self):
         return self.pressio.module_pressio_moyen_ngf(self.level_sup, self.level_inf)
+
+
+def segment_log(
+        log: LogPressio,
+        n_layers: int|None=None,
+        min_thickness: float=1.0,
+        max_layers: int=8,
+) -> list[tuple[float, float]]:
+    """
+    Découpage automatique d'un log pressiométrique en couches homogènes : [(level_sup, level_inf)] de haut en bas.
+    Chaque essai représente la hauteur comprise entre les milieux des intervalles qui l'entourent. Le découpage
+    minimise, par programmation dynamique, la somme des écarts quadratiques de (ln pl, ln Em) normés à la moyenne
+    de leur couche, pour des couches d'épaisseur au moins égale à min_thickness. Le coût de chaque couche
+    est obtenu en O(1) par sommes cumulées.
+        - n_layers:     Nombre de couches imposé ; par défaut, nombre choisi (jusqu'à max_layers) par le critère BIC
+    """
+    levels = np.asarray(log.levels_ngf, dtype=float)
+    order = np.argsort(-levels)
+    levels = levels[order]
+    n = len(levels)
+    features = np.log(np.maximum(np.column_stack([
+        np.asarray(log.cb_pl, dtype=float)[order], np.asarray(log.cb_Em, dtype=float)[order]
+    ]), 1e-6))
+    features = (features - features.mean(axis=0)) / np.where(features.std(axis=0) > 0, features.std(axis=0), 1.)
+    bounds = np.concatenate([[levels[0]], (levels[1:] + levels[:-1]) / 2, [levels[-1]]])
+
+    S1 = np.concatenate([np.zeros((1, 2)), np.cumsum(features, axis=0)])
+    S2 = np.concatenate([[0.], np.cumsum((features**2).sum(axis=1))])
+    i, j = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+    count = np.where(j > i, j - i, 1)
+    cost = S2[j] - S2[i] - ((S1[j] - S1[i])**2).sum(axis=-1) / count
+    cost = np.where((j > i) & (bounds[i] - bounds[j] >= min_thickness - 1e-9), np.maximum(cost, 0.), np.inf)
+
+    k_max = min(n_layers if n_layers is not None else max_layers, n)
+    D = np.full((k_max + 1, n + 1), np.inf)
+    D[0, 0] = 0.
+    previous = np.zeros((k_max + 1, n + 1), dtype=int)
+    for k in range(1, k_max + 1):
+        total = D[k - 1][:, None] + cost
+        previous[k] = np.argmin(total, axis=0)
+        D[k] = total[previous[k], np.arange(n + 1)]
+
+    if n_layers is not None:
+        k = n_layers
+        if k > n or not np.isfinite(D[k, n]):
+            raise ValueError(f"Découpage en {n_layers} couches d'au moins {min_thickness} m impossible")
+    else:
+        feasible = np.flatnonzero(np.isfinite(D[1:, n])) + 1
+        if not len(feasible):
+            raise ValueError(f"Le log est moins épais que min_thickness = {min_thickness} m")
+        bic = n * np.log(D[feasible, n] / n + 1e-9) + 3 * feasible * np.log(n)
+        k = int(feasible[np.argmin(bic)])
+
+    cuts = [n]
+    for layer in range(k, 0, -1):
+        cuts.append(previous[layer, cuts[-1]])
+    cuts = cuts[::-1]
+    return [(float(bounds[a]), float(bounds[b])) for a, b in zip(cuts[:-1], cuts[1:])]
+
+
+def auto_layering(
+        log: LogPressio,
+        n_layers: int|None=None,
+        min_thickness: float=1.0,
+        max_layers: int=8,
+        courbe_frottement: str='Q1',
+        alpha: float=1/2,
+        friction_type: str='granulaire',
+        end_type: str='granulaire',
+        name: str='Couche',
+) -> list[Soil]:
+    """
+    Lithologie issue du découpage automatique du log (segment_log) : une couche Soil par couche homogène,
+    de paramètres pf, pl et Em moyens sur la couche (cf. SoilPressio). Les paramètres non pressiométriques
+    (courbe de frottement, alpha, types de sol) sont communs à toutes les couches et restent à ajuster.
+    """
+    return [
+        Soil(
+            f"{name} {i + 1}", level_sup, level_inf, courbe_frottement,
+            float(log.pression_fluage_moyenne_ngf(level_sup, level_inf)),
+            float(log.pression_limite_moyenne_ngf(level_sup, level_inf)),
+            float(log.module_pressio_moyen_ngf(level_sup, level_inf)),
+            alpha, friction_type, end_type,
+        )
+        for i, (level_sup, level_inf) in enumerate(segment_log(log, n_layers, min_thickness, max_layers))
+    ]
@@ -0,0 +1,76 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
+
+
+# Fichier décrivant le contenu d'un répertoire de colonnes
+MANIFEST = 'manifest.json'
+
+
+def save_columns(path, columns: dict[str, np.ndarray], kind: str='table') -> Path:
+    """
+    Enregistre une table par colonnes dans le répertoire path : un fichier .npy par colonne et un fichier
+    MANIFEST (ordre des colonnes, nature de la table). Les colonnes de texte sont stockées en chaînes
+    de longueur fixe, ce qui permet de toutes les relire en mémoire projetée (load_columns).
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    for name, column in columns.items():
+        column = np.asarray(column)
+        if column.dtype == object:
+            column = column.astype(str)
+        np.save(path / f"{name}.npy", column, allow_pickle=False)
+    (path / MANIFEST).write_text(json.dumps({'kind': kind, 'columns': list(columns)}))
+    return path
+
+
+def load_columns(path, mmap: bool=True) -> dict[str, np.ndarray]:
+    """
+    Relit une table enregistrée par save_columns. Avec mmap, les colonnes sont projetées en mémoire (lecture seule) :
+    le chargement est immédiat et les extractions (tranches, masques) ne lisent que les données utiles.
+    """
+    path = Path(path)
+    manifest = json.loads((path / MANIFEST).read_text())
+    mode = 'r' if mmap else None
+    return {name: np.load(path / f"{name}.npy", mmap_mode=mode, allow_pickle=False) for name in manifest['columns']}
+
+
+@dataclass
+class Profiles:
+    """
+    Profils par tranche d'un ensemble de pieux, stockés à plat (format CSR) :
+        - offsets:      Indices de début des profils de chaque pieu dans les colonnes (n_pieux + 1 valeurs)
+        - columns:      Colonnes des profils concaténés ({nom: tableau de offsets[-1] valeurs})
+    Le profil du pieu i est la tranche [offsets[i], offsets[i + 1]) de chaque colonne (vue sans copie).
+    """
+    offsets: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    @classmethod
+    def from_arrays(cls, profiles: list[dict[str, np.ndarray]|None], names: list[str]) -> "Profiles":
+        """
+        Concatène les profils de chaque pieu (None pour un pieu sans profil, de longueur nulle).
+        """
+        lengths = [0 if profile is None else len(profile[names[0]]) for profile in profiles]
+        offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+        columns = {
+            name: np.concatenate([np.zeros(0)] + [profile[name] for profile in profiles if profile is not None])
+            for name in names
+        }
+        return cls(offsets, columns)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> dict[str, np.ndarray]:
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        return {name: column[start:stop] for name, column in self.columns.items()}
+
+    def save(self, path) -> Path:
+        return save_columns(path, {'offsets': self.offsets} | self.columns, kind='profiles')
+
+    @classmethod
+    def load(cls, path, mmap: bool=True) -> "Profiles":
+        columns = load_columns(path, mmap)
+        return cls(columns.pop('offsets'), columns)
@@ -0,0 +1,86 @@
+import math
+
+import geotech_module.axial as axial
+import geotech_module.pieu as pieu
+import geotech_module.soil as soil
+import geotech_module.utils as utils
+
+
+sol_1 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_2 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+
+pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25)
+
+
+def test_solve_mid_displacement():
+    qs, kt, kappa = 0.2, 40., 1e-4
+    for rhs in [-0.05, -0.002, 0.0, 0.001, 0.004, 0.05]:
+        w, tau = axial.solve_mid_displacement(rhs, kappa, qs, kt)
+        assert math.isclose(tau, utils.skin_friction_law(w, qs, kt), abs_tol=1e-12)
+        assert math.isclose(w - kappa * tau, rhs, abs_tol=1e-12)
+
+def test_slice_kernel_directions():
+    args = (0.25, 2.5, 5000., 0.1, 20.)
+    Q_top, w_top, _, _ = axial.slice_kernel("bottom_to_top", 0.5, 0.002, *args)
+    Q_bott, w_bott, _, _ = axial.slice_kernel("top_to_bottom", Q_top, w_top, *args)
+    assert math.isclose(Q_bott, 0.5, rel_tol=1e-9)
+    assert math.isclose(w_bott, 0.002, rel_tol=1e-9)
+
+def test_mesh_layers():
+    assert pile.mesh.n_slices == len(pile.slices)
+    assert list(pile.mesh.layer[:20]) == [0] * 20
+    assert list(pile.mesh.layer[20:]) == [1] * 20
+
+def test_equilibre_top_down():
+    w_head, (Q_base, w_base), slices = pile.equilibre_top_down_Qtete(1.5)
+    assert math.isclose(slices[0].Q_top, 1.5, rel_tol=1e-9)
+    assert math.isclose(Q_base, pile.tip_law.reaction(w_base), abs_tol=1.5e-5)
+    assert w_head > w_base > 0
+
+def test_equilibre_bottom_up():
+    Q_head, dz_pointe, dz_head, slices = pile.equilibre_dz_pointe(0.005)
+    w_head, (Q_base, w_base), _ = pile.equilibre_top_down_Qtete(Q_head)
+    assert math.isclose(w_head, dz_head, rel_tol=1e-4)
+    assert math.isclose(w_base, dz_pointe, rel_tol=1e-4)
+
+def test_elastic_transfer_layers():
+    transfer = pile.elastic_transfer
+    assert len(transfer.layer_matrices) == 2
+    assert transfer.mid_rows.shape == (pile.mesh.n_slices, 2)
+
+def test_elastic_fast_path():
+    fast = pile.elastic_transfer.solve(pile.tip_law, 0.3)
+    assert fast is not None
+    w_head, Q_base, w_base, _ = axial.equilibre_top_down(pile.mesh, pile.tip_law, 0.3, tol_Q=1e-9)
+    assert math.isclose(fast[0], w_head, rel_tol=1e-6)
+    assert math.isclose(fast[1], Q_base, rel_tol=1e-6)
+
+def test_elastic_fast_path_fallback():
+    assert pile.elastic_transfer.solve(pile.tip_law, 3.0) is None
+
+def test_richardson_extrapolation():
+    h = [0.4, 0.2, 0.1]
+    f = [3.0 + 2.0 * x**2 for x in h]
+    f_0, order = axial.richardson_extrapolation(h, f)
+    assert math.isclose(f_0, 3.0)
+    assert math.isclose(order, 2.0)
+
+def test_layer_table():
+    table = pile.mesh.layer_table()
+    assert len(table) == 2
+    assert math.isclose(table[0][1], -5.0)
+    assert math.isclose(table[1][1], -10.0)
+
+def test_integrate_layer_elastic():
+    # Couche sans frottement : Q constant, w linéaire
+    Q, w, n_eval, _, _ = axial.integrate_layer(1.0, 0.01, 5.0, 2.5, 5000., 0.0, 20.)
+    assert math.isclose(Q, 1.0)
+    assert math.isclose(w, 0.01 - 5.0 / 5000.)
+    assert n_eval < 20
+
+def test_equilibre_ode():
+    w_ref = pile.convergence_study(2.5).w_head_extrapolated
+    w_head, (Q_base, w_base), slices = pile.equilibre_top_down_Qtete(2.5, engine="ode", tol_Q=1e-9, rtol=1e-8)
+    assert math.isclose(w_head, w_ref, rel_tol=1e-6)
+    _, _, n_eval, _ = axial.integrate_top_down(pile.mesh, 2.5, w_head, rtol=1e-6)
+    assert n_eval < pile.mesh.n_slices
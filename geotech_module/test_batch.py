@@ -0,0 +1,77 @@
+import math
+import numpy as np
+import pytest
+
+import geotech_module.batch as batch
+import geotech_module.pieu as pieu
+import geotech_module.soil as soil
+
+
+sol_1 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_2 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+sol_3 = soil.Soil("Argiles", 0.0, -7.0, 'Q2', 0.4, 0.8, 6.0, 2/3, 'fin', 'fin')
+sol_4 = soil.Soil("Sables", -7.0, -15.0, 'Q3', 1.2, 2.0, 15.0, 1/3, 'granulaire', 'granulaire')
+boreholes = {'SP1': [sol_1, sol_2], 'SP2': [sol_3, sol_4]}
+
+loads = [
+    pieu.Torseur(0., 0., 0.8, 0., 0., 'Durable', 'ELS_QP'),
+    pieu.Torseur(0., 0., 1.2, 0., 0., 'Durable', 'ELU'),
+    pieu.Torseur(0., 0., -0.2, 0., 0., 'Transitoire', 'ELU'),
+]
+schedule = [
+    batch.PileSpec('P1', 'SP1', 0.0, -10.0, 0.8, 0.8, 3, loads),
+    batch.PileSpec('P2', 'SP2', -0.5, -11.3, 0.6, 0.6, 6, loads),
+    batch.PileSpec('P3', 'SP1', -0.5, -8.3, 0.6, 0.6, 1, loads[:2]),
+    batch.PileSpec('P4', 'SP2', 0.0, -9.0, 1.0, 1.0, 3),
+]
+
+
+def test_capacity_and_settlement():
+    for spec in schedule:
+        pile = pieu.Pile(spec.category, spec.level_top, spec.level_bott, spec.Eb, spec.Dp, spec.Ds,
+                         boreholes[spec.borehole], spec.thickness)
+        cache = batch.BoreholeCache(boreholes[spec.borehole])
+        capacity = cache.capacity(spec)
+        for name in ['ple_etoile', 'hauteur_encastrement_effective', 'kp_util', 'resistance_pointe', 'resistance_skin_friction',
+                     'portance_ELS_QP', 'portance_ELU_Str', 'traction_ELS_Car', 'traction_ELU_Acc']:
+            assert math.isclose(getattr(capacity, name), getattr(pile, name), rel_tol=1e-12)
+        assert math.isclose(cache.settlement(spec, capacity, 0.8)[0], pile.equilibre_top_down_Qtete(0.8)[0], rel_tol=1e-9)
+
+def test_run_site():
+    table = batch.run_site(schedule, boreholes, max_workers=1)
+    assert list(table) == batch.COLUMNS
+    assert list(table['id']) == ['P1', 'P2', 'P3', 'P4']
+    assert list(table['borehole']) == ['SP1', 'SP2', 'SP1', 'SP2']
+    assert np.allclose(table['Q_els'][:3], 0.8) and np.isnan(table['Q_els'][3]) and np.isnan(table['w_els'][3])
+    assert table['comb'][3] == '' and np.isnan(table['utilisation'][3])
+    capacity = batch.BoreholeCache(boreholes['SP1']).capacity(schedule[0])
+    expected = max(0.8 / capacity.portance_ELS_QP, 1.2 / capacity.portance_ELU_Str, 0.2 / abs(capacity.traction_ELU_Str))
+    assert math.isclose(table['utilisation'][0], expected)
+
+    pool = batch.run_site(schedule, boreholes, max_workers=2)
+    for name in ['utilisation', 'w_els', 'Rb', 'Rs']:
+        assert np.allclose(pool[name], table[name], equal_nan=True)
+
+def test_missing_borehole():
+    with pytest.raises(KeyError):
+        batch.run_site([batch.PileSpec('P1', 'SP9', 0.0, -10.0, 0.8, 0.8, 3)], boreholes)
+
+def test_save_and_load_site(tmp_path):
+    table, profiles = batch.run_site(schedule, boreholes, max_workers=1, profiles=True)
+    assert len(profiles) == 4 and len(profiles[3]['z_top']) == 0
+    pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, boreholes['SP1'], 0.20)
+    _, _, slices = pile.equilibre_top_down_Qtete(0.8)
+    assert np.allclose(profiles[0]['Q_top'], [sl.Q_top for sl in slices])
+    assert np.allclose(profiles[0]['dz_top'], [sl.dz_top for sl in slices])
+
+    batch.save_site(tmp_path / 'site', schedule, table, profiles)
+    study = batch.load_site(tmp_path / 'site')
+    assert study.schedule == schedule
+    assert list(study.results) == batch.COLUMNS
+    assert isinstance(study.results['Rs'], np.memmap)
+    for name in ['Rb', 'Rs', 'utilisation', 'w_els']:
+        assert np.allclose(study.results[name], table[name], equal_nan=True)
+    assert list(study.results['comb']) == list(table['comb'])
+    for i in range(len(profiles)):
+        for name in batch.PROFILE_COLUMNS:
+            assert np.array_equal(study.profiles[i][name], profiles[i][name])
@@ -0,0 +1,64 @@
+import math
+import numpy as np
+
+import geotech_module.geometry as geometry
+import geotech_module.pieu as pieu
+import geotech_module.soil as soil
+
+
+sol_1 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_2 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+
+section = geometry.Section(10_000, 0.8, 0.8)
+section_2 = geometry.Section(10_000, 0.8, 0.8, Iz=0.05, Eb_flexion=20_000)
+
+
+def test_section_defaults():
+    assert section.B == 0.8
+    assert math.isclose(section.Iz, math.pi * 0.8**4 / 64)
+    assert section.Eb_flexion == 10_000
+    assert math.isclose(section.EA, 10_000 * math.pi * 0.8**2 / 4)
+
+def test_split():
+    geo = geometry.PileGeometry([0.0, -3.0, -10.0], [section, section_2])
+    assert geo.split(-2.0, -5.0) == [(-2.0, -3.0, section), (-3.0, -5.0, section_2)]
+    assert geo.split(-5.0, -10.0) == [(-5.0, -10.0, section_2)]
+    assert not geo.is_uniform
+
+def test_invalid_levels():
+    try:
+        geometry.PileGeometry([0.0, -3.0, -3.0], [section, section_2])
+    except ValueError:
+        pass
+    else:
+        assert False
+
+def test_tip_section_mismatch():
+    geo = geometry.PileGeometry([0.0, -3.0, -10.0], [section, geometry.Section(10_000, 0.6, 0.6)])
+    try:
+        pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25, geometry=geo)
+    except ValueError:
+        pass
+    else:
+        assert False
+
+def test_segmented_pile_mesh():
+    geo = geometry.PileGeometry([0.0, -3.0, -10.0], [section, section_2])
+    pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25, geometry=geo)
+    assert any(math.isclose(sl.z_bottom, -3.0) for sl in pile.slices)
+    for sl in pile.slices:
+        expected = section if sl.z_middle > -3.0 else section_2
+        assert math.isclose(sl.EI, expected.EI)
+    model = pile.get_transverse_model()
+    assert math.isclose(model.EI[0], section.EI) and math.isclose(model.EI[-1], section_2.EI)
+
+def test_uniform_segments():
+    geo = geometry.PileGeometry([0.0, -3.0, -10.0], [section, section])
+    pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25, geometry=geo)
+    reference = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25)
+    res = pile.transverse_analysis(0.1, 0.05)
+    res_ref = reference.transverse_analysis(0.1, 0.05)
+    assert np.allclose(res.deflection, res_ref.deflection)
+    w_head, _, _ = pile.equilibre_top_down_Qtete(1.5)
+    w_ref, _, _ = reference.equilibre_top_down_Qtete(1.5)
+    assert math.isclose(w_head, w_ref, rel_tol=1e-9)
@@ -0,0 +1,97 @@
+import math
+import numpy as np
+import pytest
+
+import geotech_module.group as group
+import geotech_module.pieu as pieu
+import geotech_module.soil as soil
+
+
+sol_1 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_2 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+
+pile_1 = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25)
+stiffness = group.PileStiffness.from_pile(pile_1)
+
+# Chevêtre de 3 x 2 pieux, entraxe 2.4 m, centré sur le point d'application des torseurs
+x, y = np.meshgrid([-2.4, 0., 2.4], [-1.2, 1.2])
+cap = group.PileGroup(x.ravel(), y.ravel(), [stiffness] * 6)
+
+
+def equilibrium(result, loads):
+    f = result.forces
+    return np.array([
+        f[..., 0].sum(-1) - loads[:, 0],
+        f[..., 1].sum(-1) - loads[:, 1],
+        f[..., 2].sum(-1) - loads[:, 2],
+        (f[..., 3] + f[..., 2] * cap.y).sum(-1) - loads[:, 3],
+        (f[..., 4] - f[..., 2] * cap.x).sum(-1) - loads[:, 4],
+        (f[..., 1] * cap.x - f[..., 0] * cap.y).sum(-1) - loads[:, 5],
+    ])
+
+def test_head_stiffness():
+    model = pile_1.get_transverse_model()
+    result = model.solve(0.1, 0.05)
+    H, M = stiffness.lateral @ [result.deflection[0], result.rotation[0]]
+    assert math.isclose(H, 0.1, rel_tol=1e-8) and math.isclose(M, 0.05, rel_tol=1e-8)
+
+def test_centred_load():
+    result = cap.solve(np.array([[0., 0., 6.0, 0., 0., 0.]]))
+    assert np.allclose(result.nz, 1.0)
+    assert math.isclose(result.displacement[0, 2], 1.0 / stiffness.axial)
+
+def test_equilibrium():
+    loads = np.array([
+        [0.3, -0.2, 9.0, 1.5, -2.0, 0.4],
+        [0.0, 0.1, 3.0, 0.0, 4.0, 0.0],
+    ])
+    for nonlinear in (False, True):
+        result = cap.solve(loads, nonlinear=nonlinear)
+        assert result.converged.all()
+        assert np.abs(equilibrium(result, loads)).max() < 1e-10
+    # Moment my : les pieux du côté x < 0 sont les plus chargés
+    assert result.nz[1, 0] > result.nz[1, 1] > result.nz[1, 2]
+
+def test_nonlinear():
+    torseurs = [pieu.Torseur(0., 0., nz, 0., 0.5, 'durable', 'ELU') for nz in (1.0, 12.0)]
+    linear = cap.solve(torseurs)
+    nonlinear = cap.solve(torseurs, nonlinear=True)
+    # Charges faibles : réponse élastique ; charges élevées : tassement supérieur à la réponse élastique
+    assert np.allclose(nonlinear.displacement[0], linear.displacement[0], rtol=1e-4)
+    assert nonlinear.iterations[1] > 0 and nonlinear.displacement[1, 2] > linear.displacement[1, 2]
+    w = nonlinear.displacement[1, 2] + nonlinear.displacement[1, 3] * cap.y - nonlinear.displacement[1, 4] * cap.x
+    assert np.allclose(nonlinear.nz[1], stiffness.axial_load(w), rtol=1e-5)
+
+def test_pinned_heads():
+    pinned = group.PileGroup(cap.x, cap.y, [group.PileStiffness.from_pile(pile_1, head='articulee')] * 6)
+    result = pinned.solve(np.array([[0.6, 0., 6.0, 0., 0., 0.]]))
+    assert np.allclose(result.forces[0, :, 4], 0.) and np.allclose(result.forces[0, :, 0], 0.1)
+
+def test_interaction_factors():
+    r0, rm = group.pile_radii(pile_1)
+    assert r0 == 0.4 and rm > 0
+    alpha = group.interaction_factors(np.array([0.4, 1.0, 2.0, rm, 2 * rm]), r0, rm)
+    assert alpha[0] == 1.0 and 1.0 > alpha[1] > alpha[2] > 0. and alpha[3] == alpha[4] == 0.
+
+def test_group_settlement():
+    settlement = group.GroupSettlement.from_piles([pile_1] * 6, cap.x, cap.y)
+    alpha = settlement.alpha
+    spacing = np.hypot(cap.x[:, None] - cap.x, cap.y[:, None] - cap.y)
+    expected = group.interaction_factors(spacing, settlement.r0[0], settlement.rm[0])
+    assert np.allclose(alpha, np.where(spacing == 0., 1., expected), atol=1e-3) and np.allclose(alpha, alpha.T)
+
+    loads = np.full((1, 6), 0.5)
+    flexible = settlement.settlements(loads)
+    w_single = stiffness.axial_settlement(0.5)[0]
+    assert np.allclose(flexible.settlement, w_single + 0.5 / stiffness.axial * (alpha.sum(axis=1) - 1))
+
+    rigid = settlement.rigid_cap([3.0, 9.0])
+    assert rigid.converged.all()
+    assert np.allclose(rigid.load.sum(axis=1), [3.0, 9.0])
+    # Chevêtre rigide : les pieux d'angle sont plus chargés que les pieux centraux
+    assert rigid.load[0, 0] > rigid.load[0, 1]
+    assert np.allclose(settlement.settlements(rigid.load).settlement, rigid.settlement)
+
+    coincident = group.GroupSettlement.from_piles([pile_1] * 2, np.zeros(2), np.zeros(2))
+    with pytest.raises(ValueError):
+        coincident.rigid_cap([3.0])
@@ -0,0 +1,144 @@
+import io
+import math
+import numpy as np
+
+import geotech_module.loads as loads
+import geotech_module.pieu as pieu
+import geotech_module.soil as soil
+
+
+sol_1 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_2 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+
+pile_1 = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25)
+pile_2 = pieu.Pile(3, 0.0, -8.0, 10_000, 0.6, 0.6, [sol_1, sol_2], 0.25)
+
+torseurs = [
+    pieu.Torseur(0., 0., 1.0, 0., 0., 'durable', 'els_QP'),
+    pieu.Torseur(0., 0., 1.5, 0., 0., 'Durable', 'ELS_CAR'),
+    pieu.Torseur(0., 0., 2.0, 0., 0., 'durable', 'ELU'),
+    pieu.Torseur(0., 0., -0.5, 0., 0., 'transitoire', 'ELU'),
+    pieu.Torseur(0., 0., 2.5, 0., 0., 'sismiques', 'ELA'),
+    pieu.Torseur(0., 0., 9.0, 0., 0., 'sismiques', 'ELU'),
+]
+
+
+def test_valid():
+    table = loads.TorseurTable.from_torseurs(torseurs)
+    assert list(table.valid) == [t.check_comb() for t in torseurs]
+
+def test_check_capacities():
+    table = loads.TorseurTable.from_torseurs(torseurs)
+    check = loads.check_capacities(table, {'P1': pile_1})
+    assert math.isclose(check.utilisation[0], 1.0 / pile_1.portance_ELS_QP)
+    assert math.isclose(check.utilisation[2], 2.0 / pile_1.portance_ELU_Str)
+    assert math.isclose(check.utilisation[3], 0.5 / abs(pile_1.traction_ELU_Str)) and check.utilisation[3] > 0
+    assert math.isclose(check.utilisation[4], 2.5 / pile_1.portance_ELU_Acc)
+    assert np.isnan(check.utilisation[5])
+    ratios = [check.utilisation[i] for i in range(5)]
+    index, ratio, comb = check.governing()['P1']
+    assert index == int(np.argmax(ratios)) and math.isclose(ratio, max(ratios))
+    assert comb == loads.COMBS[table.comb[index]]
+
+def test_uplift_governs():
+    uplift = 2 * abs(pile_1.traction_ELU_Str)
+    table = loads.TorseurTable.from_columns(
+        ['P1'] * 2, *np.zeros((2, 2)), [2.0, -uplift], *np.zeros((2, 2)), ['Durable'] * 2, ['ELU'] * 2,
+    )
+    check = loads.check_capacities(table, pile_1)
+    assert math.isclose(check.utilisation[1], 2.0)
+    assert check.governing()['P1'] == (1, check.utilisation[1], 'ELU')
+
+def test_several_piles():
+    table = loads.TorseurTable.concatenate([
+        loads.TorseurTable.from_torseurs(torseurs[:3], 'P1'),
+        loads.TorseurTable.from_torseurs(torseurs[:3], 'P2'),
+    ])
+    governing = loads.check_capacities(table, {'P1': pile_1, 'P2': pile_2}).governing()
+    assert governing['P1'][0] in (0, 1, 2) and governing['P2'][0] in (3, 4, 5)
+    assert governing['P2'][1] > governing['P1'][1]
+
+def test_large_table():
+    n = 100_000
+    rng = np.random.default_rng(0)
+    table = loads.TorseurTable.from_columns(
+        rng.choice(['P1', 'P2'], n), *np.zeros((2, n)), rng.uniform(-1, 3, n), *np.zeros((2, n)),
+        rng.choice(['Durable', 'Transitoire'], n), rng.choice(['ELS_QP', 'ELS_CAR', 'ELU'], n),
+    )
+    check = loads.check_capacities(table, {'P1': pile_1, 'P2': pile_2})
+    assert np.all(check.table.valid)
+    governing = check.governing()
+    for name in ['P1', 'P2']:
+        mask = table.pile == name
+        assert math.isclose(governing[name][1], check.utilisation[mask].max())
+
+def test_read_torseur_csv():
+    text = (
+        "Poteau;Cas;Fx;Fy;Fz;Mx;My\n"
+        "P1;G+Q;10,0;0;1500,0;0;0\n"
+        "P1;ELU_1;12,5;;2000;0;0\n"
+        "P2;ELU_2;0;0;-500;0;0\n"
+        "P2;ELA_S;0;0;2500;0;0\n"
+        "P2;inconnu;0;0;100;0;0\n"
+    )
+    columns = {'pile': 'Poteau', 'case': 'Cas', 'hx': 'Fx', 'hy': 'Fy', 'nz': 'Fz', 'mx': 'Mx', 'my': 'My'}
+    cases = {
+        'G+Q': ('Durable', 'ELS_CAR'),
+        'ELU_1': ('Durable', 'ELU'),
+        'ELU_2': ('Transitoire', 'ELU'),
+        'ELA_S': ('Sismiques', 'ELA'),
+    }
+    chunks = list(loads.read_torseur_csv(io.StringIO(text), columns, cases, scale=1e-3, decimal=',', chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    table = loads.TorseurTable.concatenate(chunks)
+    assert list(table.pile) == ['P1', 'P1', 'P2', 'P2', 'P2']
+    assert np.allclose(table.nz, [1.5, 2.0, -0.5, 2.5, 0.1]) and np.allclose(table.hx, [0.01, 0.0125, 0, 0, 0])
+    assert list(table.valid) == [True, True, True, True, False]
+
+    governing = loads.governing_from_csv(
+        io.StringIO(text), {'P1': pile_1, 'P2': pile_2}, columns=columns, cases=cases, scale=1e-3, decimal=',',
+        chunk_size=2
+    )
+    check = loads.check_capacities(table, {'P1': pile_1, 'P2': pile_2})
+    assert governing == check.governing()
+
+def test_csv_uplift_governs():
+    uplift = 2000 * abs(pile_1.traction_ELU_Str)
+    text = f"pile;nz;situation;comb\nP1;1500;Durable;ELU\nP1;{-uplift};Durable;ELU\n"
+    governing = loads.governing_from_csv(io.StringIO(text), pile_1, scale=1e-3)
+    row, ratio, comb = governing['P1']
+    assert row == 1 and comb == 'ELU' and math.isclose(ratio, 2.0)
+
+def test_csv_unknown_delimiter():
+    try:
+        list(loads.read_torseur_csv(io.StringIO("nz\n1.0\n")))
+    except ValueError:
+        pass
+    else:
+        assert False
+
+def test_single_pile():
+    table = loads.TorseurTable.from_torseurs(torseurs[:3], ['A', 'B', 'C'])
+    check = loads.check_capacities(table, pile_1)
+    piles = {'A': pile_1, 'B': pile_1, 'C': pile_1}
+    assert np.allclose(check.utilisation, loads.check_capacities(table, piles).utilisation)
+
+def test_load_envelope():
+    nz = [1.0, 1.4, 1.2, -0.3, -0.6, 2.0, 1.1, 50.0, 3.0]
+    combs = ['ELS_QP', 'ELS_QP', 'ELS_QP', 'ELS_QP', 'ELS_QP', 'ELU', 'ELS_CAR', 'ELS_CAR', 'ELA']
+    table = loads.TorseurTable.from_columns(['P1'] * 9, *np.zeros((2, 9)), nz, *np.zeros((2, 9)), ['Durable'] * 9, combs)
+    envelope = loads.load_envelope(table, pile_1, ['ELS_QP', 'ELS_CAR'])
+    assert list(envelope.kept) == [1, 4, 6]
+    pruned = envelope.pruned
+    assert pruned[0] == pruned[2] == "Dominée en compression par la ligne 1"
+    assert pruned[3] == "Dominée en traction par la ligne 4"
+    assert pruned[5] == 'Combinaison non étudiée'
+    assert pruned[7].startswith('Rupture')
+    assert pruned[8] == 'Combinaison invalide'
+
+    settlements = loads.envelope_settlements(table, pile_1, ['ELS_QP', 'ELS_CAR'])
+    assert np.isnan(settlements.w_head[[0, 2, 3, 5, 7, 8]]).all()
+    w_0 = pile_1.equilibre_top_down_Qtete(1.0)[0]
+    assert 0 < w_0 < settlements.w_head[1]
+    uplift, settlement = settlements.governing()['P1']
+    assert uplift == settlements.w_head[4] < 0 and settlement == settlements.w_head[1]
@@ -1,5 +1,7 @@
 import math
+import pytest
 
+import geotech_module.axial as axial
 import geotech_module.pieu as pieu
 import geotech_module.soil as soil
 
@@ -34,6 +36,11 @@ def test_set_dz_bott():
 def test_set_dz_middle():
     assert troncon.dz_middle == 0.011
 
+def test_linear_spring():
+    assert math.isclose(troncon.linear_spring(0.25, 'long terme'), troncon.linear_spring(0.25) / 2)
+    with pytest.raises(ValueError):
+        troncon.linear_spring(0.25, 'accidentel')
+
 def test_categorie_pieu():
     assert troncon.pile_category == 19
 
@@ -68,8 +75,42 @@ def test_perimetre():
     actual = round(troncon.perimetre, 6)
     assert math.isclose(expected, actual)
 
-def test_ksi_a():
-    pass
-
-def test_ksi_b():
-    assert math.isclose(troncon.ksi_b, 2.77777777778e-6)
+def test_equilibre():
+    tranche = pieu.SlicePile(z_top=0., delta_h=0.1, soil=sol_1, data_pieu=data_pieu, Q_bott=0.5)
+    Q_top, dz_top = tranche.equilibre(0.01)
+    expected = axial.slice_kernel(
+        "bottom_to_top", 0.5, 0.01,
+        0.1, tranche.perimetre, tranche.Eb * tranche.section_pointe, tranche.qs_lim, tranche.module_kt,
+    )
+    assert (Q_top, dz_top, tranche.dz_middle, tranche.qs) == expected
+    assert math.isclose(tranche.Q_middle, (Q_top + 0.5) / 2)
+
+sol_2 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_3 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+
+def test_maillage_adaptatif():
+    pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_2, sol_3], 0.05)
+    w_fine = pile.equilibre_top_down_Qtete(2.5, tol_Q=1e-10)[0]
+    report = pile.maillage_adaptatif(2.5, tol_w=1e-6, thickness_max=2.0)
+    assert report.converged
+    assert report.n_slices == len(pile.slices) < 200
+    assert math.isclose(report.w_head, w_fine, abs_tol=1e-6)
+    with pytest.raises(ValueError):
+        pile.maillage_adaptatif(2.5, max_iter=0)
+
+def test_convergence_study():
+    pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_2, sol_3], 0.05)
+    etude = pile.convergence_study(0.5, tol=1e-3)
+    assert etude.n_slices == [14, 26, 50, 100, 200]
+    assert math.isclose(etude.w_head_extrapolated, 0.00169149, rel_tol=1e-5)
+    assert etude.recommended == 0.80
+    assert len(pile.slices) == 200
+
+def test_slices_stable():
+    pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_2, sol_3], 0.5)
+    slices = pile.slices
+    assert pile.slices is slices
+    _, _, states = pile.equilibre_top_down_Qtete(1.0)
+    assert states is slices and math.isclose(slices[0].Q_top, 1.0)
+    pile.set_mesh(pile.maillage_pieu(0.25))
+    assert pile.slices is not slices and len(pile.slices) == 40
@@ -0,0 +1,54 @@
+import math
+import numpy as np
+
+import geotech_module.site as site
+from geotech_module.soil import LogPressio, SP2
+
+
+SP1 = LogPressio(
+    [98., 96., 94., 92., 90., 88., 86., 84., 82.],
+    [0.50, 0.60, 0.70, 0.70, 0.90, 1.00, 1.20, 1.30, 1.40],
+    [0.80, 0.95, 1.10, 1.20, 1.50, 1.60, 1.90, 2.10, 2.30],
+    [5.0, 6.0, 7.5, 8.0, 10.0, 11.0, 13.0, 14.0, 16.0],
+)
+model = site.SiteModel([
+    site.Borehole('SP1', 0.0, 0.0, SP1),
+    site.Borehole('SP2', 20.0, 0.0, SP2),
+    site.Borehole('SP3', 0.0, 30.0, SP2),
+])
+
+
+def test_borehole_location():
+    log = model.log_at(0.0, 0.0)
+    for level in [97.0, 93.0, 85.5]:
+        assert math.isclose(log.pl_at_level(level), SP1.pl_at_level(level))
+        assert math.isclose(log.Em_at_level(level), SP1.Em_at_level(level))
+
+def test_inverse_distance():
+    two = site.SiteModel(model.boreholes[:2], n_neighbours=2)
+    log = two.log_at(10.0, 5.0)
+    for level in [96.0, 90.0, 84.0]:
+        assert math.isclose(log.pl_at_level(level), (SP1.pl_at_level(level) + SP2.pl_at_level(level)) / 2)
+    log = two.log_at(5.0, 0.0)
+    expected = (SP1.pf_at_level(90.0) / 5**2 + SP2.pf_at_level(90.0) / 15**2) / (1 / 5**2 + 1 / 15**2)
+    assert math.isclose(log.pf_at_level(90.0), expected)
+
+def test_vectorized():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-10, 40, 2000), rng.uniform(-10, 40, 2000)
+    profiles = model.profiles(x, y)
+    assert profiles['pl'].shape == (2000, len(model.levels))
+    for i in [0, 999, 1999]:
+        log = model.log_at(x[i], y[i])
+        assert np.allclose(profiles['Em'][i], log.cb_Em)
+
+def test_soils_at():
+    layers = [
+        site.Layer('Limons', 97.0, 91.0, 'Q2', 2/3, 'fin', 'fin'),
+        site.Layer('Marnes', 91.0, 81.0, 'Q4', 1/2, 'fin', 'fin'),
+    ]
+    soils = model.soils_at([5.0, 12.0], [5.0, 3.0], layers)
+    assert len(soils) == 2 and [s.name for s in soils[0]] == ['Limons', 'Marnes']
+    log = model.log_at(12.0, 3.0)
+    assert math.isclose(soils[1][0].pl, log.pression_limite_moyenne_ngf(97.0, 91.0))
+    assert math.isclose(soils[1][1].Em, log.module_pressio_moyen_ngf(91.0, 81.0))
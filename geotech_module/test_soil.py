@@ -1,18 +1,20 @@
 import math
+import numpy as np
 import soil
+import geotech_module.utils as utils
 
 courbe_x = [0, 2, 4, 6, 8, 10]
 courbe_y = [3, 2, 5, 4, 6, 2]
 
 def test_integrale_courbe():
-    assert math.isclose(soil.trapezoidal_integration(courbe_x, courbe_y, 3, 8), 23.25)
-    assert math.isclose(soil.trapezoidal_integration(courbe_x, courbe_y, 0, 10), 39.)
-    assert math.isclose(soil.trapezoidal_integration(courbe_x, courbe_y, 4, 4.1), 0.4975)
+    assert math.isclose(utils.trapezoidal_integration(courbe_x, courbe_y, 3, 8), 23.25)
+    assert math.isclose(utils.trapezoidal_integration(courbe_x, courbe_y, 0, 10), 39.)
+    assert math.isclose(utils.trapezoidal_integration(courbe_x, courbe_y, 4, 4.1), 0.4975)
 
 def test_valeur_moyenne():
-    assert math.isclose(soil.mean_value(courbe_x, courbe_y, 3, 8), 4.65)
-    assert math.isclose(soil.mean_value(courbe_x, courbe_y, 0, 10), 3.9)
-    assert math.isclose(soil.mean_value(courbe_x, courbe_y, 4, 4.1), 4.975)
+    assert math.isclose(utils.mean_value(courbe_x, courbe_y, 3, 8), 4.65)
+    assert math.isclose(utils.mean_value(courbe_x, courbe_y, 0, 10), 3.9)
+    assert math.isclose(utils.mean_value(courbe_x, courbe_y, 4, 4.1), 4.975)
 
 sol_1 = soil.Soil("Remblais",               0.0, -1.00, 'Q1', 0.0, 0.0, 5., 2/3, 'fin')
 sol_2 = soil.Soil("Argiles",               -1.0, -8.00, 'Q2', 0.8, 1.2, 8., 2/3, 'fin')
@@ -82,3 +84,34 @@ def test_module_kf():
     assert math.isclose(round(sol_2.module_kf(0.80), 2), 32.14)
     assert math.isclose(round(sol_3.module_kf(0.80), 2), 24.11)
     assert math.isclose(round(sol_4.module_kf(0.80), 2), 40.18)
+
+def test_segment_log():
+    levels = [100.0 - i for i in range(30)]
+    pl = [0.8] * 10 + [2.0] * 8 + [3.5] * 12
+    log = soil.LogPressio(levels, [0.6 * p for p in pl], pl, [10 * p for p in pl])
+    assert soil.segment_log(log) == [(100.0, 90.5), (90.5, 82.5), (82.5, 71.0)]
+    assert soil.segment_log(log, n_layers=2) == [(100.0, 90.5), (90.5, 71.0)]
+    layers = soil.segment_log(log, min_thickness=10.0)
+    assert all(level_sup - level_inf >= 10.0 for level_sup, level_inf in layers)
+
+def test_auto_layering():
+    sols = soil.auto_layering(soil.SP2, n_layers=3, min_thickness=3.0, courbe_frottement='Q4', friction_type='fin')
+    assert len(sols) == 3 and sols[0].level_sup == 97.0 and sols[-1].level_inf == 80.5
+    assert all(a.level_inf == b.level_sup for a, b in zip(sols[:-1], sols[1:]))
+    for sol in sols:
+        assert sol.courbe_frottement == 'Q4' and sol.friction_type == 'fin'
+        assert math.isclose(sol.pl, soil.SP2.pression_limite_moyenne_ngf(sol.level_sup, sol.level_inf))
+
+def test_log_pressio_means():
+    log = soil.SP2
+    levels_1 = [97.0, 96.3, 90.0, 85.2, 99.0]
+    levels_2 = [95.5, 88.1, 89.0, 78.0, 81.0]
+    means = log.pression_limite_moyenne_ngf(np.array(levels_1), np.array(levels_2))
+    for mean, level_1, level_2 in zip(means, levels_1, levels_2):
+        z1, z2 = log.top_level - level_1, log.top_level - level_2
+        assert math.isclose(mean, utils.mean_value(log.depths, log.cb_pl, z1, z2))
+        assert math.isclose(log.pression_limite_moyenne_ngf(level_1, level_2), mean)
+        assert math.isclose(log.pression_fluage_moyenne_ngf(level_1, level_2), utils.mean_value(log.depths, log.cb_pf, z1, z2))
+        assert math.isclose(log.module_pressio_moyen_z(z1, z2), utils.mean_value(log.depths, log.cb_Em, z1, z2))
+    assert math.isnan(log.pression_limite_moyenne_ngf(90.0, 90.0))
+    assert isinstance(log.cb_pl, tuple)
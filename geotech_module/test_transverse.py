@@ -0,0 +1,202 @@
+import math
+import numpy as np
+
+import geotech_module.pieu as pieu
+import geotech_module.soil as soil
+import geotech_module.transverse as transverse
+import geotech_module.utils as utils
+
+
+sol_1 = soil.Soil("Marnes", 0.0, -5.0, 'Q4', 0.7, 1.0, 5.0, 2/3, 'granulaire', 'fin')
+sol_2 = soil.Soil("Marnes", -5.0, -12.0, 'Q4', 2.5, 5.0, 20.0, 1/2, 'granulaire', 'fin')
+
+pile = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.25)
+
+
+def test_assemble_banded():
+    model = transverse.TransverseModel(np.array([0., -1., -3.]), 2.0, np.array([0., 5., 1.]))
+    ab = model.assemble_banded()
+    K = np.zeros((model.n_dof, model.n_dof))
+    for e, k in enumerate(model.element_matrices()):
+        K[2 * e:2 * e + 4, 2 * e:2 * e + 4] += k
+    K[0::2, 0::2] += np.diag(model.springs)
+    for i in range(model.n_dof):
+        for j in range(i, min(model.n_dof, i + transverse.BANDWIDTH + 1)):
+            assert math.isclose(ab[transverse.BANDWIDTH + i - j, j], K[i, j], abs_tol=1e-12)
+
+def test_unstable_model():
+    model = transverse.TransverseModel(np.array([0., -1., -2.]), 1.0, np.array([0., 0., 0.]))
+    try:
+        model.factorize()
+    except ValueError:
+        pass
+    else:
+        assert False
+
+def test_equilibrium():
+    res = pile.transverse_analysis(0.1, 0.05, 'court terme')
+    assert math.isclose(res.soil_reaction.sum(), 0.1, rel_tol=1e-9)
+    assert math.isclose(res.moment[0], 0.05, rel_tol=1e-9)
+    assert math.isclose(res.shear[0], 0.1, rel_tol=1e-9)
+
+def test_pynite_cross_check():
+    for situation in ['court terme', 'long terme', 'elu', 'sismique']:
+        res = pile.transverse_analysis(0.1, 0.05, situation)
+        ref = pile.transverse_analysis(0.1, 0.05, situation, backend='pynite')
+        assert np.allclose(res.z, ref.z)
+        assert np.allclose(res.deflection, ref.deflection, rtol=1e-8, atol=1e-12)
+        assert np.allclose(res.rotation, ref.rotation, rtol=1e-8, atol=1e-12)
+        assert np.allclose(res.moment, ref.moment, rtol=1e-8, atol=1e-10)
+        assert np.allclose(res.soil_reaction, ref.soil_reaction, rtol=1e-8, atol=1e-10)
+
+def test_lateral_laws():
+    laws = transverse.LateralLaws.from_slices(pile.slices, 'elu')
+    v = np.linspace(-0.2, 0.2, 41)
+    for i, sl in enumerate(pile.slices[::7]):
+        node = 1 + 7 * i
+        for dy in v:
+            p_ref = sl.horizontal_soil_pressure_spring(dy, 0.8, 'elu')
+            assert math.isclose(laws.reaction(np.full(laws.q1.shape, dy))[node], p_ref, abs_tol=1e-12)
+
+def test_nonlinear_small_load_is_linear():
+    res_lin = pile.transverse_analysis(0.05, 0., 'court terme')
+    res, report = pile.transverse_analysis_nonlinear(0.05, 0., 'court terme')
+    assert report.converged
+    assert np.allclose(res.deflection, res_lin.deflection, rtol=1e-9, atol=1e-15)
+
+def test_nonlinear_equilibrium():
+    for method in ['tangent', 'secant']:
+        res, report = pile.transverse_analysis_nonlinear(1.5, 0.3, 'elu', method=method)
+        assert report.converged
+        assert math.isclose(res.soil_reaction.sum(), 1.5, rel_tol=1e-6)
+    assert len(report.iterations) == 5
+
+def test_nonlinear_fine_mesh():
+    fine = pieu.Pile(3, 0.0, -10.0, 10_000, 0.8, 0.8, [sol_1, sol_2], 0.01)
+    res, report = fine.transverse_analysis_nonlinear(2.0, 0.3, 'court terme')
+    assert report.converged
+    assert sum(report.iterations) <= 10
+
+def test_curves_at_stations():
+    model = pile.get_fe_model(0.1, 0.05, 'court terme')
+    model.analyze_linear()
+    member = model.Members['pile']
+    stations = np.linspace(0.0, -10.0, 37)
+    z, moment, shear, deflection = utils.get_model_curves(model, stations=stations)
+    for i, level in enumerate(z):
+        x = min(-level, member.L())
+        assert math.isclose(moment[i], member.moment('Mz', x), rel_tol=1e-7, abs_tol=1e-10)
+        assert math.isclose(deflection[i], member.deflection('dy', x), rel_tol=1e-7, abs_tol=1e-13)
+    z, pressure = utils.get_soil_pressure(model)
+    assert len(z) == len(pressure) == len(pile.slices) + 2
+    assert math.isclose(pressure.sum(), 0.1, rel_tol=1e-9)
+
+def test_solve_cases():
+    H = np.array([0.1, -0.2, 0.05, 0.0])
+    M = np.array([0.05, 0.1, -0.3, 0.2])
+    results = pile.transverse_analysis_cases(H, M, 'long terme')
+    assert len(results) == 4
+    assert results.moment.shape == (4, len(pile.slices) + 2)
+    for i in range(4):
+        single = pile.transverse_analysis(H[i], M[i], 'long terme')
+        assert np.allclose(results[i].deflection, single.deflection, rtol=1e-12, atol=1e-16)
+        assert np.allclose(results[i].moment, single.moment, rtol=1e-12, atol=1e-14)
+    minimum, maximum = results.envelope()
+    assert np.all(minimum.moment <= results.moment) and np.all(results.moment <= maximum.moment)
+    assert results.governing('moment') == 2
+
+def test_torseur_cases():
+    torseurs = [
+        pieu.Torseur(0.1, 0.2, 1.0, 0.03, 0.05, 'durable', 'ELU'),
+        pieu.Torseur(-0.1, 0.0, 1.0, 0.0, 0.02, 'durable', 'ELS_QP'),
+    ]
+    results_x = pile.transverse_analysis_torseurs(torseurs, plane='xz')
+    results_y = pile.transverse_analysis_torseurs(torseurs, plane='yz')
+    assert np.allclose(results_x[0].moment, pile.transverse_analysis(0.1, 0.05).moment)
+    assert np.allclose(results_y[0].moment, pile.transverse_analysis(0.2, -0.03).moment)
+
+def test_biaxial():
+    torseurs = [
+        pieu.Torseur(0.1, 0.2, 1.0, 0.03, 0.05, 'durable', 'ELU'),
+        pieu.Torseur(-0.1, 0.0, 1.0, 0.0, 0.02, 'durable', 'ELS_QP'),
+        pieu.Torseur(0.03, -0.04, 1.0, 0.0, 0.0, 'durable', 'ELS_CAR'),
+    ]
+    results = pile.transverse_analysis_biaxial(torseurs)
+    assert len(results) == 3
+    res_x = pile.transverse_analysis(0.1, 0.05)
+    res_y = pile.transverse_analysis(0.2, -0.03)
+    assert np.allclose(results.moment[0], np.hypot(res_x.moment, res_y.moment))
+    # Cas 3 : effort purement horizontal de 0.05 (3-4-5) dans une direction oblique
+    assert np.allclose(results.deflection[2], np.abs(pile.transverse_analysis(0.05, 0.).deflection))
+    z, deflection, moment, shear = results.envelope()
+    assert np.all(moment >= results.moment[1])
+    assert results.governing('moment') == 0
+
+def test_all_situations():
+    results = pile.transverse_analysis_situations([0.1, 0.2], [0.05, 0.0])
+    assert list(results) == pieu.SITUATIONS
+    for situation, res in results.items():
+        single = pile.transverse_analysis(0.2, 0.0, situation)
+        assert np.allclose(res[1].deflection, single.deflection, rtol=1e-12, atol=1e-16)
+    # Mêmes ressorts à court terme et à l'ELU : même modèle, même factorisation
+    assert pile.get_transverse_model('elu') is pile.get_transverse_model('court terme')
+    assert pile.get_transverse_model('sismique').beam_band() is pile.get_transverse_model('court terme').beam_band()
+
+def test_buckling_euler():
+    # Poteau bi-articulé (ressorts très raides aux extrémités) : P_cr = pi^2 EI / L^2
+    EI, L, n = 100.0, 10.0, 100
+    springs = np.zeros(n + 1)
+    springs[0] = springs[-1] = 1e9
+    model = transverse.TransverseModel(-np.linspace(0.0, L, n + 1), EI, springs)
+    buckling = model.buckling(1.0)
+    assert math.isclose(buckling.load_factor, math.pi**2 * EI / L**2, rel_tol=1e-6)
+    assert math.isclose(np.abs(buckling.mode).max(), 1.0)
+
+def test_pdelta():
+    N = pile.axial_forces(1.5)
+    assert len(N) == len(pile.slices) + 1
+    assert 1.4 < N[0] <= 1.5 and N[-1] < N[0]
+    res_1 = pile.transverse_analysis(0.1, 0.05)
+    res_2 = pile.transverse_analysis(0.1, 0.05, axial_load=1.5)
+    assert res_2.deflection[0] > res_1.deflection[0]
+    assert math.isclose(res_2.soil_reaction.sum(), 0.1, rel_tol=1e-9)
+    buckling = pile.flambement(1.5)
+    assert buckling.load_factor > 1.0
+    res_nl, report = pile.transverse_analysis_nonlinear(0.1, 0.05, axial_load=1.5)
+    assert report.converged
+    assert np.allclose(res_nl.deflection, res_2.deflection)
+
+def test_pushover():
+    curve = pile.pushover(0.2, 40, 'elu')
+    assert curve.converged
+    assert np.all(np.diff(curve.head_load) > 0)
+    # Point de la courbe retrouvé par un calcul piloté en force
+    res, _ = pile.transverse_analysis_nonlinear(curve.head_load[19], 0., 'elu')
+    assert math.isclose(res.deflection[0], curve.head_deflection[19], rel_tol=1e-6)
+    assert np.all(np.diff(curve.plastic_depth) >= 0)
+    load = curve.load_at_plastic_depth(1.0)
+    assert load is not None and load < curve.head_load[-1]
+    assert curve.load_at_plastic_depth(100.0) is None
+
+def test_critical_length():
+    model = pile.get_transverse_model()
+    curve = model.critical_length(0.1, 0.05)
+    for j in [10, 25, len(model.z) - 1]:
+        truncated = transverse.TransverseModel(model.z[:j + 1], model.EI[:j], model.springs[:j + 1])
+        res = truncated.solve(0.1, 0.05)
+        assert math.isclose(curve.head_deflection[j - 1], res.deflection[0], rel_tol=1e-8)
+        assert math.isclose(curve.head_rotation[j - 1], res.rotation[0], rel_tol=1e-8)
+    singular = transverse.TransverseModel(model.z, model.EI, model.springs)
+    singular.head_stiffness_by_length = lambda: np.zeros((len(model.z) - 1, 2, 2))
+    try:
+        singular.critical_length(0.1, 0.05)
+    except ValueError:
+        pass
+    else:
+        assert False
+    lengths = pile.longueur_critique(0.1, 0.05)
+    assert list(lengths) == pieu.SITUATIONS
+    for critical in lengths.values():
+        assert 0 < critical.critical_length <= 10.0
+        longer = critical.lengths >= critical.critical_length
+        assert np.all(np.abs(critical.head_deflection[longer] / critical.head_deflection[-1] - 1) <= 0.01)
@@ -63,3 +63,14 @@ def test_loi_effort_pointe():
     assert math.isclose(utils.end_bearing_law(0.01, 200, 5000), 50)
     assert math.isclose(utils.end_bearing_law(0.07, 200, 5000), 150)
     assert math.isclose(utils.end_bearing_law(0.15, 200, 5000), 200)
+
+def test_prefix_integral():
+    a = [0.0, -1.0, -1.0, -8.0, -8.0, -12.0, -12.0, -20.0]
+    b = [0.0, 0.0, 1.2, 1.2, 0.8, 0.8, 1.8, 1.8]
+    courbe = utils.PrefixIntegral(a, b)
+    for x1, x2 in [(0.0, -20.0), (-0.5, -9.0), (-8.0, -8.5), (2.0, -25.0), (-3.0, -13.0)]:
+        assert math.isclose(courbe.integral(x2, x1), utils.trapezoidal_integration(a, b, x1, x2))
+        assert math.isclose(courbe.integral(x1, x2), -courbe.integral(x2, x1))
+        assert math.isclose(courbe.mean(x1, x2), utils.mean_value(a, b, x1, x2))
+    assert math.isclose(utils.PrefixIntegral(a, [-y for y in b]).integral(-20.0, 0.0), -26.0)
+    assert math.isnan(courbe.mean(-3.0, -3.0))
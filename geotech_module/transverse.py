@@ -0,0 +1,691 @@
+from dataclasses import dataclass
+import numpy as np
+from scipy.linalg import cholesky_banded, cho_solve_banded
+
+
+# Demi-largeur de bande de la matrice de rigidité (2 ddl par noeud : déplacement v et rotation dv/dx)
+BANDWIDTH = 3
+NONLINEAR_METHODS = ("tangent", "secant")
+
+
+def banded_matvec(ab: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """
+    Produit K u pour une matrice symétrique stockée en bande supérieure (ab[bw + i - j, j] = K[i, j]).
+    """
+    bw = ab.shape[0] - 1
+    y = ab[bw] * u
+    for d in range(1, bw + 1):
+        y[:-d] += ab[bw - d, d:] * u[d:]
+        y[d:] += ab[bw - d, d:] * u[:-d]
+    return y
+
+
+@dataclass
+class LateralLaws:
+    """
+    Lois p-y tri-linéaires (symétriques) de l'ensemble des noeuds du modèle transversal :
+        - q1, k1:   Palier et raideur de la première branche
+        - q2, k2:   Palier et raideur de la seconde branche (q2 = q1 pour une loi bi-linéaire)
+    Les noeuds sans ressort (tête et pointe) ont q1 = k1 = 0.
+    """
+    q1: np.ndarray
+    k1: np.ndarray
+    q2: np.ndarray
+    k2: np.ndarray
+
+    def __post_init__(self):
+        self.q1 = np.asarray(self.q1, dtype=float)
+        self.k1 = np.asarray(self.k1, dtype=float)
+        self.q2 = np.asarray(self.q2, dtype=float)
+        self.k2 = np.asarray(self.k2, dtype=float)
+        active = self.k1 > 0
+        self.s1 = np.divide(self.q1, self.k1, out=np.zeros_like(self.q1), where=active)
+        hardening = active & (self.q2 > self.q1) & (self.k2 > 0)
+        self.s2 = self.s1 + np.divide(self.q2 - self.q1, self.k2, out=np.zeros_like(self.q1), where=hardening)
+
+    @classmethod
+    def from_slices(cls, slices: list, situation: str='court terme') -> "LateralLaws":
+        """
+        Lois construites à partir de SlicePile.lateral_law (largeur B de chaque tranche), sur les mêmes noeuds
+        que TransverseModel.from_slices.
+        """
+        params = [(0., 0., 0., 0.)]
+        for sl in slices:
+            q1, k1, q2, k2 = sl.lateral_law(sl.B, situation)
+            params.append((q1, k1, q1, 0.) if q2 is None else (q1, k1, q2, k2))
+        params.append((0., 0., 0., 0.))
+        return cls(*np.array(params).T)
+
+    @property
+    def capacity(self) -> float:
+        """
+        Réaction latérale maximale mobilisable (somme des paliers).
+        """
+        return float(self.q2.sum())
+
+    def reaction(self, v: np.ndarray) -> np.ndarray:
+        a = np.abs(v)
+        p = np.where(a <= self.s1, self.k1 * a, np.where(a <= self.s2, self.q1 + (a - self.s1) * self.k2, self.q2))
+        return np.sign(v) * p
+
+    def tangent(self, v: np.ndarray) -> np.ndarray:
+        a = np.abs(v)
+        return np.where(a <= self.s1, self.k1, np.where(a <= self.s2, self.k2, 0.))
+
+    def secant(self, v: np.ndarray) -> np.ndarray:
+        a = np.abs(v)
+        return np.where(a > self.s1, np.divide(self.reaction(a), a, out=np.zeros_like(a), where=a > 0), self.k1)
+
+
+@dataclass
+class NonlinearReport:
+    """
+    Suivi de la résolution non linéaire : itérations par pas de chargement et résidu final (relatif).
+    """
+    method: str
+    iterations: list[int]
+    residual: float
+    converged: bool
+
+    def __str__(self) -> str:
+        status = "convergé" if self.converged else "non convergé"
+        return f"{self.method} : {len(self.iterations)} pas, {sum(self.iterations)} itérations, résidu {self.residual:.1e} ({status})"
+
+
+@dataclass
+class TransverseResult:
+    """
+    Résultats du modèle transversal aux noeuds (ordre haut -> bas) :
+        - z:                Niveau des noeuds
+        - deflection:       Déplacement horizontal
+        - rotation:         Rotation dv/dx (x = profondeur depuis la tête)
+        - moment:           Moment fléchissant
+        - shear:            Effort tranchant juste sous le noeud
+        - soil_reaction:    Réaction du ressort de sol au noeud
+    Conventions identiques à celles du modèle PyNite (utils.build_pile) : en tête, le moment vaut
+    le moment appliqué et l'effort tranchant vaut la force horizontale appliquée.
+    """
+    z: np.ndarray
+    deflection: np.ndarray
+    rotation: np.ndarray
+    moment: np.ndarray
+    shear: np.ndarray
+    soil_reaction: np.ndarray
+
+    def curves(self, stations: np.ndarray|None=None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Courbes (z, moment, effort tranchant, déplacement) aux noeuds ou aux niveaux stations, sans requête
+        élément par élément. Sans chargement réparti sur les éléments, les valeurs sont exactes : moment
+        linéaire, effort tranchant constant et déplacement cubique (fonctions de Hermite) sur chaque élément.
+        """
+        if stations is None:
+            return self.z.copy(), self.moment.copy(), self.shear.copy(), self.deflection.copy()
+        z = np.atleast_1d(np.asarray(stations, dtype=float))
+        x_nodes = self.z[0] - self.z
+        x = self.z[0] - z
+        e = np.clip(np.searchsorted(x_nodes, x, side='right') - 1, 0, len(x_nodes) - 2)
+        L = x_nodes[e + 1] - x_nodes[e]
+        xi = (x - x_nodes[e]) / L
+        moment = self.moment[e] + (self.moment[e + 1] - self.moment[e]) * xi
+        shear = self.shear[e]
+        deflection = (
+            (1 - 3 * xi**2 + 2 * xi**3) * self.deflection[e]
+            + L * (xi - 2 * xi**2 + xi**3) * self.rotation[e]
+            + (3 * xi**2 - 2 * xi**3) * self.deflection[e + 1]
+            + L * (xi**3 - xi**2) * self.rotation[e + 1]
+        )
+        return z, moment, shear, deflection
+
+    def soil_pressure(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Réactions des ressorts de sol et niveaux des noeuds correspondants.
+        """
+        return self.z.copy(), self.soil_reaction.copy()
+
+
+@dataclass
+class TransverseResults:
+    """
+    Résultats empilés de plusieurs cas de charge : tableaux (n_cas, n_noeuds), mêmes conventions
+    que TransverseResult.
+    """
+    z: np.ndarray
+    deflection: np.ndarray
+    rotation: np.ndarray
+    moment: np.ndarray
+    shear: np.ndarray
+    soil_reaction: np.ndarray
+
+    def __len__(self) -> int:
+        return self.deflection.shape[0]
+
+    def __getitem__(self, case: int) -> TransverseResult:
+        return TransverseResult(
+            self.z, self.deflection[case], self.rotation[case], self.moment[case], self.shear[case], self.soil_reaction[case],
+        )
+
+    def envelope(self) -> tuple[TransverseResult, TransverseResult]:
+        """
+        Enveloppes (minimum, maximum) de chaque grandeur, noeud par noeud, sur l'ensemble des cas.
+        """
+        fields = (self.deflection, self.rotation, self.moment, self.shear, self.soil_reaction)
+        minimum = TransverseResult(self.z, *(f.min(axis=0) for f in fields))
+        maximum = TransverseResult(self.z, *(f.max(axis=0) for f in fields))
+        return minimum, maximum
+
+    def governing(self, quantity: str='moment') -> int:
+        """
+        Indice du cas de charge donnant la plus grande valeur absolue de la grandeur sur la hauteur du pieu.
+        """
+        return int(np.abs(getattr(self, quantity)).max(axis=1).argmax())
+
+
+@dataclass
+class BiaxialResults:
+    """
+    Résultats de flexion déviée : cas de charge empilés dans les plans xz (hx, my) et yz (hy, -mx).
+    Les grandeurs résultantes sont les normes des vecteurs (plan xz, plan yz) à chaque noeud.
+    """
+    xz: TransverseResults
+    yz: TransverseResults
+
+    def __len__(self) -> int:
+        return len(self.xz)
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.xz.z
+
+    @property
+    def deflection(self) -> np.ndarray:
+        return np.hypot(self.xz.deflection, self.yz.deflection)
+
+    @property
+    def moment(self) -> np.ndarray:
+        return np.hypot(self.xz.moment, self.yz.moment)
+
+    @property
+    def shear(self) -> np.ndarray:
+        return np.hypot(self.xz.shear, self.yz.shear)
+
+    def envelope(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Enveloppes des grandeurs résultantes sur la hauteur du pieu : (z, déplacement, moment, effort tranchant).
+        """
+        return self.z, self.deflection.max(axis=0), self.moment.max(axis=0), self.shear.max(axis=0)
+
+    def governing(self, quantity: str='moment') -> int:
+        """
+        Indice du cas de charge donnant la plus grande valeur résultante de la grandeur.
+        """
+        return int(getattr(self, quantity).max(axis=1).argmax())
+
+
+@dataclass
+class PushoverCurve:
+    """
+    Courbe de poussée progressive (pilotage en déplacement en tête) :
+        - head_deflection:  Déplacement imposé en tête à chaque pas
+        - head_load:        Effort horizontal en tête correspondant
+        - plastic_depth:    Hauteur de pieu sur laquelle la réaction du sol atteint pl (si demandée)
+        - iterations:       Itérations de Newton par pas
+        - converged:        Convergence de tous les pas
+    """
+    head_deflection: np.ndarray
+    head_load: np.ndarray
+    plastic_depth: np.ndarray
+    iterations: list[int]
+    converged: bool
+
+    def load_at_plastic_depth(self, depth: float) -> float|None:
+        """
+        Premier effort en tête pour lequel la réaction atteint pl sur au moins la hauteur depth (None sinon).
+        """
+        reached = np.nonzero(self.plastic_depth >= depth)[0]
+        return float(self.head_load[reached[0]]) if len(reached) else None
+
+
+@dataclass
+class CriticalLength:
+    """
+    Réponse en tête du pieu en fonction de sa longueur (pieu tronqué à chaque noeud, pointe libre) :
+        - lengths:          Longueur du pieu (tête -> noeud de troncature)
+        - head_deflection:  Déplacement en tête (nan si le pieu tronqué est instable)
+        - head_rotation:    Rotation en tête
+        - critical_length:  Plus petite longueur au-delà de laquelle le déplacement en tête ne varie plus
+                            de plus de tol (relatif) par rapport au pieu complet
+    """
+    lengths: np.ndarray
+    head_deflection: np.ndarray
+    head_rotation: np.ndarray
+    critical_length: float
+    tol: float
+
+
+@dataclass
+class BucklingResult:
+    """
+    Flambement du pieu sous une distribution d'efforts normaux N(z) :
+        - load_factor:  Facteur critique lambda (charge critique = lambda N)
+        - z:            Niveau des noeuds
+        - mode:         Déformée modale (déplacements normés à 1)
+        - iterations:   Nombre d'itérations inverses
+    """
+    load_factor: float
+    z: np.ndarray
+    mode: np.ndarray
+    iterations: int
+
+
+@dataclass
+class TransverseModel:
+    """
+    Poutre d'Euler-Bernoulli sur appuis élastiques (ressorts de Winkler), tête et pointe libres.
+        - z:        Niveau des noeuds (décroissant) : tête, milieux des tranches, pointe
+        - EI:       Rigidité en flexion de chaque élément (len(z) - 1 valeurs)
+        - springs:  Raideur du ressort de sol à chaque noeud
+        - axial_forces: Effort normal de chaque élément (compression positive), pris en compte par la
+                        rigidité géométrique (effet P-Delta) ; None pour une analyse au premier ordre
+    La matrice de rigidité est stockée sous forme de bande symétrique (demi-largeur 3) et
+    factorisée une seule fois (Cholesky en bande, O(n)).
+    """
+    z: np.ndarray
+    EI: np.ndarray
+    springs: np.ndarray
+    axial_forces: np.ndarray|None=None
+
+    def __post_init__(self):
+        self.z = np.asarray(self.z, dtype=float)
+        self.EI = np.broadcast_to(np.asarray(self.EI, dtype=float), (len(self.z) - 1,)).copy()
+        self.springs = np.asarray(self.springs, dtype=float)
+        if self.axial_forces is not None:
+            self.axial_forces = np.broadcast_to(np.asarray(self.axial_forces, dtype=float), (len(self.z) - 1,)).copy()
+        self.x = self.z[0] - self.z
+        self.L = np.diff(self.x)
+        self._factor = None
+        self._beam_band = None
+
+    @classmethod
+    def from_slices(cls, slices: list, situation: str='court terme') -> "TransverseModel":
+        """
+        Modèle transversal construit sur le maillage des tranches de pieu (mêmes noeuds que utils.build_pile),
+        les ressorts étant donnés par SlicePile.linear_spring. Chaque élément entre deux milieux de tranches
+        reçoit la rigidité équivalente en série des deux demi-tranches (exacte pour une section uniforme).
+        """
+        z = [slices[0].z_top] + [sl.z_middle for sl in slices] + [slices[-1].z_bottom]
+        h = np.array([sl.delta_h for sl in slices]) / 2
+        flex = h / np.array([sl.EI for sl in slices])
+        EI = np.r_[h[0] / flex[0], (h[:-1] + h[1:]) / (flex[:-1] + flex[1:]), h[-1] / flex[-1]]
+        return cls(np.array(z), EI, cls.springs_from_slices(slices, situation))
+
+    @staticmethod
+    def springs_from_slices(slices: list, situation: str='court terme') -> np.ndarray:
+        """
+        Raideurs des ressorts de sol aux noeuds (nulles en tête et en pointe).
+        """
+        return np.array([0.0] + [sl.linear_spring(sl.B, situation) for sl in slices] + [0.0])
+
+    def with_springs(self, springs: np.ndarray) -> "TransverseModel":
+        """
+        Modèle de même géométrie avec d'autres ressorts : la partie poutre de la matrice assemblée est partagée.
+        """
+        model = TransverseModel(self.z, self.EI, springs, self.axial_forces)
+        model._beam_band = self.beam_band()
+        return model
+
+    def with_axial_forces(self, axial_forces: np.ndarray) -> "TransverseModel":
+        """
+        Modèle de même géométrie et mêmes ressorts, avec la rigidité géométrique des efforts normaux donnés
+        (par élément, compression positive).
+        """
+        return TransverseModel(self.z, self.EI, self.springs, axial_forces)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.z)
+
+    @property
+    def n_dof(self) -> int:
+        return 2 * self.n_nodes
+
+    def element_matrices(self) -> np.ndarray:
+        """
+        Matrices de rigidité élémentaires (Hermite), ddl [v_i, t_i, v_j, t_j] : tableau (n_elements, 4, 4)
+        """
+        L = self.L
+        c = self.EI / L**3
+        k = np.empty((len(L), 4, 4))
+        k[:, 0] = np.stack([12 * c, 6 * L * c, -12 * c, 6 * L * c], axis=1)
+        k[:, 1] = np.stack([6 * L * c, 4 * L**2 * c, -6 * L * c, 2 * L**2 * c], axis=1)
+        k[:, 2] = -k[:, 0]
+        k[:, 3] = np.stack([6 * L * c, 2 * L**2 * c, -6 * L * c, 4 * L**2 * c], axis=1)
+        if self.axial_forces is not None:
+            k -= self.geometric_matrices(self.axial_forces)
+        return k
+
+    def geometric_matrices(self, axial_forces: np.ndarray) -> np.ndarray:
+        """
+        Matrices de rigidité géométrique élémentaires (cohérentes, Hermite) pour un effort normal de compression N :
+        K = K_flexion - N G_e, avec G_e = 1 / (30 L) [[36, 3L, -36, 3L], [3L, 4L², -3L, -L²], ...]
+        """
+        L = self.L
+        c = np.broadcast_to(np.asarray(axial_forces, dtype=float), L.shape) / (30 * L)
+        g = np.empty((len(L), 4, 4))
+        g[:, 0] = np.stack([36 * c, 3 * L * c, -36 * c, 3 * L * c], axis=1)
+        g[:, 1] = np.stack([3 * L * c, 4 * L**2 * c, -3 * L * c, -L**2 * c], axis=1)
+        g[:, 2] = -g[:, 0]
+        g[:, 3] = np.stack([3 * L * c, -L**2 * c, -3 * L * c, 4 * L**2 * c], axis=1)
+        return g
+
+    def _band_from_elements(self, k: np.ndarray) -> np.ndarray:
+        """
+        Assemblage de matrices élémentaires (n_elements, 4, 4) au format bande supérieure.
+        """
+        ab = np.zeros((BANDWIDTH + 1, self.n_dof))
+        first = 2 * np.arange(len(self.L))
+        for a in range(4):
+            for b in range(a, 4):
+                np.add.at(ab[BANDWIDTH + a - b], first + b, k[:, a, b])
+        return ab
+
+    def assemble_banded(self, springs: np.ndarray|None=None) -> np.ndarray:
+        """
+        Matrice de rigidité globale au format bande supérieure de scipy (ab[u + i - j, j] = K[i, j]).
+        """
+        if springs is None:
+            springs = self.springs
+        ab = self.beam_band().copy()
+        ab[BANDWIDTH, 0::2] += springs
+        return ab
+
+    def beam_band(self) -> np.ndarray:
+        """
+        Partie poutre (sans ressorts) de la matrice de rigidité en bande, assemblée une seule fois.
+        """
+        if self._beam_band is None:
+            self._beam_band = self._band_from_elements(self.element_matrices())
+        return self._beam_band
+
+    def factorize(self):
+        """
+        Factorisation de Cholesky en bande de la matrice de rigidité (conservée pour les résolutions suivantes).
+        """
+        if self._factor is None:
+            try:
+                self._factor = cholesky_banded(self.assemble_banded())
+            except np.linalg.LinAlgError:
+                raise ValueError(
+                    "Modèle transversal instable : les ressorts de sol ne retiennent pas le pieu "
+                    "ou l'effort normal dépasse la charge critique de flambement."
+                )
+        return self._factor
+
+    def buckling(self, axial_forces: np.ndarray, tol: float=1e-10, max_iter: int=200) -> "BucklingResult":
+        """
+        Charge critique de flambement : plus petit facteur lambda tel que K - lambda G(N) soit singulière,
+        G(N) étant la rigidité géométrique de la distribution d'efforts normaux N (compression positive).
+        Itération inverse sur la factorisation en bande de K : K x_k+1 = G x_k, lambda = quotient de Rayleigh.
+        """
+        factor = self.factorize()
+        G = self._band_from_elements(self.geometric_matrices(axial_forces))
+        x = np.zeros(self.n_dof)
+        x[0::2] = 1.0
+        load_factor = np.inf
+        for it in range(1, max_iter + 1):
+            y = cho_solve_banded((factor, False), banded_matvec(G, x))
+            Gy = banded_matvec(G, y)
+            yGy = y @ Gy
+            if yGy <= 0:
+                raise ValueError("La distribution d'efforts normaux ne provoque pas de flambement (traction).")
+            new_factor = (y @ banded_matvec(self.assemble_banded(), y)) / yGy
+            x = y / np.sqrt(yGy)
+            if abs(new_factor - load_factor) <= tol * abs(new_factor):
+                load_factor = new_factor
+                break
+            load_factor = new_factor
+        mode = x[0::2] / np.abs(x[0::2]).max()
+        return BucklingResult(float(load_factor), self.z.copy(), mode, it)
+
+    def load_vector(self, horizontal_force: float, bending_moment: float) -> np.ndarray:
+        F = np.zeros(self.n_dof)
+        F[0] = horizontal_force
+        F[1] = bending_moment
+        return F
+
+    def load_matrix(self, horizontal_forces: np.ndarray, bending_moments: np.ndarray) -> np.ndarray:
+        """
+        Seconds membres de plusieurs cas de charge, en colonnes : tableau (n_dof, n_cas).
+        """
+        horizontal_forces, bending_moments = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(horizontal_forces, dtype=float)),
+            np.atleast_1d(np.asarray(bending_moments, dtype=float)),
+        )
+        F = np.zeros((self.n_dof, len(horizontal_forces)))
+        F[0] = horizontal_forces
+        F[1] = bending_moments
+        return F
+
+    def solve(self, horizontal_force: float, bending_moment: float) -> TransverseResult:
+        """
+        Résout le modèle pour une force horizontale et un moment fléchissant appliqués en tête.
+        """
+        u = cho_solve_banded((self.factorize(), False), self.load_vector(horizontal_force, bending_moment))
+        return self.results(u)
+
+    def solve_cases(self, horizontal_forces: np.ndarray, bending_moments: np.ndarray) -> "TransverseResults":
+        """
+        Résout tous les cas de charge (H_i, M_i) en une seule descente-remontée sur la factorisation,
+        tous les seconds membres étant traités ensemble.
+        """
+        U = cho_solve_banded((self.factorize(), False), self.load_matrix(horizontal_forces, bending_moments))
+        return TransverseResults(self.z.copy(), *self._nodal_fields(U.T))
+
+    def solve_biaxial(
+            self,
+            hx: np.ndarray,
+            my: np.ndarray,
+            hy: np.ndarray,
+            mx: np.ndarray,
+        ) -> BiaxialResults:
+        """
+        Flexion déviée d'un pieu de section de révolution (mêmes raideurs dans les deux plans) : les cas
+        des plans xz (hx, my) et yz (hy, -mx) sont résolus ensemble sur une seule factorisation.
+        """
+        hx, my, hy, mx = np.broadcast_arrays(*(np.atleast_1d(np.asarray(a, dtype=float)) for a in (hx, my, hy, mx)))
+        n_cases = len(hx)
+        F = np.hstack([self.load_matrix(hx, my), self.load_matrix(hy, -mx)])
+        U = cho_solve_banded((self.factorize(), False), F).T
+        return BiaxialResults(
+            TransverseResults(self.z.copy(), *self._nodal_fields(U[:n_cases])),
+            TransverseResults(self.z.copy(), *self._nodal_fields(U[n_cases:])),
+        )
+
+    def solve_nonlinear(
+            self,
+            horizontal_force: float,
+            bending_moment: float,
+            laws: LateralLaws,
+            method: str='tangent',
+            n_steps: int=1,
+            tol: float=1e-8,
+            max_iter: int=50,
+        ) -> tuple[TransverseResult, NonlinearReport]:
+        """
+        Résolution avec les lois p-y non linéaires, chargement appliqué en n_steps pas égaux.
+            - method = 'tangent': Newton-Raphson, raideurs tangentes (raideur sécante si la matrice tangente
+              n'est pas définie positive, ressorts plastifiés)
+            - method = 'secant': itérations à raideurs sécantes
+        A chaque itération, la matrice en bande est réassemblée et factorisée (coût O(n)).
+        """
+        if method not in NONLINEAR_METHODS:
+            raise ValueError(f"method doit être l'une des valeurs {NONLINEAR_METHODS}")
+        if abs(horizontal_force) >= laws.capacity:
+            raise ValueError("Effort horizontal supérieur à la réaction latérale mobilisable du sol.")
+        u = np.zeros(self.n_dof)
+        iterations = []
+        residual = 0.
+        converged = True
+        for step in range(1, n_steps + 1):
+            F = self.load_vector(horizontal_force, bending_moment) * step / n_steps
+            norm_F = max(np.linalg.norm(F), 1e-300)
+            for it in range(1, max_iter + 1):
+                factor, k, offset = self._linearize(laws, u[0::2], method)
+                rhs = F.copy()
+                rhs[0::2] -= offset
+                u = cho_solve_banded((factor, False), rhs)
+                # Le système linéarisé est résolu exactement : le résidu d'équilibre se réduit à l'écart
+                # entre la réaction linéarisée et la loi p-y (sans perte de précision sur les maillages fins)
+                v = u[0::2]
+                residual = np.linalg.norm(offset + k * v - laws.reaction(v)) / norm_F
+                if residual <= tol:
+                    break
+            else:
+                converged = False
+            iterations.append(it)
+        result = self.results(u, laws.reaction(u[0::2]))
+        return result, NonlinearReport(method, iterations, residual, converged)
+
+    def _linearize(self, laws: LateralLaws, v: np.ndarray, method: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Linéarisation des lois p-y autour de v (p ~ offset + k v) et factorisation de la matrice correspondante.
+        La raideur sécante remplace la raideur tangente si la matrice tangente n'est pas définie positive.
+        """
+        k = laws.tangent(v) if method == "tangent" else laws.secant(v)
+        try:
+            factor = cholesky_banded(self.assemble_banded(k))
+        except np.linalg.LinAlgError:
+            k = laws.secant(v)
+            try:
+                factor = cholesky_banded(self.assemble_banded(k))
+            except np.linalg.LinAlgError:
+                raise ValueError("Modèle transversal instable : perte de rigidité du système pieu-sol.")
+        return factor, k, laws.reaction(v) - k * v
+
+    def pushover(
+            self,
+            laws: LateralLaws,
+            head_deflections: np.ndarray,
+            moment_ratio: float=0.,
+            limit_reactions: np.ndarray|None=None,
+            heights: np.ndarray|None=None,
+            method: str='tangent',
+            tol: float=1e-8,
+            max_iter: int=50,
+        ) -> "PushoverCurve":
+        """
+        Courbe effort - déplacement en tête par pilotage en déplacement : pour chaque déplacement imposé en tête,
+        l'effort H (et le moment M = moment_ratio * H) est une inconnue supplémentaire (système bordé).
+        Chaque pas part de la solution du pas précédent ; les deux seconds membres de chaque itération sont
+        résolus sur la même factorisation.
+        Avec limit_reactions (réaction correspondant à pl à chaque noeud) et heights (hauteur associée à chaque
+        noeud), la hauteur de pieu sur laquelle la réaction atteint pl est suivie à chaque pas.
+        """
+        pattern = self.load_vector(1.0, moment_ratio)
+        u = np.zeros(self.n_dof)
+        load = 0.
+        loads, deflections, plastic_depths, iterations = [], [], [], []
+        converged = True
+        for target in np.asarray(head_deflections, dtype=float):
+            for it in range(1, max_iter + 1):
+                factor, k, offset = self._linearize(laws, u[0::2], method)
+                rhs = np.zeros((self.n_dof, 2))
+                rhs[0::2, 0] = -offset
+                rhs[:, 1] = pattern
+                a, b = cho_solve_banded((factor, False), rhs).T
+                load = (target - a[0]) / b[0]
+                u = a + load * b
+                v = u[0::2]
+                residual = np.linalg.norm(offset + k * v - laws.reaction(v)) / max(abs(load), 1e-300)
+                if residual <= tol:
+                    break
+            else:
+                converged = False
+            loads.append(load)
+            deflections.append(target)
+            iterations.append(it)
+            if limit_reactions is not None:
+                reached = np.abs(laws.reaction(u[0::2])) >= (1 - 1e-9) * limit_reactions
+                plastic_depths.append(float(heights[reached & (limit_reactions > 0)].sum()))
+        return PushoverCurve(
+            np.array(deflections), np.array(loads), np.array(plastic_depths), iterations, converged,
+        )
+
+    def head_stiffness(self) -> np.ndarray:
+        """
+        Matrice de rigidité en tête du pieu (2 x 2, ddl v et dv/dx), inverse de la souplesse obtenue
+        par les deux cas unitaires (H = 1, M = 0) et (H = 0, M = 1) sur la factorisation.
+        """
+        U = cho_solve_banded((self.factorize(), False), self.load_matrix([1., 0.], [0., 1.]))
+        return np.linalg.inv(U[:2])
+
+    def head_stiffness_by_length(self) -> np.ndarray:
+        """
+        Matrices de rigidité en tête (2 x 2, ddl v et dv/dx) du pieu tronqué à chacun des noeuds 1 à n - 1 :
+        tableau (n_noeuds - 1, 2, 2). Un seul balayage de haut en bas condense au fur et à mesure le noeud
+        courant sur les ddl de tête et du noeud suivant (matrices 6 x 6), soit un coût O(n) au total.
+        """
+        k = self.element_matrices()
+        springs = self.springs
+        S = k[0].copy()
+        S[0, 0] += springs[0]
+        S[2, 2] += springs[1]
+        stack = [S]
+        T = np.zeros((6, 6))
+        keep = [0, 1, 4, 5]
+        for e in range(1, len(k)):
+            T[:] = 0.
+            T[:4, :4] = S
+            T[2:, 2:] += k[e]
+            T[4, 4] += springs[e + 1]
+            S = T[np.ix_(keep, keep)] - T[np.ix_(keep, [2, 3])] @ np.linalg.solve(T[2:4, 2:4], T[np.ix_([2, 3], keep)])
+            stack.append(S)
+        S = np.array(stack)
+        # Pointe libre : condensation du dernier noeud
+        return S[:, :2, :2] - S[:, :2, 2:] @ np.linalg.solve(S[:, 2:, 2:], S[:, 2:, :2])
+
+    def critical_length(self, horizontal_force: float, bending_moment: float, tol: float=0.01) -> CriticalLength:
+        """
+        Longueur critique (efficace) du pieu sous l'effort H et le moment M en tête, à partir de la réponse
+        en tête pour toutes les longueurs (head_stiffness_by_length).
+        ValueError si la réponse du pieu complet (référence) ne peut pas être calculée (matrice mal conditionnée).
+        """
+        K = self.head_stiffness_by_length()
+        F = np.array([horizontal_force, bending_moment])
+        deflection = np.full(len(K), np.nan)
+        rotation = np.full(len(K), np.nan)
+        stable = np.linalg.cond(K) < 1e12
+        if stable.any():
+            u = np.linalg.solve(K[stable], np.broadcast_to(F, (stable.sum(), 2))[..., None])[..., 0]
+            deflection[stable] = u[:, 0]
+            rotation[stable] = u[:, 1]
+        lengths = self.x[1:]
+        reference = deflection[-1]
+        if np.isnan(reference):
+            raise ValueError(
+                "Longueur critique : la rigidité en tête du pieu complet est mal conditionnée (ressorts de sol nuls ?)"
+            )
+        outside = ~(np.abs(deflection - reference) <= tol * abs(reference))
+        last_outside = np.nonzero(outside)[0]
+        critical = lengths[min(last_outside[-1] + 1, len(lengths) - 1)] if len(last_outside) else lengths[0]
+        return CriticalLength(lengths, deflection, rotation, float(critical), tol)
+
+    def results(self, u: np.ndarray, soil_reaction: np.ndarray|None=None) -> TransverseResult:
+        """
+        Efforts internes déduits des efforts d'extrémité des éléments (f = k_e u_e).
+        """
+        return TransverseResult(self.z.copy(), *self._nodal_fields(u, soil_reaction))
+
+    def _nodal_fields(self, u: np.ndarray, soil_reaction: np.ndarray|None=None) -> tuple[np.ndarray, ...]:
+        """
+        Champs nodaux (déplacement, rotation, moment, effort tranchant, réaction) pour un vecteur u (n_dof,)
+        ou une pile de vecteurs (n_cas, n_dof).
+        """
+        v = u[..., 0::2]
+        theta = u[..., 1::2]
+        u_e = np.stack([v[..., :-1], theta[..., :-1], v[..., 1:], theta[..., 1:]], axis=-1)
+        f = np.einsum("eij,...ej->...ei", self.element_matrices(), u_e)
+        moment = np.concatenate([f[..., 1], -f[..., -1:, 3]], axis=-1)
+        shear = np.concatenate([f[..., 0], -f[..., -1:, 2]], axis=-1)
+        if soil_reaction is None:
+            soil_reaction = self.springs * v
+        return v, theta, moment, shear, soil_reaction
@@ -1,7 +1,10 @@
+import bisect
 import math
 import numpy as np
 from PyNite import FEModel3D
 
+from geotech_module.transverse import TransverseModel, TransverseResult
+
 
 def max_list(list_of_float: list[float]) -> float:
     """
@@ -64,6 +67,70 @@ def mean_value(cb_x: list[float], cb_y: list[float], x1: float, x2: float) -> fl
     return trapezoidal_integration(cb_x, cb_y, x1, x2) / abs(x2 - x1)
 
 
+class PrefixIntegral:
+    """
+    Primitive d'une courbe linéaire par morceaux (points éventuellement confondus en abscisse pour les sauts),
+    calculée une seule fois aux points de la courbe : l'intégrale et la valeur moyenne entre deux abscisses
+    quelconques s'en déduisent en O(log n), pour des tableaux d'abscisses.
+    En dehors de la courbe, les valeurs extrêmes sont prolongées (comme trapezoidal_integration).
+    """
+
+    def __init__(self, cb_x: list[float], cb_y: list[float]):
+        x = np.asarray(cb_x, dtype=float)
+        y = np.asarray(cb_y, dtype=float)
+        if len(x) > 1 and x[0] > x[-1]:
+            x, y = x[::-1], y[::-1]
+        self.x = x
+        self.y = y
+        self.F = np.concatenate([[0.], np.cumsum(np.diff(x) * (y[1:] + y[:-1]) / 2)])
+        # Copies en flottants Python pour les requêtes scalaires (évite le coût des petits tableaux numpy)
+        self._points = (x.tolist(), y.tolist(), self.F.tolist())
+
+    def _primitive_scalar(self, x: float) -> float:
+        xs, ys, F = self._points
+        if x <= xs[0]:
+            return (x - xs[0]) * ys[0]
+        if x >= xs[-1]:
+            return F[-1] + (x - xs[-1]) * ys[-1]
+        k = bisect.bisect_right(xs, x) - 1
+        h = xs[k + 1] - xs[k]
+        t = x - xs[k]
+        slope = (ys[k + 1] - ys[k]) / h if h > 0 else 0.
+        return F[k] + ys[k] * t + slope * t**2 / 2
+
+    def primitive(self, x: np.ndarray) -> np.ndarray:
+        if np.ndim(x) == 0:
+            return self._primitive_scalar(float(x))
+        x = np.asarray(x, dtype=float)
+        if len(self.x) == 1:
+            return (x - self.x[0]) * self.y[0]
+        k = np.clip(np.searchsorted(self.x, x, side='right') - 1, 0, len(self.x) - 2)
+        h = self.x[k + 1] - self.x[k]
+        t = np.clip(x - self.x[k], 0., None)
+        slope = np.divide(self.y[k + 1] - self.y[k], h, out=np.zeros_like(t), where=h > 0)
+        inside = self.F[k] + self.y[k] * t + slope * t**2 / 2
+        below = (x - self.x[0]) * self.y[0]
+        above = self.F[-1] + (x - self.x[-1]) * self.y[-1]
+        return np.where(x < self.x[0], below, np.where(x > self.x[-1], above, inside))
+
+    def integral(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+        """
+        Intégrale de la courbe de x1 à x2 (de signe opposé si les bornes sont inversées).
+        """
+        return self.primitive(x2) - self.primitive(x1)
+
+    def mean(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+        """
+        Valeur moyenne de la courbe entre x1 et x2, quel que soit l'ordre des bornes
+        (nan pour un intervalle de longueur nulle, comme mean_value).
+        """
+        if np.ndim(x1) == 0 and np.ndim(x2) == 0:
+            if x1 == x2:
+                return math.nan
+            return self.integral(x1, x2) / (x2 - x1)
+        return self.integral(x1, x2) / np.subtract(x2, x1, dtype=float)
+
+
 def rising_curve(cb_x: list[float]) -> bool:
     """
     Vérifie que la liste de nombres est croissante.
@@ -246,38 +313,37 @@ def build_pile(
     return pile_model
 
 
-def get_model_curves(fem_model: FEModel3D, top_level: float=0, step: float=0.01) -> list[list[float]]:
-    """
-    Returns the curves data for the bending moment, the shear forces and the deflection along the pile.
-    """
-    height_pile = model_length(fem_model)
-    moment = []
-    shear = []
-    deflection = []
-    abscisse = []
-    x = 0
-    z = top_level
-    while z >= top_level - height_pile:
-        mx = fem_model.Members['pile'].moment('Mz', x, 'Combo 1')
-        vx = fem_model.Members['pile'].shear('Fy', x, 'Combo 1')
-        fx = fem_model.Members['pile'].deflection('dy', x, 'Combo 1')
-        moment.append(mx)
-        shear.append(vx)
-        deflection.append(fx)
-        abscisse.append(z)
-        x += step
-        z -= step
-    return abscisse, moment, shear, deflection
-
-def get_soil_pressure(fem_model: FEModel3D) -> list[list[float]]:
-    """
-    Returns the pressure on the soil along the pile axis
-    """
-    pression = []
-    abscisse_p = []
-    for node in fem_model.Nodes:
-        pression.append(fem_model.Nodes[str(node)].RxnFY)
-    return abscisse_p, pression
+def get_model_curves(
+        fem_model: FEModel3D, *, stations: np.ndarray|None=None, combo: str='Combo 1'
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the curves data (levels, bending moment, shear forces, deflection) along the pile, as NumPy arrays,
+    at the nodes of the model or at the requested levels (stations).
+    """
+    return get_model_results(fem_model, combo).curves(stations)
+
+def get_soil_pressure(fem_model: FEModel3D, combo: str='Combo 1') -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the levels of the nodes and the pressure on the soil (spring reactions) along the pile axis.
+    """
+    return get_model_results(fem_model, combo).soil_pressure()
+
+def get_model_results(fem_model: FEModel3D, combo: str='Combo 1') -> TransverseResult:
+    """
+    Returns the results of the pile model at its nodes, with the conventions of the banded solver
+    (rotation = dv/dx, x being the depth below the pile head; shear just below each node).
+    The internal forces are derived from the nodal displacements (one pass over the nodes, no member query).
+    """
+    member = fem_model.Members['pile']
+    nodes = sorted(fem_model.Nodes.values(), key=lambda node: -node.X)
+    z = np.array([node.X for node in nodes])
+    u = np.empty(2 * len(nodes))
+    u[0::2] = [node.DY[combo] for node in nodes]
+    u[1::2] = [-node.RZ[combo] for node in nodes]
+    reaction = np.array([node.RxnFY[combo] for node in nodes])
+    beam = TransverseModel(z, member.E * member.Iz, np.zeros(len(nodes)))
+    return beam.results(u, reaction)
+
 
 def model_length(fem_model: FEModel3D) -> float:
     """
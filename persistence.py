@@ -16,11 +16,18 @@ APP_STATE_KEYS = [
     # Toggles / actions
     "tog_tass",
     "tog_equ", "q_target",
+    "tog_conv", "conv_q", "conv_tol",
 
     # Transversal
     "trans_Eb", "trans_largeur", "trans_inertia", "trans_force",
-    "trans_bending", "trans_situation",
-    "tog_transversal",
+    "trans_bending", "trans_situation", "trans_backend", "trans_nonlinear",
+    "tog_transversal", "tog_trans_situations", "tog_trans_lc",
+
+    # Pushover
+    "push_v_max", "push_steps", "push_situation", "push_depth_pl", "tog_pushover",
+
+    # Descente de charges
+    "csv_col_pile", "csv_col_nz", "csv_col_situation", "csv_col_comb", "csv_unit", "csv_decimal", "tog_csv",
 ]
 
 DEFAULTS = {
@@ -39,21 +46,49 @@ DEFAULTS = {
     "tog_tass": False,
     "tog_equ": False,
     "q_target": 1500.0,
+    "tog_conv": False,
+    "conv_q": 1500.0,
+    "conv_tol": 0.1,
 
     # Transversal
-    "trans_Eb": 10_000,
-    "trans_largeur": 1.0,
-    "trans_inertia": 1.0,
+    "trans_Eb": 0.0,
+    "trans_largeur": 0.0,
+    "trans_inertia": 0.0,
     "trans_force": 100.0,
     "trans_bending": 100.0,
     "trans_situation": "court terme",
+    "trans_backend": "banded",
+    "trans_nonlinear": False,
     "tog_transversal": False,
+    "tog_trans_situations": False,
+    "tog_trans_lc": False,
+
+    # Pushover
+    "push_v_max": 100.0,
+    "push_steps": 100,
+    "push_situation": "ELU",
+    "push_depth_pl": 1.0,
+    "tog_pushover": False,
+
+    # Descente de charges
+    "csv_col_pile": "pile",
+    "csv_col_nz": "nz",
+    "csv_col_situation": "situation",
+    "csv_col_comb": "comb",
+    "csv_unit": "kN",
+    "csv_decimal": ".",
+    "tog_csv": False,
 
     # (optionnel) UI
     "case_name": "NDC_Pieu",
 }
 APP_SIMPLE_KEYS = list(DEFAULTS.keys())
 
+SCHEMA = "pieu_app_state_v3"
+# Saisies non utilisées par le calcul avant le schéma v3 (valeurs par défaut 10 000 / 1.0 / 1.0) :
+# elles définissent désormais la section en flexion et sont ignorées à l'import d'un état plus ancien.
+LEGACY_KEYS = {"trans_Eb", "trans_largeur", "trans_inertia"}
+
 
 def export_state():
     state = {}
@@ -66,7 +101,7 @@ def export_state():
     df = st.session_state.get("soil_df", pd.DataFrame())
     state["soils"] = df.to_dict(orient="records")
 
-    state["_schema"] = "pieu_app_state_v2"
+    state["_schema"] = SCHEMA
     return state
 
 
@@ -75,8 +110,11 @@ def import_state(payload):
         raise ValueError("Champ 'soils' manquant ou invalide (attendu: liste).")
 
     # Variables simples
+    legacy = payload.get("_schema") != SCHEMA
     for k in APP_SIMPLE_KEYS:
-        if k in payload:
+        if legacy and k in LEGACY_KEYS:
+            st.session_state[k] = DEFAULTS[k]
+        elif k in payload:
             # petits casts utiles
             if k in {"pile_cat", "pile_int"}:
                 st.session_state[k] = int(payload[k])
@@ -585,7 +585,7 @@ if tog_transversal == True:
     pile_model = pieu.get_fe_model(horizontal_force, bending_moment, situation)
     pile_model.analyze_linear()
 
-    get_curves = utils.get_model_curves(pile_model, level_top)
+    get_curves = utils.get_model_curves(pile_model)
     abscisse = get_curves[0]
     moment = [m*1000 for m in get_curves[1]]
     shear = [v*1000 for v in get_curves[2]]
@@ -1,11 +1,15 @@
 import streamlit as st
 from geotech_module.pieu import Pile
+from geotech_module.geometry import PileGeometry, Section
 from ui_sections import (
     build_pile_sidebar_inputs,
     lithology_ui,
     render_settlement_section,
     render_equilibrium_section,
+    render_convergence_section,
     render_transverse_section,
+    render_pushover_section,
+    render_loads_section,
     render_pile_summary,
     render_resistance_section,
     render_header,
@@ -40,6 +44,14 @@ couches_sols, z1_sup = lithology_ui()
 persistence_ui()
 
 pile_inputs = build_pile_sidebar_inputs()
+section = Section(
+    Eb=pile_inputs["Eb"],
+    Dp=pile_inputs["pieu_dp"] / 1000,
+    Ds=pile_inputs["pieu_ds"] / 1000,
+    B=pile_inputs["largeur"],
+    Iz=pile_inputs["inertia"],
+    Eb_flexion=pile_inputs["Eb_flexion"],
+)
 pieu = Pile(
     category=pile_inputs["categorie"],
     level_top=pile_inputs["level_top"],
@@ -49,10 +61,14 @@ pieu = Pile(
     Ds=pile_inputs["pieu_ds"] / 1000,
     lithology=couches_sols,
     thickness=pile_inputs["interval"] / 1000,
+    geometry=PileGeometry.uniform(pile_inputs["level_top"], pile_inputs["level_bot"], section),
 )
 
 render_pile_summary(pieu)
 render_resistance_section(pieu)
 render_settlement_section(pieu)
 render_equilibrium_section(pieu)
-render_transverse_section(pieu, pile_inputs["level_top"])
+render_convergence_section(pieu)
+render_transverse_section(pieu)
+render_pushover_section(pieu)
+render_loads_section(pieu)
@@ -1,8 +1,11 @@
+import csv
+import io
 import math
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 
+import geotech_module.loads as loads
 import geotech_module.utils as utils
 from geotech_module.soil import Soil
 
@@ -48,6 +51,15 @@ def build_pile_sidebar_inputs():
     pieu_ds = st.sidebar.number_input(pieu_ds_msg, key="pile_ds")
     interval = st.sidebar.number_input(interval_msg, key="pile_int")
 
+    st.sidebar.caption("Section en flexion (0 : valeur déduite de Eb et des diamètres)")
+    Eb_flexion = st.sidebar.number_input("Module d'Young du pieu en flexion [MPa]", min_value=0.0, key="trans_Eb")
+    largeur = st.sidebar.number_input(
+        "Largeur perpendiculaire au sens de déplacement [m]", min_value=0.0, key="trans_largeur"
+    )
+    inertia = st.sidebar.number_input(
+        "Moment d'inertie du pieu [m4]", min_value=0.0, format="%.5f", key="trans_inertia"
+    )
+
     return {
         "level_top": level_top,
         "level_bot": level_bot,
@@ -56,6 +68,9 @@ def build_pile_sidebar_inputs():
         "pieu_dp": pieu_dp,
         "pieu_ds": pieu_ds,
         "interval": interval,
+        "Eb_flexion": Eb_flexion or None,
+        "largeur": largeur or None,
+        "inertia": inertia or None,
     }
 
 
@@ -432,13 +447,47 @@ def render_equilibrium_section(pieu):
     st.divider()
 
 
-def render_transverse_section(pieu, level_top):
+def render_convergence_section(pieu):
+    st.subheader("Convergence du maillage (extrapolation de Richardson)")
+
+    tog_conv = st.toggle("Lancer l'étude de convergence", key="tog_conv")
+    if not tog_conv:
+        st.divider()
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        q_conv = st.number_input("Charge verticale en tête de pieu [kN] :", key="conv_q")
+    with col2:
+        tol_conv = st.number_input("Tolérance relative [%] :", min_value=0.001, key="conv_tol")
+
+    etude = pieu.convergence_study(q_conv / 1000, tol=tol_conv / 100)
+
+    st.dataframe(pd.DataFrame(etude.to_records()), use_container_width=True, hide_index=True)
+
+    if etude.recommended is None:
+        recommended = "aucune maille étudiée ne respecte la tolérance"
+    else:
+        recommended = f"{1000 * etude.recommended: .0f} mm"
+
+    st.markdown(
+        f"""
+    | Extrapolation à maille nulle                 |                  |                                              |
+    |:---                                          |---:              |---:                                          |
+    | Déplacement vertical en tête de pieu :       | $dz_{{top}}$ =   | {1000 * etude.w_head_extrapolated: .3f} mm   |
+    | Effort de pointe :                           | $Q_{{bot}}$ =    | {1000 * etude.Q_tip_extrapolated: .1f} kN    |
+    | Ordre de convergence :                       | $p$ =            | {etude.order: .2f}                           |
+    | Maille recommandée :                         | $\\Delta h$ =     | {recommended}                                |
+    """
+    )
+
+    st.divider()
+
+
+def render_transverse_section(pieu):
     st.subheader("Comportement transversal de la fondation  ⚠️ En cours !")
 
     with st.expander("Données :"):
-        _Eb_trans = st.number_input("Module d'Young du pieu [MPa] :", key="trans_Eb")
-        _largeur = st.number_input("Largeur perpendiculaire au sens de déplacement [m] :", key="trans_largeur")
-        _inertia = st.number_input("Moment d'inertie du pieu [m4] :", key="trans_inertia")
         force = st.number_input("Force horizontale en tête de pieu [kN] :", key="trans_force")
         bending = st.number_input("Moment fléchissant en tête de pieu [kN.m] :", key="trans_bending")
         comb_situation = st.selectbox(
@@ -446,6 +495,13 @@ def render_transverse_section(pieu, level_top):
             ["court terme", "long terme", "ELU", "sismique"],
             key="trans_situation",
         )
+        backend = st.selectbox(
+            "Moteur de calcul :",
+            ["banded", "pynite"],
+            format_func=lambda b: {"banded": "Poutre sur ressorts (bande)", "pynite": "PyNite (contrôle)"}[b],
+            key="trans_backend",
+        )
+        nonlinear = st.checkbox("Lois p-y non linéaires (poutre sur ressorts uniquement)", key="trans_nonlinear")
 
     tog_transversal = st.toggle("Lancer le calcul", key="tog_transversal")
     if not tog_transversal:
@@ -455,13 +511,22 @@ def render_transverse_section(pieu, level_top):
     horizontal_force = force / 1000
     bending_moment = bending / 1000
 
-    pile_model = pieu.get_fe_model(horizontal_force, bending_moment, situation)
-    pile_model.analyze_linear()
+    if nonlinear:
+        try:
+            resultats, report = pieu.transverse_analysis_nonlinear(horizontal_force, bending_moment, situation)
+        except ValueError as e:
+            st.error(str(e))
+            return
+        st.caption(f"Calcul non linéaire ({report})")
+        if not report.converged:
+            st.warning("Le calcul non linéaire n'a pas convergé.")
+    else:
+        resultats = pieu.transverse_analysis(horizontal_force, bending_moment, situation, backend=backend)
 
-    abscisse, moment_raw, shear_raw, deflection_raw = utils.get_model_curves(pile_model, level_top)
-    moment = [m * 1000 for m in moment_raw]
-    shear = [v * 1000 for v in shear_raw]
-    deflection = [d * 1000 for d in deflection_raw]
+    abscisse = resultats.z.tolist()
+    moment = (1000 * resultats.moment).tolist()
+    shear = (1000 * resultats.shear).tolist()
+    deflection = (1000 * resultats.deflection).tolist()
 
     z_top = utils.max_list(abscisse)
     z_bott = utils.min_list(abscisse)
@@ -529,6 +594,115 @@ def render_transverse_section(pieu, level_top):
         fig3.layout.title.text = "Déplacement horizontal"
         st.plotly_chart(fig3, use_container_width=True)
 
+    if st.toggle("Longueur critique", key="tog_trans_lc"):
+        longueurs = pieu.longueur_critique(horizontal_force, bending_moment)
+        st.markdown(
+            "| Situation | Longueur critique | Déplacement en tête (pieu complet) |\n"
+            "|:---|---:|---:|\n"
+            + "\n".join(
+                f"| {sit} | {lc.critical_length:.2f} m | {1000 * lc.head_deflection[-1]:.2f} mm |"
+                for sit, lc in longueurs.items()
+            )
+        )
+
+    if not st.toggle("Comparer les situations", key="tog_trans_situations"):
+        return
+
+    par_situation = pieu.transverse_analysis_situations(horizontal_force, bending_moment)
+    colors = {"court terme": "teal", "long terme": "darkorange", "elu": "crimson", "sismique": "slateblue"}
+    col4, col5 = st.columns(2)
+    for col, grandeur, titre, unite in [
+        (col4, "moment", "Moment fléchissant", "kN.m"),
+        (col5, "deflection", "Déplacement horizontal", "mm"),
+    ]:
+        with col:
+            fig = go.Figure()
+            for sit, res in par_situation.items():
+                fig.add_trace(go.Scatter(
+                    x=1000 * getattr(res, grandeur)[0], y=res.z,
+                    line={"color": colors[sit], "width": 2},
+                    name=f"{sit} [{unite}]"
+                ))
+            fig.layout.title.text = f"{titre} par situation"
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def render_pushover_section(pieu):
+    st.subheader("Courbe de poussée progressive (pushover)")
+
+    with st.expander("Données :"):
+        v_max = st.number_input("Déplacement maximal en tête [mm] :", min_value=1.0, key="push_v_max")
+        n_steps = int(st.number_input("Nombre de pas :", min_value=2, step=1, key="push_steps"))
+        situation = st.selectbox("Situation :", ["ELU", "sismique", "court terme", "long terme"], key="push_situation")
+        depth_pl = st.number_input("Hauteur plastifiée (réaction = pl) [m] :", min_value=0.0, key="push_depth_pl")
+
+    if not st.toggle("Lancer le calcul", key="tog_pushover"):
+        return
+
+    curve = pieu.pushover(v_max / 1000, n_steps, str(situation))
+    if not curve.converged:
+        st.warning("Certains pas n'ont pas convergé.")
+    load_pl = curve.load_at_plastic_depth(depth_pl)
+    if load_pl is None:
+        st.write(f"La réaction n'atteint pas pl sur {depth_pl:.2f} m dans la plage de déplacement étudiée.")
+    else:
+        st.write(f"Réaction égale à pl sur {depth_pl:.2f} m pour H = {1000 * load_pl:.1f} kN")
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=1000 * curve.head_deflection, y=1000 * curve.head_load,
+        line={"color": "teal", "width": 2},
+        name="H [kN]"
+    ))
+    fig.update_xaxes(title_text="Déplacement en tête [mm]")
+    fig.update_yaxes(title_text="Effort horizontal en tête [kN]")
+    fig.layout.title.text = "Courbe effort - déplacement en tête"
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.divider()
+
+
+def render_loads_section(pieu):
+    st.subheader("Vérification d'une descente de charges (import CSV)")
+
+    with st.expander("Données :"):
+        up = st.file_uploader("Export des réactions (.csv)", type=["csv", "txt"], key="csv_file")
+        col1, col2 = st.columns(2)
+        with col1:
+            col_pile = st.text_input("Colonne du repère :", key="csv_col_pile")
+            col_nz = st.text_input("Colonne de l'effort normal (compression > 0) :", key="csv_col_nz")
+            unit = st.selectbox("Unité des efforts :", ["kN", "MN"], key="csv_unit")
+        with col2:
+            col_situation = st.text_input("Colonne de la situation :", key="csv_col_situation")
+            col_comb = st.text_input("Colonne de la combinaison :", key="csv_col_comb")
+            decimal = st.selectbox("Séparateur décimal :", [".", ","], key="csv_decimal")
+
+    if up is None or not st.toggle("Lancer la vérification", key="tog_csv"):
+        return
+
+    columns = {"pile": col_pile, "nz": col_nz, "situation": col_situation, "comb": col_comb}
+    try:
+        governing = loads.governing_from_csv(
+            io.TextIOWrapper(io.BytesIO(up.getvalue()), encoding="utf-8-sig", newline=""),
+            pieu,
+            columns=columns,
+            scale=1e-3 if unit == "kN" else 1.0,
+            decimal=decimal,
+        )
+    except (ValueError, KeyError, csv.Error) as e:
+        st.error(f"Fichier invalide : {e}")
+        return
+
+    df = pd.DataFrame(
+        [(name, row + 1, comb, ratio) for name, (row, ratio, comb) in governing.items()],
+        columns=["Repère", "Ligne", "Combinaison", "Taux de travail"],
+    )
+    st.dataframe(df, use_container_width=True, hide_index=True)
+    if (df["Taux de travail"] > 1).any():
+        st.warning("Résistance axiale dépassée pour certains repères.")
+
+    st.divider()
+
 
 def render_pile_summary(pieu):
     colA, colB, colC = st.columns(3)